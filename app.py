@@ -1,420 +1,690 @@
 import streamlit as st
-import plotly.graph_objects as go
 import numpy as np
-import string
+import collections
+import os
+import uuid
+
+from reflexiones import (
+    VERTEX_FILE_FORMATS,
+    FigureCache,
+    NULL_PROFILE,
+    PROFILE_LOG_ENV,
+    THEORY_MARKDOWN,
+    RerunProfile,
+    Scene,
+    VertexStore,
+    detect_symmetries,
+    explanation_markdown,
+    find_self_intersection,
+    figure_cache_key,
+    load_vertices,
+    polygon_metrics,
+    reflect_points,
+    symmetry_label,
+    union_bounds,
+    vertex_label,
+    vertices_to_bytes,
+)
+
+# Etiquetas del selectbox -> clave interna usada por reflect_point / reflect_points
+REFLECTION_LABELS = {
+    'Reflexión sobre el Eje X': 'eje_x',
+    'Reflexión sobre el Eje Y': 'eje_y',
+    'Reflexión sobre el Origen': 'origen',
+    'Reflexión sobre la línea y = x': 'y_igual_x',
+    'Reflexión sobre la línea y = -x': 'y_igual_menos_x',
+    'Reflexión sobre una línea horizontal (y = k)': 'linea_horizontal',
+    'Reflexión sobre una línea vertical (x = h)': 'linea_vertical',
+    'Reflexión sobre una línea general (ax + by + c = 0)': 'linea_general',
+}
+
+
+# --- Caché de figuras compartida entre sesiones ---
+@st.cache_resource
+def get_figure_cache():
+    """Instancia única de FigureCache para todo el proceso, compartida por todas las sesiones."""
+    return FigureCache()
+
+
+# Los resultados de los análisis (medidas, cruces y simetrías) van en una caché aparte: no ocupan
+# entradas de la de figuras ni se mezclan con sus contadores, que sirven para dimensionarla
+ANALYSIS_CACHE_MAX_ENTRIES = 512
+ANALYSIS_CACHE_MAX_MB = 64
+
+
+@st.cache_resource
+def get_analysis_cache():
+    """Instancia única de FigureCache para los resultados de los análisis, compartida por todas las sesiones."""
+    return FigureCache(max_entries=ANALYSIS_CACHE_MAX_ENTRIES, max_bytes=ANALYSIS_CACHE_MAX_MB * 1024 * 1024)
+
+
+# --- Edición de vértices ---
+# Hasta este número de vértices se muestra un par de campos por vértice; por encima, una tabla
+SMALL_FIGURE_MAX_VERTICES = 20
+
+
+def reset_vertex_grid():
+    """Descarta la copia de la tabla de edición para que la próxima ejecución la reconstruya con los vértices actuales."""
+    st.session_state.pop('vertex_grid_base', None)
+    st.session_state.vertex_grid_version = st.session_state.get('vertex_grid_version', 0) + 1
+
+
+def grid_has_edits(key):
+    """Si el editor de la tabla `key` guarda algún cambio: celdas editadas, filas añadidas o filas borradas."""
+    state = st.session_state.get(key) or {}
+    return any(state.get(name) for name in ('edited_rows', 'added_rows', 'deleted_rows'))
+
+
+def set_vertices(coords):
+    """
+    Reemplaza los vértices de la sesión y reinicia la tabla de edición para que muestre los nuevos datos.
+    """
+    if 'points' in st.session_state:
+        st.session_state.points.replace(coords)
+    else:
+        st.session_state.points = VertexStore(coords)
+    reset_vertex_grid()
+
+
+def add_vertex():
+    """Callback del botón "Añadir Vértice": añade el vértice (0, 0) al final."""
+    st.session_state.points.append(0.0, 0.0)
+    reset_vertex_grid()
+
+
+def remove_vertex(index):
+    """Callback de los botones "X": elimina un vértice, siempre que no sea el último que queda."""
+    if len(st.session_state.points) > 1: # No permitir eliminar si solo queda un punto
+        st.session_state.points.remove(index)
+        reset_vertex_grid()
+    else:
+        st.session_state.vertex_warning = "Debe haber al menos un vértice."
+
+
+def import_vertices():
+    """Callback del cargador de archivos: reemplaza los vértices por los del archivo subido."""
+    uploaded_file = st.session_state.vertex_upload
+    if uploaded_file is None:
+        return
+    try:
+        set_vertices(load_vertices(uploaded_file, uploaded_file.name))
+    except ValueError as error:
+        st.session_state.vertex_import_error = f"No se pudo importar el archivo: {error}"
+
 
-# --- Función para la reflexión de puntos ---
-def reflect_point(x, y, reflection_type, custom_value=0):
+def vertex_export_key(file_format):
+    """Identifica una descarga preparada: contenido de los vértices actuales y formato."""
+    return figure_cache_key(st.session_state.points.coords, 'exportar', file_format, False)
+
+
+def prepare_vertex_export():
+    """Callback de "Preparar descarga": serializa los vértices una sola vez en el formato elegido."""
+    file_format = st.session_state.vertex_export_format
+    st.session_state.vertex_export = (vertex_export_key(file_format),
+                                      vertices_to_bytes(st.session_state.points.coords, file_format))
+
+
+# --- Selección de la reflexión ---
+def reflection_inputs(suffix):
     """
-    Refleja un punto (x, y) según el tipo de reflexión especificada.
+    Selector del tipo de reflexión y, si hace falta, los campos de k, h o (a, b, c).
 
     Args:
-        x (float): Coordenada x del punto original.
-        y (float): Coordenada y del punto original.
-        reflection_type (str): Tipo de reflexión ('eje_x', 'eje_y', 'origen', 'y_igual_x', 'y_igual_menos_x', 'linea_horizontal', 'linea_vertical').
-        custom_value (float, optional): Valor para reflexiones sobre líneas personalizadas (k para y=k, h para x=h).
+        suffix (str): Sufijo de las claves de los widgets, para poder usarlo en varias secciones.
 
     Returns:
-        tuple: Coordenadas (x_reflejado, y_reflejado) del punto reflejado.
+        tuple: (kind, value) con la clave interna de la reflexión y su valor.
     """
-    if reflection_type == 'eje_x':
-        return x, -y
-    elif reflection_type == 'eje_y':
-        return -x, y
-    elif reflection_type == 'origen':
-        return -x, -y
-    elif reflection_type == 'y_igual_x':
-        return y, x
-    elif reflection_type == 'y_igual_menos_x':
-        return -y, -x
-    elif reflection_type == 'linea_horizontal':  # y = k
-        return x, 2 * custom_value - y
-    elif reflection_type == 'linea_vertical':  # x = h
-        return 2 * custom_value - x, y
-    else:
-        return x, y  # No reflection
+    reflection_type = st.selectbox(
+        "Tipo de Reflexión",
+        tuple(REFLECTION_LABELS),
+        key=f"reflection_type_{suffix}_page"
+    )
+    kind = REFLECTION_LABELS[reflection_type]
+
+    custom_line_value = 0.0
+    if 'línea horizontal' in reflection_type:
+        custom_line_value = st.number_input("Valor de k (para y = k)", value=0.0, step=0.1, key=f"custom_k_{suffix}")
+    elif 'línea vertical' in reflection_type:
+        custom_line_value = st.number_input("Valor de h (para x = h)", value=0.0, step=0.1, key=f"custom_h_{suffix}")
+    elif 'línea general' in reflection_type:
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            line_a = st.number_input("a", value=1.0, step=0.1, key=f"custom_a_{suffix}")
+        with col_b:
+            line_b = st.number_input("b", value=-1.0, step=0.1, key=f"custom_b_{suffix}")
+        with col_c:
+            line_c = st.number_input("c", value=0.0, step=0.1, key=f"custom_c_{suffix}")
+        if line_a == 0 and line_b == 0:
+            st.warning("Los coeficientes a y b no pueden ser ambos cero. Se usará la recta x = 0.")
+            line_a, line_c = 1.0, 0.0
+        custom_line_value = (line_a, line_b, line_c)
+    return kind, custom_line_value
+
+
+# --- Análisis de la figura ---
+# Entradas pequeñas en la caché de análisis (unas pocas cifras por figura)
+ANALYTICS_CACHE_BYTES = 1_024
+
+# Por encima de estos vértices, la búsqueda de cruces entre lados se hace solo a petición
+MAX_AUTO_CROSSING_VERTICES = 5_000
+
+
+def winding_change_caption(original, reflected):
+    """Frase que compara el área y el sentido de recorrido de la figura original y la reflejada."""
+    if original['winding'] == 'sin área':
+        return "La figura no encierra área, así que no tiene sentido de recorrido."
+    if original['winding'] != reflected['winding']:
+        return "El área y el perímetro se conservan y el sentido de recorrido se invierte: la reflexión cambia la orientación."
+    return "El área, el perímetro y el sentido de recorrido se conservan: la simetría central equivale a un giro de 180°."
+
+
+def analytics_panel(points, kind, value, profile=NULL_PROFILE):
+    """
+    Área con signo, perímetro y sentido de recorrido de la figura original y de la reflejada,
+    y si los lados de la figura se cortan entre sí. Los resultados se guardan en la caché de análisis.
+    """
+    st.subheader("Análisis de la figura")
+    cache = get_analysis_cache()
+    with profile.span('analisis'):
+        metrics = cache.get_or_build(
+            ('analisis',) + figure_cache_key(points, kind, value, False),
+            lambda: (polygon_metrics(points), polygon_metrics(reflect_points(points, kind, value))),
+            size_of=lambda _: ANALYTICS_CACHE_BYTES,
+        )
 
-# --- Página de la Aplicación Principal ---
-def app_page():
-    st.markdown("<h1 style='text-align: center;'>Reflexiones de Figuras en el Plano Cartesiano</h1>", unsafe_allow_html=True)
+    for column, title, figure_metrics in zip(st.columns(2), ("Figura original", "Figura reflejada"), metrics):
+        with column:
+            st.markdown(f"**{title}**")
+            st.metric("Área con signo", f"{figure_metrics['signed_area']:.6g}")
+            st.metric("Perímetro", f"{figure_metrics['perimeter']:.6g}")
+            st.metric("Sentido de recorrido", figure_metrics['winding'].capitalize())
+    st.caption(winding_change_caption(*metrics))
+
+    # En figuras grandes el barrido tarda (≈1,7 s con 10⁵ vértices) y cada edición cambia la clave
+    # de la caché, así que solo se hace a petición
+    if len(points) > MAX_AUTO_CROSSING_VERTICES and not st.toggle(
+            "Comprobar si los lados se cortan", key="crossing_check",
+            help=f"Con más de {MAX_AUTO_CROSSING_VERTICES} vértices la comprobación no se hace automáticamente."):
+        return
+
+    with profile.span('autointerseccion'):
+        # Los cruces no dependen de la reflexión (es una isometría), así que se guardan solo por vértices
+        crossing = cache.get_or_build(
+            ('autointerseccion',) + figure_cache_key(points, None, None, False),
+            lambda: find_self_intersection(points),
+            size_of=lambda _: ANALYTICS_CACHE_BYTES,
+        )
 
-    st.markdown("""
-    Esta aplicación te permite introducir puntos en el plano cartesiano, conectarlos para formar una figura
-    y observar cómo esta figura se refleja según diferentes ejes o líneas.
-    """)
+    if crossing is None:
+        st.caption("Los lados no se cortan entre sí: el polígono es simple.")
+    else:
+        first, second = crossing
+        st.warning(f"Los lados que empiezan en los vértices {vertex_label(first)} y {vertex_label(second)} se cortan: "
+                   "el polígono se cruza consigo mismo y su área con signo mezcla zonas recorridas en sentidos opuestos.")
 
-    # Inicializar el estado de la sesión para los puntos si no existe
-    if 'points' not in st.session_state:
-        st.session_state.points = [{'x': 1.0, 'y': 1.0}, {'x': 3.0, 'y': 1.0}, {'x': 2.0, 'y': 3.0}] # Ejemplo de triángulo inicial
-        # Aseguramos que haya al menos un punto inicial si se borran todos y se vuelve a cargar la app
-        if not st.session_state.points:
-            st.session_state.points.append({'x': 0.0, 'y': 0.0})
 
-    # Definir dos columnas para la interfaz principal: una para inputs y otra para el gráfico
-    col_inputs, col_graph = st.columns([1, 2]) # 1 para inputs (más estrecho), 2 para el gráfico (más ancho)
+# --- Simetría ---
+# Filas que se muestran como máximo en la tabla de correspondencia de vértices
+MAX_SYMMETRY_ROWS = 1_000
 
-    with col_inputs:
-        st.header("Entrada de Vértices y Opciones")
 
-        st.markdown("### Introduce los vértices de tu figura (x, y)")
-        st.info("Para dibujar una figura cerrada, asegura que el último punto sea el mismo que el primero. Puedes borrar vértices con el botón 'X'.")
+def symmetry_bytes(results):
+    """Memoria aproximada de un resultado de detect_symmetries, para la caché de análisis."""
+    return sum(result['mapping'].nbytes for result in results) + 4_096
 
-        alphabet_letters = list(string.ascii_uppercase)
 
-        # Mostrar inputs para cada punto en st.session_state.points
-        # Ahora con un botón para eliminar cada punto
-        points_to_remove = [] # Lista para guardar los índices de los puntos a eliminar
+def symmetry_panel(points, kind, value, profile=NULL_PROFILE):
+    """
+    Indica si la figura es simétrica respecto a la reflexión elegida, qué vértice cae sobre cuál y,
+    a petición, todos los ejes de simetría encontrados entre los candidatos.
 
-        for i, point in enumerate(st.session_state.points):
-            if i < len(alphabet_letters):
-                label_prefix = f"Vértice {alphabet_letters[i]}"
-            else:
-                label_prefix = f"Vértice {i+1}"
-
-            # Usamos columnas para alinear x, y y el botón de cerrar
-            col_x_input, col_y_input, col_close_button = st.columns([0.4, 0.4, 0.2]) # Ajusta las proporciones
-            with col_x_input:
-                st.session_state.points[i]['x'] = st.number_input(f"{label_prefix} (x)", value=point['x'], key=f"x_{i}")
-            with col_y_input:
-                st.session_state.points[i]['y'] = st.number_input(f"{label_prefix} (y)", value=point['y'], key=f"y_{i}")
-            with col_close_button:
-                # El botón de eliminar se coloca al lado, ligeramente alineado
-                # Usamos un espacio en blanco arriba para alinearlo verticalmente
-                st.write("") # Pequeño hack para centrar verticalmente el botón
-                if st.button("X", key=f"remove_point_{i}"):
-                    if len(st.session_state.points) > 1: # No permitir eliminar si solo queda un punto
-                        points_to_remove.append(i)
-                    else:
-                        st.warning("Debe haber al menos un vértice.")
-
-
-        # Procesar los puntos a eliminar después de iterar para evitar problemas de índices
-        if points_to_remove:
-            # Eliminar los puntos en orden inverso para no afectar los índices de los elementos restantes
-            for index_to_remove in sorted(points_to_remove, reverse=True):
-                del st.session_state.points[index_to_remove]
-            st.rerun() # Fuerza una nueva ejecución para actualizar la UI
-
-        # Botón para añadir más puntos
-        if st.button("Añadir Vértice"):
-            st.session_state.points.append({'x': 0.0, 'y': 0.0})
-            st.rerun() # Fuerza una nueva ejecución para mostrar el nuevo input
-
-        st.markdown("### Selecciona el tipo de reflexión")
-        reflection_type = st.selectbox(
-            "Tipo de Reflexión",
-            (
-                'Reflexión sobre el Eje X',
-                'Reflexión sobre el Eje Y',
-                'Reflexión sobre el Origen',
-                'Reflexión sobre la línea y = x',
-                'Reflexión sobre la línea y = -x',
-                'Reflexión sobre una línea horizontal (y = k)',
-                'Reflexión sobre una línea vertical (x = h)'
-            ),
-            key="reflection_type_main_page"
+    Los resultados se guardan en la caché de análisis, con la misma huella de los vértices que las figuras.
+    """
+    st.subheader("Simetría")
+    cache = get_analysis_cache()
+    with profile.span('simetria'):
+        result = cache.get_or_build(
+            ('simetria',) + figure_cache_key(points, kind, value, False),
+            lambda: detect_symmetries(points, [(kind, value)]),
+            size_of=symmetry_bytes,
+        )[0]
+    mapping = result['mapping']
+    n_vertices = len(mapping)
+    label = symmetry_label(kind, value)
+
+    if result['polygon_invariant']:
+        st.success(f"**{label}**: la figura es simétrica, al reflejarla coincide consigo misma.")
+    elif result['invariant']:
+        st.info(f"**{label}**: los vértices son simétricos, pero unidos en este orden forman otra figura.")
+    else:
+        st.warning(f"**{label}**: la figura no es simétrica. "
+                   f"{result['matched']} de {n_vertices} vértices caen sobre un vértice de la figura.")
+
+    # Un interruptor y no un desplegable: el contenido de un desplegable cerrado también se ejecuta,
+    # y la tabla obligaría a importar pandas y pyarrow en la primera carga de la página
+    if st.toggle("Ver correspondencia de vértices", key="symmetry_mapping"):
+        rows = min(n_vertices, MAX_SYMMETRY_ROWS)
+        st.dataframe(
+            {
+                'Vértice': [vertex_label(i) for i in range(rows)],
+                'Su reflejo cae sobre': [vertex_label(j) if j >= 0 else '—' for j in mapping[:rows].tolist()],
+            },
+            hide_index=True,
+            use_container_width=True,
         )
-
-        custom_line_value = 0.0
-        if 'línea horizontal' in reflection_type:
-            custom_line_value = st.number_input("Valor de k (para y = k)", value=0.0, step=0.1, key="custom_k_main")
-        elif 'línea vertical' in reflection_type:
-            custom_line_value = st.number_input("Valor de h (para x = h)", value=0.0, step=0.1, key="custom_h_main")
-
-
-    with col_graph:
-        st.markdown("<h2 style='text-align: center;'>Visualización de la Reflexión</h2>", unsafe_allow_html=True)
-
-        # Procesar los puntos
-        original_points_data = []
-        reflected_points_data = []
-        x_coords_orig = []
-        y_coords_orig = []
-        x_coords_reflected = []
-        y_coords_reflected = []
-        point_labels = []
-
-        # Asegúrate de que haya al menos un punto para evitar errores si la lista está vacía
-        if st.session_state.points:
-            for i, point in enumerate(st.session_state.points):
-                x = point['x']
-                y = point['y']
-                original_points_data.append((x, y))
-                x_coords_orig.append(x)
-                y_coords_orig.append(y)
-
-                reflection_func_type = ''
-                if reflection_type == 'Reflexión sobre el Eje X':
-                    reflection_func_type = 'eje_x'
-                elif reflection_type == 'Reflexión sobre el Eje Y':
-                    reflection_func_type = 'eje_y'
-                elif reflection_type == 'Reflexión sobre el Origen':
-                    reflection_func_type = 'origen'
-                elif reflection_type == 'Reflexión sobre la línea y = x':
-                    reflection_func_type = 'y_igual_x'
-                elif reflection_type == 'Reflexión sobre la línea y = -x':
-                    reflection_func_type = 'y_igual_menos_x'
-                elif 'línea horizontal' in reflection_type:
-                    reflection_func_type = 'linea_horizontal'
-                elif 'línea vertical' in reflection_type:
-                    reflection_func_type = 'linea_vertical'
-
-                rx, ry = reflect_point(x, y, reflection_func_type, custom_line_value)
-                reflected_points_data.append((rx, ry))
-                x_coords_reflected.append(rx)
-                y_coords_reflected.append(ry)
-
-                if i < len(alphabet_letters):
-                    point_labels.append(alphabet_letters[i])
-                else:
-                    point_labels.append(str(i+1))
-
-        # El gráfico solo se dibuja si hay al menos un punto
-        if original_points_data:
-            # Si la figura debe ser cerrada, duplicamos el primer punto al final
-            if len(original_points_data) > 1 and original_points_data[0] != original_points_data[-1]:
-                x_coords_orig.append(x_coords_orig[0])
-                y_coords_orig.append(y_coords_orig[0])
-                x_coords_reflected.append(x_coords_reflected[0])
-                y_coords_reflected.append(y_coords_reflected[0])
-
-
-            fig = go.Figure()
-
-            fig.add_trace(go.Scatter(
-                x=x_coords_orig,
-                y=y_coords_orig,
-                mode='lines+markers+text',
-                name='Figura Original',
-                line=dict(color='blue', width=2),
-                marker=dict(size=8, color='blue'),
-                text=[f'{point_labels[i]} ({p[0]}, {p[1]})' for i, p in enumerate(original_points_data)],
-                textposition="top right"
-            ))
-
-            fig.add_trace(go.Scatter(
-                x=x_coords_reflected,
-                y=y_coords_reflected,
-                mode='lines+markers+text',
-                name='Figura Reflejada',
-                line=dict(color='red', width=2, dash='dash'),
-                marker=dict(size=8, color='red'),
-                text=[f'{point_labels[i]}\' ({p[0]}, {p[1]})' for i, p in enumerate(reflected_points_data)],
-                textposition="bottom left"
-            ))
-
-            all_x = x_coords_orig + x_coords_reflected
-            all_y = y_coords_orig + y_coords_reflected
-
-            x_min_data = min(all_x) if all_x else -5
-            x_max_data = max(all_x) if all_x else 5
-            y_min_data = min(all_y) if all_y else -5
-            y_max_data = max(all_y) if all_y else 5
-
-            padding = 1.5
-            x_range = [x_min_data - padding, x_max_data + padding]
-            y_range = [y_min_data - padding, y_max_data + padding]
-
-            if reflection_type == 'Reflexión sobre el Eje X':
-                fig.add_shape(type="line", x0=x_range[0], y0=0, x1=x_range[1], y1=0,
-                              line=dict(color="green", width=2, dash="dot"), name="Eje X")
-                fig.add_annotation(x=x_range[1] * 0.9, y=0.5, text="Eje X", showarrow=False, font=dict(color="green"))
-            elif reflection_type == 'Reflexión sobre el Eje Y':
-                fig.add_shape(type="line", x0=0, y0=y_range[0], x1=0, y1=y_range[1],
-                              line=dict(color="green", width=2, dash="dot"), name="Eje Y")
-                fig.add_annotation(x=0.5, y=y_range[1] * 0.9, text="Eje Y", showarrow=False, font=dict(color="green"))
-            elif reflection_type == 'Reflexión sobre la línea y = x':
-                x_line = np.linspace(min(x_range[0], y_range[0]), max(x_range[1], y_range[1]), 100)
-                fig.add_trace(go.Scatter(x=x_line, y=x_line, mode='lines', name='y = x',
-                                         line=dict(color='green', width=2, dash='dot')))
-                fig.add_annotation(x=x_line[-1], y=x_line[-1], text="y = x", showarrow=False, font=dict(color="green"))
-            elif reflection_type == 'Reflexión sobre la línea y = -x':
-                x_line = np.linspace(min(x_range[0], y_range[0]), max(x_range[1], y_range[1]), 100)
-                fig.add_trace(go.Scatter(x=x_line, y=-x_line, mode='lines', name='y = -x',
-                                         line=dict(color='green', width=2, dash='dot')))
-                fig.add_annotation(x=x_line[0], y=-x_line[0], text="y = -x", showarrow=False, font=dict(color="green"))
-            elif 'línea horizontal' in reflection_type:
-                fig.add_shape(type="line", x0=x_range[0], y0=custom_line_value, x1=x_range[1], y1=custom_line_value,
-                              line=dict(color="green", width=2, dash="dot"), name=f"y = {custom_line_value}")
-                fig.add_annotation(x=x_range[1] * 0.9, y=custom_line_value + 0.5, text=f"y = {custom_line_value}", showarrow=False, font=dict(color="green"))
-            elif 'línea vertical' in reflection_type:
-                fig.add_shape(type="line", x0=custom_line_value, y0=y_range[0], x1=custom_line_value, y1=y_range[1],
-                              line=dict(color="green", width=2, dash="dot"), name=f"x = {custom_line_value}")
-                fig.add_annotation(x=custom_line_value + 0.5, y=y_range[1] * 0.9, text=f"x = {custom_line_value}", showarrow=False, font=dict(color="green"))
-
-            fig.update_layout(
-                title_text='Figuras Original y Reflejada con Vértices',
-                title_x=0.5,
-                xaxis_title='Eje X',
-                yaxis_title='Eje Y',
-                hovermode='closest',
-                showlegend=True,
-                xaxis=dict(
-                    zeroline=True, zerolinecolor='lightgray', zerolinewidth=1,
-                    gridcolor='lightgray', gridwidth=1,
-                    range=x_range
-                ),
-                yaxis=dict(
-                    zeroline=True, zerolinecolor='lightgray', zerolinewidth=1,
-                    gridcolor='lightgray', gridwidth=1,
-                    range=y_range
-                ),
-                template='plotly_white',
-                width=800,
-                height=600
+        if n_vertices > rows:
+            st.caption(f"Se muestran los primeros {rows} de {n_vertices} vértices.")
+
+    if st.toggle("Buscar todos los ejes de simetría", key="symmetry_scan",
+                 help="Prueba a la vez los siete tipos de reflexión y varias rectas que pasan por el centro de la figura."):
+        with profile.span('busqueda_simetrias'):
+            results = cache.get_or_build(
+                ('ejes_de_simetria',) + figure_cache_key(points, None, None, False),
+                lambda: detect_symmetries(points),
+                size_of=symmetry_bytes,
             )
-
-            st.plotly_chart(fig, use_container_width=True)
+        axes = [candidate['label'] for candidate in results if candidate['polygon_invariant']]
+        if axes:
+            st.markdown("La figura es simétrica respecto a: " + ", ".join(f"**{axis}**" for axis in axes) + ".")
         else:
-            st.info("Añade al menos dos puntos para ver la figura y su reflexión. La figura se cerrará automáticamente.")
+            st.markdown("No se encontró ningún eje de simetría entre los candidatos.")
+        st.dataframe(
+            {
+                'Eje': [candidate['label'] for candidate in results],
+                'Vértices que coinciden': [f"{candidate['matched']}/{n_vertices}" for candidate in results],
+                'Simétrica': ['Sí' if candidate['polygon_invariant'] else 'No' for candidate in results],
+            },
+            hide_index=True,
+            use_container_width=True,
+        )
 
 
-    st.markdown("---")
-    st.header("Explicación de las Reflexiones")
-
-    if reflection_type == 'Reflexión sobre el Eje X':
-        st.markdown("""
-        Al **reflejar un punto (x, y) sobre el Eje X**, la coordenada $x$ permanece igual, mientras que la coordenada $y$ cambia de signo.
-        La fórmula de transformación es: $(x, y) \\rightarrow (x, -y)$.
-        Imagina que el Eje X es un espejo; el punto reflejado estará a la misma distancia del eje, pero en el lado opuesto.
-        """)
-    elif reflection_type == 'Reflexión sobre el Eje Y':
-        st.markdown("""
-        Al **reflejar un punto (x, y) sobre el Eje Y**, la coordenada $y$ permanece igual, mientras que la coordenada $x$ cambia de signo.
-        La fórmula de transformación es: $(x, y) \\rightarrow (-x, y)$.
-        Piensa en el Eje Y como un espejo; el punto reflejado estará a la misma distancia del eje, pero al lado contrario.
-        """)
-    elif reflection_type == 'Reflexión sobre el Origen':
-        st.markdown("""
-        Al **reflejar un punto (x, y) sobre el Origen (0,0)**, ambas coordenadas, $x$ e $y$, cambian de signo.
-        La fórmula de transformación es: $(x, y) \\rightarrow (-x, -y)$.
-        Es como realizar una reflexión sobre el Eje X y luego otra sobre el Eje Y (o viceversa).
-        """)
-    elif reflection_type == 'Reflexión sobre la línea y = x':
-        st.markdown("""
-        Al **reflejar un punto (x, y) sobre la línea $y = x$**, las coordenadas $x$ e $y$ simplemente se intercambian.
-        La fórmula de transformación es: $(x, y) \\rightarrow (y, x)$.
-        Esta línea verde punteada en el gráfico es la línea $y=x$, sirviendo como el eje de reflexión.
-        """)
-    elif reflection_type == 'Reflexión sobre la línea y = -x':
-        st.markdown("""
-        Al **reflejar un punto (x, y) sobre la línea $y = -x$**, las coordenadas $x$ e $y$ se intercambian y ambas cambian de signo.
-        La fórmula de transformación es: $(x, y) \\rightarrow (-y, -x)$.
-        La línea verde punteada en el gráfico es la línea $y=-x$, actuando como el eje de reflexión.
-        """)
-    elif 'línea horizontal' in reflection_type: # y = k
-        st.markdown(f"""
-        Al **reflejar un punto (x, y) sobre una línea horizontal $y = k$** (donde $k$ es un valor constante), la coordenada $x$ permanece igual, y la nueva coordenada $y$ se calcula como $2k - y$.
-        La fórmula de transformación es: $(x, y) \\rightarrow (x, 2k - y)$.
-        En este caso, la línea de reflexión es $y = {custom_line_value}$. El punto reflejado estará a la misma distancia vertical de esta línea que el punto original.
-        """)
-    elif 'línea vertical' in reflection_type: # x = h
-        st.markdown(f"""
-        Al **reflejar un punto (x, y) sobre una línea vertical $x = h$** (donde $h$ es un valor constante), la coordenada $y$ permanece igual, y la nueva coordenada $x$ se calcula como $2h - x$.
-        La fórmula de transformación es: $(x, y) \\rightarrow (2h - x, y)$.
-        En este caso, la línea de reflexión es $x = {custom_line_value}$. El punto reflejado estará a la misma distancia horizontal de esta línea que el punto original.
-        """)
-    else:
-        st.markdown("""
-        Selecciona un tipo de reflexión del menú desplegable para ver su explicación y cómo transforma los puntos.
-        """)
+# --- Panel de rendimiento ---
+# Número de ejecuciones recientes que se muestran en la gráfica del panel
+PERFORMANCE_HISTORY_LENGTH = 50
 
-    st.markdown("---")
-    st.markdown("Desarrollado con Streamlit y Plotly por tu programador Python amigo.")
+# Los mensajes a partir de este tamaño que el navegador ya ha recibido se envían solo como referencia
+MIN_CACHED_MESSAGE_BYTES = st.get_option("global.minCachedMessageSize")
 
-# --- Página de Teoría sobre Reflexión ---
-def theory_page():
-    st.markdown("<h1 style='text-align: center;'>Teoría de la Reflexión Geométrica</h1>", unsafe_allow_html=True)
-    st.markdown("""
-    ---
-    ¡Hola, futuros genios de las matemáticas! Hoy vamos a explorar un concepto fascinante en geometría: la **reflexión**.
-    """)
 
-    st.header("¿Qué es una Reflexión?")
-    st.markdown("""
-    Imagina que tienes un espejo. Cuando te miras en él, ves una imagen de ti mismo que es exactamente igual, pero invertida. En matemáticas, la reflexión funciona de manera muy similar.
-    Una **reflexión** (o simetría axial) es una **transformación geométrica** que "voltea" una figura o un punto sobre una línea, llamada **eje de reflexión**. Es como si doblaras el papel por el eje y la figura original coincidiera exactamente con su imagen reflejada.
+def finish_profile(profile):
+    """
+    Cierra la medición de una ejecución (completa o de un fragmento): la añade al historial
+    del panel y, si REFLEXIONES_PROFILE_LOG está definida, la guarda como una línea JSON.
+    """
+    profile.closed = True
+    if not profile.enabled:
+        return
+    profile.metrics['total_ms'] = profile.total_seconds() * 1e3
+    history = st.session_state.setdefault('performance_history', collections.deque(maxlen=PERFORMANCE_HISTORY_LENGTH))
+    history.append(profile.metrics['total_ms'])
+    log_path = os.environ.get(PROFILE_LOG_ENV)
+    if log_path:
+        profile.write_jsonl(log_path, session=st.session_state.setdefault('profile_session_id', uuid.uuid4().hex))
+
+
+def performance_panel(profile):
+    """Muestra las fases medidas en la ejecución actual y la evolución de las últimas ejecuciones."""
+    total_ms = profile.metrics['total_ms']
+    history = st.session_state.performance_history
+
+    payload_kb = profile.metrics.get('payload_bytes', 0) / 1024
+    if profile.metrics.get('payload_reused') and payload_kb * 1024 >= MIN_CACHED_MESSAGE_BYTES:
+        payload_text = f"Figura sin cambios ({payload_kb:.1f} KB): no se reenvía"
+    else:
+        payload_text = f"Figura enviada: {payload_kb:.1f} KB"
+    st.caption(f"Ejecución: {total_ms:.1f} ms · Vértices: {profile.metrics.get('vertex_count', 0)} · {payload_text}")
+    st.dataframe(
+        {'fase': [name for name, _ in profile.spans], 'ms': [seconds * 1e3 for _, seconds in profile.spans]},
+        hide_index=True,
+        use_container_width=True,
+    )
+    st.line_chart({'ms por ejecución': list(history)}, height=150)
+
+
+# --- Fragmento principal: vértices, opciones, gráfico y explicación ---
+@st.fragment
+def reflection_workspace(profile=NULL_PROFILE):
+    """
+    Dibuja la entrada de vértices, las opciones de reflexión, el gráfico y la explicación.
 
-    **Características clave de una reflexión:**
-    * **Forma y tamaño:** La figura reflejada tiene la misma forma y el mismo tamaño que la figura original. No se estira ni se encoge.
-    * **Orientación:** La orientación de la figura se invierte. Si la figura original se leía de izquierda a derecha, la reflejada se leerá de derecha a izquierda.
-    * **Distancia:** Cada punto de la figura original está a la misma distancia del eje de reflexión que su punto correspondiente en la figura reflejada.
-    """)
+    Es un fragmento de Streamlit: al cambiar uno de sus widgets solo se vuelve a ejecutar esta
+    función, no toda la aplicación (la página de teoría y el resto quedan como estaban).
+    """
+    # En una ejecución parcial, el perfil de la ejecución completa ya se cerró: se mide en uno nuevo
+    partial_run = profile.closed
+    if partial_run:
+        profile = RerunProfile(enabled=profile.enabled, scope='reflection_workspace')
+
+    with profile.span('fragmento'):
+        # Inicializar el estado de la sesión para los puntos si no existe.
+        # Los vértices se guardan en un VertexStore: un único búfer (N, 2) de float64.
+        if 'points' not in st.session_state:
+            set_vertices(np.array([[1.0, 1.0], [3.0, 1.0], [2.0, 3.0]])) # Ejemplo de triángulo inicial
+        # Aseguramos que haya al menos un punto si se borran todos (por ejemplo, desde la tabla)
+        if len(st.session_state.points) == 0:
+            set_vertices(np.zeros((1, 2)))
+
+        # Definir dos columnas para la interfaz principal: una para inputs y otra para el gráfico
+        col_inputs, col_graph = st.columns([1, 2]) # 1 para inputs (más estrecho), 2 para el gráfico (más ancho)
+
+        with col_inputs:
+            st.header("Entrada de Vértices y Opciones")
+
+            with profile.span('widgets_vertices'):
+                st.markdown("### Introduce los vértices de tu figura (x, y)")
+                st.info("Para dibujar una figura cerrada, asegura que el último punto sea el mismo que el primero. Puedes borrar vértices con el botón 'X'.")
+
+                # Importación y exportación masiva de vértices
+                with st.expander("Importar / Exportar vértices"):
+                    # La importación ocurre en el callback, antes de volver a ejecutar el fragmento
+                    st.file_uploader("Importar vértices", type=list(VERTEX_FILE_FORMATS), key="vertex_upload",
+                                     on_change=import_vertices)
+                    if 'vertex_import_error' in st.session_state:
+                        st.error(st.session_state.pop('vertex_import_error'))
+
+                    export_format = st.selectbox("Formato de exportación", VERTEX_FILE_FORMATS, key="vertex_export_format")
+                    # El cuerpo del expander se ejecuta aunque esté cerrado: los vértices solo se
+                    # serializan al pulsar "Preparar descarga", y el archivo se reutiliza mientras
+                    # no cambien los vértices ni el formato
+                    prepared = st.session_state.get('vertex_export')
+                    if prepared is not None and prepared[0] == vertex_export_key(export_format):
+                        st.download_button(
+                            "Descargar vértices",
+                            data=prepared[1],
+                            file_name=f"vertices.{export_format}",
+                            mime=VERTEX_FILE_FORMATS[export_format],
+                        )
+                    else:
+                        st.session_state.pop('vertex_export', None)
+                        st.button("Preparar descarga", key="vertex_export_prepare", on_click=prepare_vertex_export)
+
+                # Las figuras pequeñas usan un par de campos por vértice; las grandes, una única tabla
+                use_grid = len(st.session_state.points) > SMALL_FIGURE_MAX_VERTICES or st.toggle("Editar vértices en una tabla", key="vertex_grid_mode")
+
+                if use_grid:
+                    # La tabla se construye sobre una base estable de los vértices; el editor guarda
+                    # sus propios cambios, así que solo se reinicia (nueva clave) cuando los datos cambian desde fuera.
+                    # La base es una vista de solo lectura del búfer de los vértices: mientras la tabla
+                    # no tenga cambios, la sesión no guarda una segunda copia.
+                    if 'vertex_grid_base' not in st.session_state:
+                        base = st.session_state.points.coords.view()
+                        base.flags.writeable = False
+                        st.session_state.vertex_grid_base = base
+                    # pandas tarda cientos de milisegundos en importarse: solo se carga si se usa la tabla
+                    import pandas as pd
+
+                    grid_key = f"vertex_grid_{st.session_state.vertex_grid_version}"
+                    edited = st.data_editor(
+                        # El editor aplica sus cambios sobre este DataFrame: se copia para no tocar la base
+                        pd.DataFrame(st.session_state.vertex_grid_base, columns=['x', 'y'], copy=True),
+                        num_rows="dynamic",
+                        use_container_width=True,
+                        key=grid_key,
+                    )
+                    # Un editor sin cambios no toca los vértices: su base podría ser más antigua que ellos
+                    if grid_has_edits(grid_key):
+                        edited_coords = edited[['x', 'y']].fillna(0.0).to_numpy(dtype=np.float64)
+                        if not np.array_equal(edited_coords, st.session_state.points.coords):
+                            # Los vértices pasan a un búfer propio y la base queda intacta
+                            st.session_state.points = VertexStore(edited_coords)
+                else:
+                    # Al volver a la tabla, el editor empieza de cero sobre los vértices de ese momento
+                    # (incluidos los cambios hechos con ella y con los campos x, y)
+                    if 'vertex_grid_base' in st.session_state:
+                        reset_vertex_grid()
+                    # Mostrar inputs para cada punto, con un botón para eliminar cada uno
+                    coords = st.session_state.points.coords
+                    for i, (x, y) in enumerate(coords.tolist()):
+                        label_prefix = f"Vértice {vertex_label(i)}"
+
+                        # Usamos columnas para alinear x, y y el botón de cerrar
+                        col_x_input, col_y_input, col_close_button = st.columns([0.4, 0.4, 0.2]) # Ajusta las proporciones
+                        with col_x_input:
+                            coords[i, 0] = st.number_input(f"{label_prefix} (x)", value=x, key=f"x_{i}")
+                        with col_y_input:
+                            coords[i, 1] = st.number_input(f"{label_prefix} (y)", value=y, key=f"y_{i}")
+                        with col_close_button:
+                            # El botón de eliminar se coloca al lado, ligeramente alineado
+                            # Usamos un espacio en blanco arriba para alinearlo verticalmente
+                            st.write("") # Pequeño hack para centrar verticalmente el botón
+                            # El borrado ocurre en el callback, así que no hace falta forzar otra ejecución
+                            st.button("X", key=f"remove_point_{i}", on_click=remove_vertex, args=(i,))
+
+                    if 'vertex_warning' in st.session_state:
+                        st.warning(st.session_state.pop('vertex_warning'))
+
+                # Botón para añadir más puntos
+                st.button("Añadir Vértice", on_click=add_vertex)
+
+            with profile.span('widgets_reflexion'):
+                st.markdown("### Selecciona el tipo de reflexión")
+                kind, custom_line_value = reflection_inputs('main')
+
+
+        with col_graph:
+            st.markdown("<h2 style='text-align: center;'>Visualización de la Reflexión</h2>", unsafe_allow_html=True)
+
+            # Los puntos se guardan como un único arreglo (N, 2); build_figure los refleja en una sola operación
+            original_points = st.session_state.points.coords
+            profile.record(vertex_count=len(original_points))
+
+            # El gráfico solo se dibuja si hay al menos un punto
+            if len(original_points):
+                # Nivel de detalle: ver build_figure
+                full_detail = st.toggle("Detalle completo", key="full_detail",
+                                        help="Dibuja todos los vértices y todas las etiquetas, aunque la figura sea muy grande.")
+
+                # Plotly se carga aquí, la primera vez que hace falta dibujar
+                from reflexiones import build_figure, figure_payload_bytes
+
+                # La figura se reutiliza mientras no cambien los vértices, la reflexión ni el nivel de detalle
+                figure_key = figure_cache_key(original_points, kind, custom_line_value, full_detail)
+                with profile.span('figura'):
+                    figure_data = get_figure_cache().get_or_build(
+                        figure_key,
+                        lambda: build_figure(original_points, kind, custom_line_value, full_detail, profile),
+                    )
+                if figure_data['shown_vertices'] < figure_data['total_vertices'] or figure_data['shown_labels'] < len(original_points):
+                    st.caption(f"Mostrando {figure_data['shown_vertices']} de {figure_data['total_vertices']} vértices y "
+                               f"{figure_data['shown_labels']} etiquetas. Activa 'Detalle completo' para verlos todos.")
+
+                with profile.span('plotly_chart'):
+                    st.plotly_chart(figure_data['figure'], use_container_width=True)
+                # Si la figura es la misma que en la ejecución anterior, Streamlit envía el mensaje
+                # idéntico como una referencia a su hash, que el navegador ya tiene guardado
+                figure_unchanged = st.session_state.get('last_figure_key') == figure_key
+                st.session_state.last_figure_key = figure_key
+                # Medir el tamaño del payload implica serializar de nuevo; solo se hace si se está midiendo
+                if profile.enabled:
+                    profile.record(payload_bytes=figure_payload_bytes(figure_data['figure']),
+                                   payload_reused=figure_unchanged)
+
+                analytics_panel(original_points, kind, custom_line_value, profile)
+                symmetry_panel(original_points, kind, custom_line_value, profile)
+            else:
+                st.info("Añade al menos dos puntos para ver la figura y su reflexión. La figura se cerrará automáticamente.")
 
-    st.header("Tipos Comunes de Reflexiones en el Plano Cartesiano")
-    st.markdown("""
-    En el plano cartesiano (donde usamos coordenadas $x$ e $y$), hay varios ejes de reflexión que son muy comunes:
-    """)
+        st.markdown("---")
+        st.header("Explicación de las Reflexiones")
 
-    st.subheader("1. Reflexión sobre el Eje X")
-    st.markdown("""
-    Cuando reflejamos un punto $(x, y)$ sobre el **Eje X**, la coordenada $x$ se mantiene igual, y la coordenada $y$ cambia de signo.
-    * **Fórmula:** $(x, y) \\rightarrow (x, -y)$
-    * **Ejemplo:** Si el punto original es $(2, 3)$, su reflexión sobre el Eje X será $(2, -3)$.
-    """)
+        with profile.span('explicacion'):
+            st.markdown(explanation_markdown(kind, custom_line_value))
 
-    st.subheader("2. Reflexión sobre el Eje Y")
-    st.markdown("""
-    Cuando reflejamos un punto $(x, y)$ sobre el **Eje Y**, la coordenada $y$ se mantiene igual, y la coordenada $x$ cambia de signo.
-    * **Fórmula:** $(x, y) \\rightarrow (-x, y)$
-    * **Ejemplo:** Si el punto original es $(2, 3)$, su reflexión sobre el Eje Y será $(-2, 3)$.
-    """)
+    if partial_run:
+        finish_profile(profile)
+        if profile.enabled:
+            st.caption(f"Actualización parcial: {profile.total_seconds() * 1e3:.1f} ms")
 
-    st.subheader("3. Reflexión sobre el Origen")
-    st.markdown("""
-    Cuando reflejamos un punto $(x, y)$ sobre el **Origen (0,0)**, ambas coordenadas (x e y) cambian de signo.
-    * **Fórmula:** $(x, y) \\rightarrow (-x, -y)$
-    * **Ejemplo:** Si el punto original es $(2, 3)$, su reflexión sobre el Origen será $(-2, -3)$.
-    """)
 
-    st.subheader("4. Reflexión sobre la línea $y = x$")
-    st.markdown("""
-    Cuando reflejamos un punto $(x, y)$ sobre la **línea $y = x$**, las coordenadas $x$ e $y$ simplemente se intercambian.
-    * **Fórmula:** $(x, y) \\rightarrow (y, x)$
-    * **Ejemplo:** Si el punto original es $(2, 3)$, su reflexión sobre la línea $y=x$ será $(3, 2)$.
-    """)
+# --- Página de la Aplicación Principal ---
+def app_page(profile=NULL_PROFILE):
+    st.markdown("<h1 style='text-align: center;'>Reflexiones de Figuras en el Plano Cartesiano</h1>", unsafe_allow_html=True)
 
-    st.subheader("5. Reflexión sobre la línea $y = -x$")
     st.markdown("""
-    Cuando reflejamos un punto $(x, y)$ sobre la **línea $y = -x$**, las coordenadas $x$ e $y$ se intercambian y ambas cambian de signo.
-    * **Fórmula:** $(x, y) \\rightarrow (-y, -x)$
-    * **Ejemplo:** Si el punto original es $(2, 3)$, su reflexión sobre la línea $y=-x$ será $(-3, -2)$.
+    Esta aplicación te permite introducir puntos en el plano cartesiano, conectarlos para formar una figura
+    y observar cómo esta figura se refleja según diferentes ejes o líneas.
     """)
 
-    st.subheader("6. Reflexión sobre una Línea Horizontal ($y = k$)")
-    st.markdown("""
-    Cuando reflejamos un punto $(x, y)$ sobre una **línea horizontal $y = k$** (donde $k$ es un número), la coordenada $x$ permanece igual. La nueva coordenada $y$ se calcula como el doble de $k$ menos la $y$ original.
-    * **Fórmula:** $(x, y) \\rightarrow (x, 2k - y)$.
-    * **Ejemplo:** Si el punto original es $(2, 3)$ y la línea de reflexión es $y = 5$ (es decir, $k=5$), la reflexión será $(2, 2*5 - 3) = (2, 10 - 3) = (2, 7)$.
-    """)
+    reflection_workspace(profile)
 
-    st.subheader("7. Reflexión sobre una Línea Vertical ($x = h$)")
-    st.markdown("""
-    Cuando reflejamos un punto $(x, y)$ sobre una **línea vertical $x = h$** (donde $h$ es un número), la coordenada $y$ permanece igual. La nueva coordenada $x$ se calcula como el doble de $h$ menos la $x$ original.
-    * **Fórmula:** $(x, y) \\rightarrow (2h - x, y)$.
-    * **Ejemplo:** Si el punto original es $(2, 3)$ y la línea de reflexión es $x = 5$ (es decir, $h=5$), la reflexión será $(2*5 - 2, 3) = (10 - 2, 3) = (8, 3)$.
-    """)
+    # Contadores de la caché de figuras, para dimensionarla.
+    # Se actualizan en cada ejecución completa (no en las del fragmento).
+    with st.sidebar.expander("Caché de figuras"):
+        cache_stats = get_figure_cache().stats()
+        st.caption(f"Aciertos: {cache_stats['hits']} · Fallos: {cache_stats['misses']} · "
+                   f"Tasa de aciertos: {cache_stats['hit_rate']:.0%} · Expulsiones: {cache_stats['evictions']}")
+        st.caption(f"Entradas: {cache_stats['entries']}/{cache_stats['max_entries']} · "
+                   f"Memoria: {cache_stats['bytes'] / 2**20:.1f}/{cache_stats['max_bytes'] / 2**20:.0f} MB")
 
-    st.markdown("""
-    ---
-    ¡Esperamos que esta teoría te ayude a comprender mejor las reflexiones! Ahora, puedes volver a la aplicación interactiva para poner en práctica lo aprendido.
-    """)
     st.markdown("---")
-    st.markdown("Contenido diseñado para estudiantes de bachillerato/educación media.")
+    st.markdown("Desarrollado con Streamlit y Plotly por tu programador Python amigo.")
+
+# --- Escena con muchas figuras ---
+# Número de figuras de la escena de ejemplo
+SAMPLE_SCENE_FIGURES = 2_000
+
+
+def reset_scene(scene):
+    """Guarda la escena en la sesión y descarta su reflexión anterior."""
+    st.session_state.scene = scene
+    st.session_state.pop('scene_reflected', None)
+
+
+def import_scene():
+    """Callback del cargador de la escena: una figura por archivo subido."""
+    uploaded_files = st.session_state.scene_upload
+    if not uploaded_files:
+        return
+    figures, names, errors = [], [], []
+    for uploaded_file in uploaded_files:
+        try:
+            figures.append(load_vertices(uploaded_file, uploaded_file.name))
+            names.append(uploaded_file.name)
+        except ValueError as error:
+            errors.append(f"{uploaded_file.name}: {error}")
+    if errors:
+        st.session_state.scene_import_errors = errors
+    if figures:
+        reset_scene(Scene.from_figures(figures, names))
+
+
+def load_sample_scene():
+    """Callback del botón de ejemplo: una rejilla de polígonos aleatorios, como las entregas de una clase."""
+    rng = np.random.default_rng()
+    side = int(np.ceil(np.sqrt(SAMPLE_SCENE_FIGURES)))
+    figures = []
+    for i in range(SAMPLE_SCENE_FIGURES):
+        n_vertices = rng.integers(3, 13)
+        angles = np.sort(rng.uniform(0.0, 2 * np.pi, n_vertices))
+        radius = rng.uniform(0.5, 2.0)
+        center = np.array([i % side, i // side]) * 5.0 + 3.0
+        figures.append(center + radius * np.column_stack([np.cos(angles), np.sin(angles)]))
+    reset_scene(Scene.from_figures(figures))
+
+
+@st.fragment
+def scene_page(profile=NULL_PROFILE):
+    """
+    Sección con una escena de muchas figuras (por ejemplo, las entregas de toda una clase) y sus reflejadas.
+
+    La reflexión de toda la escena es una sola operación sobre el arreglo de vértices, y solo se
+    envían al gráfico las figuras que caen dentro de la vista elegida con el zoom y el centro.
+    """
+    partial_run = profile.closed
+    if partial_run:
+        profile = RerunProfile(enabled=profile.enabled, scope='scene_page')
+
+    with profile.span('escena'):
+        st.header("Escena con muchas figuras")
+        st.markdown("Sube un archivo de vértices por figura (CSV, `.npy` o Parquet) para ver todas las figuras y sus reflexiones a la vez.")
+
+        col_inputs, col_graph = st.columns([1, 2])
+        with col_inputs:
+            st.file_uploader("Figuras de la escena", type=list(VERTEX_FILE_FORMATS), accept_multiple_files=True,
+                             key="scene_upload", on_change=import_scene)
+            for error in st.session_state.pop('scene_import_errors', []):
+                st.error(f"No se pudo importar el archivo {error}")
+            st.button(f"Cargar escena de ejemplo ({SAMPLE_SCENE_FIGURES} figuras)", on_click=load_sample_scene)
+
+            scene = st.session_state.get('scene')
+            if scene is not None:
+                kind, custom_line_value = reflection_inputs('scene')
+
+                st.markdown("### Vista")
+                zoom = st.slider("Zoom", 1.0, 50.0, 1.0, key="scene_zoom")
+                center_x = st.slider("Centro X (%)", 0, 100, 50, key="scene_center_x")
+                center_y = st.slider("Centro Y (%)", 0, 100, 50, key="scene_center_y")
+
+        with col_graph:
+            if scene is None:
+                st.info("Sube las figuras o carga la escena de ejemplo para verlas aquí.")
+            else:
+                # La escena reflejada se guarda mientras no cambien la escena ni la reflexión
+                reflection_key = (kind, custom_line_value)
+                cached = st.session_state.get('scene_reflected')
+                if cached is None or cached[0] != reflection_key:
+                    with profile.span('reflexion_escena'):
+                        cached = (reflection_key, scene.reflect(kind, custom_line_value))
+                    st.session_state.scene_reflected = cached
+                reflected = cached[1]
+
+                # Límites de las dos escenas (reducción de sus cajas envolventes) y ventana visible
+                x_min, y_min, x_max, y_max = union_bounds(scene.bounds, reflected.bounds)
+                half_width = (x_max - x_min) / (2 * zoom) + 1.0
+                half_height = (y_max - y_min) / (2 * zoom) + 1.0
+                x_center = x_min + (x_max - x_min) * center_x / 100
+                y_center = y_min + (y_max - y_min) * center_y / 100
+                viewport = (x_center - half_width, y_center - half_height, x_center + half_width, y_center + half_height)
+
+                from reflexiones import build_scene_figure
+
+                scene_data = build_scene_figure(scene, reflected, kind, custom_line_value, viewport, profile)
+                st.caption(f"Figuras: {len(scene)} originales y {len(reflected)} reflejadas · "
+                           f"Mostrando {scene_data['shown_figures']} de {scene_data['total_figures']} "
+                           f"({scene_data['shown_vertices']} vértices)")
+                with profile.span('plotly_chart'):
+                    st.plotly_chart(scene_data['figure'], use_container_width=True)
+
+    if partial_run:
+        finish_profile(profile)
+
+
+# --- Página de Teoría sobre Reflexión ---
+def theory_page(profile=NULL_PROFILE):
+    with profile.span('theory_page'):
+        st.markdown("<h1 style='text-align: center;'>Teoría de la Reflexión Geométrica</h1>", unsafe_allow_html=True)
+        # Texto preparado una vez por proceso (ver reflexiones.content)
+        st.markdown(THEORY_MARKDOWN)
 
 
 # --- Configuración de la página global ---
 # Añade el parámetro 'page_icon' con el emoji de tu elección
 st.set_page_config(layout="wide", page_title="Reflexiones Geométricas", page_icon="📐") # O usa "✨" o el que prefieras
 
+# --- Medición de rendimiento (opcional) ---
+# Se activa con el panel de la barra lateral o guardando cada ejecución en REFLEXIONES_PROFILE_LOG
+show_performance_panel = st.sidebar.toggle("Panel de rendimiento", key="performance_panel")
+performance_container = st.sidebar.container()
+profile = RerunProfile(enabled=show_performance_panel or bool(os.environ.get(PROFILE_LOG_ENV)))
+
 # --- Implementación del Navbar con st.tabs en la parte superior ---
-tab_app, tab_theory = st.tabs(["Aplicación Interactiva", "Teoría de la Reflexión"])
+tab_app, tab_scene, tab_theory = st.tabs(["Aplicación Interactiva", "Escena", "Teoría de la Reflexión"])
 
 with tab_app:
-    app_page() # Llama a la función que renderiza la página de la aplicación
+    app_page(profile) # Llama a la función que renderiza la página de la aplicación
+
+with tab_scene:
+    scene_page(profile) # Escena con muchas figuras
 
 with tab_theory:
-    theory_page() # Llama a la función que renderiza la página de teoría
+    theory_page(profile) # Llama a la función que renderiza la página de teoría
+
+finish_profile(profile)
+if show_performance_panel:
+    with performance_container:
+        performance_panel(profile)
 
 # Pie de página opcional y global si se desea
 # st.markdown("---")
@@ -0,0 +1,781 @@
+"""
+Suite de benchmarks del proyecto.
+
+Mide la matemática de la reflexión (punto a punto y por lotes), la construcción de la figura,
+su serialización a JSON de Plotly, las escenas con muchas figuras y la ejecución completa de
+app.py con AppTest de Streamlit (sin navegador ni red). Los resultados se guardan en JSON y se pueden comparar con una
+línea base: la comparación falla si alguna medición se vuelve más lenta que el umbral.
+
+Uso:
+    python benchmarks/bench.py run --output actual.json
+    python benchmarks/bench.py run --output actual.json --compare base.json --threshold 1.25
+    python benchmarks/bench.py compare base.json actual.json --threshold 1.25
+    python benchmarks/bench.py memory --sizes 100 10000
+    python benchmarks/bench.py payload --sizes 100 10000
+    python benchmarks/bench.py load --sessions 1 4 16 --output carga.json
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import datetime
+import functools
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import plotly
+import plotly.io
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from reflexiones import (  # noqa: E402
+    PROFILE_LOG_ENV,
+    Scene,
+    VertexStore,
+    build_figure,
+    build_scene_figure,
+    detect_symmetries,
+    figure_payload_bytes,
+    find_self_intersection,
+    find_symmetry,
+    polygon_metrics,
+    reflect_point,
+    reflect_points,
+)
+
+APP_PATH = ROOT / 'app.py'
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+QUICK_SIZES = (10, 100, 1_000, 10_000)
+
+# Tamaños máximos para los benchmarks más costosos.
+# El bucle punto a punto crece de forma lineal: con 10⁶ vértices solo repetiría lo que ya muestra 10⁵
+MAX_POINT_LOOP_SIZE = 100_000
+MAX_FULL_DETAIL_SIZE = 100_000
+MAX_APP_RERUN_SIZE = 100_000
+MAX_SCENE_FIGURES = 100_000
+MAX_SYMMETRY_SIZE = 100_000
+MAX_SWEEP_SIZE = 100_000
+
+# Procesos nuevos lanzados para medir el arranque en frío
+STARTUP_PROCESSES = 5
+
+# Prueba de carga: sesiones simultáneas por defecto, interacciones por sesión e intervalo de
+# muestreo de la memoria residente
+DEFAULT_LOAD_SESSIONS = (1, 2, 4, 8)
+DEFAULT_LOAD_INTERACTIONS = 20
+RSS_SAMPLE_INTERVAL_S = 0.05
+# Vértices máximos de una sesión simulada (por debajo del límite a partir del cual se editan en una tabla)
+LOAD_MAX_VERTICES = 12
+
+DEFAULT_THRESHOLD = 1.25
+
+
+def measure(function, min_time=0.2, min_repeats=3, max_repeats=50):
+    """
+    Ejecuta `function` varias veces y devuelve estadísticas del tiempo por llamada.
+
+    Repite hasta acumular al menos `min_time` segundos (y un mínimo de `min_repeats` veces).
+
+    Returns:
+        dict: 'median_s', 'min_s' y 'repeats'.
+    """
+    timings = []
+    total = 0.0
+    while len(timings) < max_repeats and (len(timings) < min_repeats or total < min_time):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+        total += elapsed
+    return _summary(timings)
+
+
+def _summary(samples):
+    return {'median_s': statistics.median(samples), 'min_s': min(samples), 'repeats': len(samples)}
+
+
+def sample_polygon(n, seed=0):
+    """Polígono de prueba: una circunferencia con ruido, de n vértices."""
+    rng = np.random.default_rng(seed)
+    angles = np.linspace(0.0, 2 * np.pi, n, endpoint=False)
+    radius = 10.0 + rng.normal(scale=0.5, size=n)
+    return np.column_stack([radius * np.cos(angles), radius * np.sin(angles)])
+
+
+def sample_scene(n_figures, vertices_per_figure=12, seed=0):
+    """Escena de prueba: n_figures polígonos pequeños repartidos en una rejilla cuadrada."""
+    side = int(np.ceil(np.sqrt(n_figures)))
+    polygon = sample_polygon(vertices_per_figure, seed) / 10.0
+    centers = np.column_stack([np.arange(n_figures) % side, np.arange(n_figures) // side]) * 5.0
+    coords = (centers[:, None, :] + polygon[None, :, :]).reshape(-1, 2)
+    return Scene(coords, np.arange(n_figures + 1) * vertices_per_figure)
+
+
+def seed_app_vertices(app_test, coords):
+    """Carga los vértices en la sesión de un AppTest igual que lo haría la aplicación al importar un archivo."""
+    app_test.session_state['points'] = VertexStore(coords)
+    if 'vertex_grid_base' in app_test.session_state:
+        del app_test.session_state['vertex_grid_base']
+    app_test.session_state['vertex_grid_version'] = app_test.session_state['vertex_grid_version'] + 1
+
+
+def _bench_reflection(sizes, results):
+    for n in sizes:
+        coords = sample_polygon(n)
+        if n <= MAX_POINT_LOOP_SIZE:
+            pairs = coords.tolist()
+            results[f'reflect_point_loop[n={n}]'] = measure(
+                lambda: [reflect_point(x, y, 'linea_horizontal', 2.5) for x, y in pairs])
+        results[f'reflect_points[n={n}]'] = measure(lambda: reflect_points(coords, 'linea_horizontal', 2.5))
+
+
+def _bench_figure(sizes, results):
+    for n in sizes:
+        coords = sample_polygon(n)
+        results[f'build_figure[n={n}]'] = measure(lambda: build_figure(coords, 'y_igual_x'))
+        figure = build_figure(coords, 'y_igual_x')['figure']
+        results[f'plotly_to_json[n={n}]'] = measure(lambda: plotly.io.to_json(figure, validate=False))
+        if n <= MAX_FULL_DETAIL_SIZE:
+            results[f'build_figure_full_detail[n={n}]'] = measure(
+                lambda: build_figure(coords, 'y_igual_x', full_detail=True))
+
+
+def _bench_app(sizes, results):
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_file(str(APP_PATH), default_timeout=300)
+    app_test.run()
+    if app_test.exception:
+        raise RuntimeError(f"app.py falló en AppTest: {app_test.exception}")
+    results['app_rerun[default]'] = measure(app_test.run)
+
+    for n in sizes:
+        if n > MAX_APP_RERUN_SIZE:
+            continue
+        seed_app_vertices(app_test, sample_polygon(n))
+        app_test.run()  # primera ejecución con los nuevos vértices (llena la caché de figuras)
+        results[f'app_rerun[n={n}]'] = measure(app_test.run)
+
+
+def _bench_scene(sizes, results):
+    """Escenas de n figuras: construcción, índice espacial, consulta de visibles, reflexión y figura de Plotly."""
+    for n in sizes:
+        if n > MAX_SCENE_FIGURES:
+            continue
+        scene = sample_scene(n)
+        results[f'scene_build[figures={n}]'] = measure(lambda: Scene(scene.coords, scene.offsets))
+        results[f'scene_index[figures={n}]'] = measure(lambda: Scene(scene.coords, scene.offsets).index)
+        results[f'scene_reflect[figures={n}]'] = measure(lambda: scene.reflect('y_igual_x'))
+
+        x_min, y_min, x_max, y_max = scene.bounds
+        zoomed = (x_min, y_min, x_min + (x_max - x_min) / 10, y_min + (y_max - y_min) / 10)
+        scene.index  # el índice se construye una vez; aquí solo se mide la consulta
+        results[f'scene_visible_zoom10[figures={n}]'] = measure(lambda: scene.visible(zoomed))
+        reflected = scene.reflect('eje_y')
+        results[f'scene_figure_zoom10[figures={n}]'] = measure(
+            lambda: build_scene_figure(scene, reflected, 'eje_y', viewport=zoomed))
+
+
+def _bench_symmetry(sizes, results):
+    """Detección de simetrías: una sola reflexión y la búsqueda entre todos los ejes candidatos."""
+    for n in sizes:
+        if n > MAX_SYMMETRY_SIZE:
+            continue
+        # Elipse exacta (simétrica respecto a ambos ejes) y polígono con ruido (sin simetrías)
+        angles = np.linspace(0.0, 2 * np.pi, n, endpoint=False)
+        ellipse = np.column_stack([3 * np.cos(angles), np.sin(angles)])
+        noisy = sample_polygon(n)
+        results[f'find_symmetry[n={n}]'] = measure(lambda: find_symmetry(ellipse, 'eje_x'))
+        results[f'detect_symmetries[n={n}]'] = measure(lambda: detect_symmetries(ellipse))
+        results[f'detect_symmetries_asymmetric[n={n}]'] = measure(lambda: detect_symmetries(noisy))
+
+
+def _bench_analytics(sizes, results):
+    """Área, perímetro y sentido de recorrido, y búsqueda de autointersecciones por barrido."""
+    for n in sizes:
+        angles = np.linspace(0.0, 2 * np.pi, n, endpoint=False)
+        # Contorno estrellado simple (sin cruces): el barrido tiene que recorrerlo entero
+        radius = 10.0 + np.sin(7 * angles)
+        simple = np.column_stack([radius * np.cos(angles), radius * np.sin(angles)])
+        results[f'polygon_metrics[n={n}]'] = measure(lambda: polygon_metrics(simple))
+        if n <= MAX_SWEEP_SIZE:
+            results[f'find_self_intersection[n={n}]'] = measure(lambda: find_self_intersection(simple))
+
+
+def _bench_vertex_edits(sizes, results, edits=20):
+    """
+    Escenario de edición de vértices: compara lo que cuesta una ejecución completa del script
+    (lo que costaba cada edición antes de usar fragmentos) con lo que cuesta el fragmento
+    reflection_workspace, que es lo único que se vuelve a ejecutar al editar un vértice.
+
+    AppTest siempre ejecuta el script completo, así que el coste del fragmento se toma de su
+    fase 'fragmento' en el registro JSON Lines de la medición de rendimiento.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / 'perfil.jsonl'
+        saved = os.environ.get(PROFILE_LOG_ENV)
+        os.environ[PROFILE_LOG_ENV] = str(log_path)
+        try:
+            app_test = AppTest.from_file(str(APP_PATH), default_timeout=300)
+            app_test.run()
+            for edit in range(edits):
+                app_test.number_input(key='x_0').set_value(float(edit)).run()
+        finally:
+            if saved is None:
+                del os.environ[PROFILE_LOG_ENV]
+            else:
+                os.environ[PROFILE_LOG_ENV] = saved
+        records = [json.loads(line) for line in log_path.read_text(encoding='utf-8').splitlines()][1:]
+
+    full = [record['total_ms'] / 1e3 for record in records]
+    fragment = [span['ms'] / 1e3 for record in records for span in record['spans'] if span['name'] == 'fragmento']
+    results['vertex_edit[full_rerun]'] = _summary(full)
+    results['vertex_edit[fragment_rerun]'] = _summary(fragment)
+
+
+# Se ejecuta en un intérprete nuevo: mide el arranque en frío, sin módulos ya cargados
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+app_test = AppTest.from_file(sys.argv[1], default_timeout=300)
+app_test.run()
+first_run = time.perf_counter()
+app_test.run()
+print(json.dumps({
+    'import': imported - start,
+    'first_run': first_run - imported,
+    'warm_run': time.perf_counter() - first_run,
+    'error': str(app_test.exception) if app_test.exception else None,
+}))
+"""
+
+
+def _bench_startup(sizes, results):
+    """
+    Arranque en frío: cada medición lanza un intérprete nuevo que importa Streamlit y ejecuta
+    app.py con AppTest dos veces. La primera ejecución incluye importar las dependencias de la
+    aplicación y preparar su contenido estático; la segunda muestra el coste ya en caliente.
+    """
+    samples = {'import': [], 'first_run': [], 'warm_run': []}
+    for _ in range(STARTUP_PROCESSES):
+        output = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT, str(APP_PATH)], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout
+        timings = json.loads(output.strip().splitlines()[-1])
+        if timings.pop('error'):
+            raise RuntimeError("app.py falló en AppTest durante el arranque en frío.")
+        for name, seconds in timings.items():
+            samples[name].append(seconds)
+    results['startup[import_streamlit]'] = _summary(samples['import'])
+    results['startup[first_run]'] = _summary(samples['first_run'])
+    results['startup[warm_run]'] = _summary(samples['warm_run'])
+
+
+def _traced_bytes(build):
+    """Memoria (bytes) que sigue reservada tras construir el objeto que devuelve `build`."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        obj = build()
+        size = tracemalloc.get_traced_memory()[0] - before
+        del obj
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def _array_owner(array):
+    """Arreglo que posee la memoria de `array` (él mismo si no es una vista)."""
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+def _state_bytes(value, seen):
+    """
+    Bytes que ocupa un valor de st.session_state, recorriendo diccionarios, listas y tuplas.
+
+    La memoria de cada arreglo de NumPy se cuenta una sola vez aunque varias vistas la compartan
+    (`seen` guarda los arreglos ya contados); un VertexStore cuenta su búfer completo.
+    """
+    if isinstance(value, VertexStore):
+        value = value.coords
+    if isinstance(value, np.ndarray):
+        owner = _array_owner(value)
+        if id(owner) in seen:
+            return 0
+        seen.add(id(owner))
+        return owner.nbytes
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_state_bytes(key, seen) + _state_bytes(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(_state_bytes(item, seen) for item in value)
+    return size
+
+
+def app_session_bytes(coords):
+    """
+    Memoria del st.session_state real de una sesión de app.py con `coords` como vértices.
+
+    Incluye todo lo que la sesión guarda además del VertexStore: la base de la tabla de edición
+    (que se usa siempre por encima de SMALL_FIGURE_MAX_VERTICES vértices), el estado de los widgets
+    y las claves auxiliares. No incluye las cachés compartidas entre sesiones.
+
+    Returns:
+        int: Bytes del estado de la sesión.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_file(str(APP_PATH), default_timeout=300)
+    app_test.run()
+    seed_app_vertices(app_test, coords)
+    app_test.run()
+    if app_test.exception:
+        raise RuntimeError(f"app.py falló en AppTest: {app_test.exception}")
+    seen = set()
+    return sum(_state_bytes(key, seen) + _state_bytes(value, seen)
+               for key, value in app_test.session_state.filtered_state.items())
+
+
+def session_memory_report(sizes):
+    """
+    Memoria que ocupan los vértices de una sesión según cómo se guarden.
+
+    Compara la lista de diccionarios {'x': ..., 'y': ...} original, un VertexStore construido de
+    una vez (como al importar un archivo) y un VertexStore que crece vértice a vértice (como con el
+    botón "Añadir Vértice", incluida su capacidad libre). La última columna es el estado completo
+    de una sesión de app.py con esos vértices (ver app_session_bytes), que es lo que cuesta de
+    verdad cada alumno conectado.
+
+    Returns:
+        dict: Bytes por representación, por número de vértices.
+    """
+    report = {}
+    for n in sizes:
+        coords = sample_polygon(n)
+        pairs = coords.tolist()
+
+        def grown_store():
+            store = VertexStore()
+            for x, y in pairs:
+                store.append(x, y)
+            return store
+
+        report[n] = {
+            'lista_de_diccionarios': _traced_bytes(lambda: [{'x': x, 'y': y} for x, y in coords.tolist()]),
+            'vertex_store': _traced_bytes(lambda: VertexStore(coords)),
+            'vertex_store_creciente': _traced_bytes(grown_store),
+            'sesion_app': app_session_bytes(coords),
+        }
+    return report
+
+
+def payload_report(sizes):
+    """
+    Bytes que se envían al navegador para dibujar la figura, con el nivel de detalle por defecto
+    y en modo "Detalle completo" (este, solo hasta MAX_FULL_DETAIL_SIZE vértices).
+
+    Es lo que cuesta una ejecución en la que la figura cambia; si no cambia, Streamlit solo
+    reenvía una referencia al mensaje que el navegador ya tiene.
+
+    Returns:
+        dict: Bytes por modo, por número de vértices.
+    """
+    report = {}
+    for n in sizes:
+        coords = sample_polygon(n)
+        report[n] = {'por_defecto': figure_payload_bytes(build_figure(coords, 'y_igual_x')['figure'])}
+        if n <= MAX_FULL_DETAIL_SIZE:
+            report[n]['detalle_completo'] = figure_payload_bytes(
+                build_figure(coords, 'y_igual_x', full_detail=True)['figure'])
+    return report
+
+
+def _current_rss_bytes():
+    """
+    Memoria residente actual del proceso, en bytes.
+
+    En Linux se lee de /proc/self/statm; en otros sistemas Unix se usa el máximo histórico del
+    proceso y en Windows no se mide (0).
+    """
+    try:
+        with open('/proc/self/statm', encoding='ascii') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return _peak_rss_bytes()
+
+
+def _peak_rss_bytes():
+    """Memoria residente máxima que ha alcanzado el proceso desde que empezó, en bytes (0 en Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # macOS da bytes; el resto, KiB
+
+
+class _RssSampler:
+    """Hilo que muestrea la memoria residente del proceso mientras está activo y guarda el máximo."""
+
+    def __init__(self, interval=RSS_SAMPLE_INTERVAL_S):
+        self.interval = interval
+        self.peak = _current_rss_bytes()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, _current_rss_bytes())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _current_rss_bytes())
+
+
+# AppTest sustituye el Runtime global de Streamlit durante cada ejecución, así que dos AppTest no
+# pueden ejecutar el script a la vez en el mismo proceso: en modo 'thread' se turnan con este cerrojo
+_APP_TEST_LOCK = threading.Lock()
+
+
+def _simulated_session(session_id, interactions, think_time, seed, serialize=False):
+    """
+    Un alumno simulado: abre la aplicación y hace `interactions` cambios al azar (añadir un
+    vértice, editar una coordenada, cambiar el tipo de reflexión o cambiar k o h).
+
+    Cada cambio es una nueva ejecución del script. AppTest siempre ejecuta el script completo
+    (no solo el fragmento), así que las latencias son una cota superior de las reales.
+
+    Args:
+        serialize (bool, optional): Si es True, cada ejecución espera su turno en _APP_TEST_LOCK
+            y la espera cuenta en su latencia.
+
+    Returns:
+        dict: 'latencies' (segundos de cada ejecución) y 'errors' (ejecuciones con una excepción).
+    """
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed * 1_000_003 + session_id)
+    app_test = AppTest.from_file(str(APP_PATH), default_timeout=300)
+    latencies, errors = [], 0
+
+    def rerun(element):
+        nonlocal errors
+        start = time.perf_counter()
+        with _APP_TEST_LOCK if serialize else contextlib.nullcontext():
+            element.run()
+        latencies.append(time.perf_counter() - start)
+        errors += bool(app_test.exception)
+
+    rerun(app_test)
+    labels = app_test.selectbox(key='reflection_type_main_page').options
+    for _ in range(interactions):
+        if think_time:
+            time.sleep(rng.uniform(0.5, 1.5) * think_time)
+        vertices = len(app_test.session_state['points'])
+        action = rng.choice(('add_vertex', 'edit_vertex', 'edit_vertex', 'reflection', 'line_value'))
+        if action == 'add_vertex':
+            # Sin llegar a la tabla de vértices, para que la sesión siga editando campos x_i / y_i
+            if vertices < LOAD_MAX_VERTICES:
+                rerun(next(button for button in app_test.button if button.label == "Añadir Vértice").click())
+            else:
+                rerun(app_test.button(key=f"remove_point_{vertices - 1}").click())
+        elif action == 'edit_vertex':
+            axis = rng.choice('xy')
+            rerun(app_test.number_input(key=f"{axis}_{rng.randrange(vertices)}").set_value(round(rng.uniform(-10, 10), 1)))
+        elif action == 'reflection':
+            rerun(app_test.selectbox(key='reflection_type_main_page').set_value(rng.choice(labels)))
+        else:
+            # Cambia k o h; si la reflexión elegida no lo usa, antes se cambia a una que sí
+            key, line = rng.choice((('custom_k_main', 'horizontal'), ('custom_h_main', 'vertical')))
+            selectbox = app_test.selectbox(key='reflection_type_main_page')
+            if line not in selectbox.value:
+                rerun(selectbox.set_value(next(label for label in labels if line in label)))
+            rerun(app_test.number_input(key=key).set_value(round(rng.uniform(-5, 5), 1)))
+    return {'latencies': latencies, 'errors': errors}
+
+
+def _process_session(session_id, barrier, interactions, think_time, seed):
+    """
+    Sesión del modo 'process'. Antes de medir, una sesión sin interacciones importa los módulos
+    y llena las cachés del proceso (como la sesión previa del modo 'thread'), y todos los procesos
+    esperan en `barrier` para empezar a la vez.
+
+    Returns:
+        dict: El resultado de _simulated_session más 'window' (inicio y fin de la parte medida, en
+            segundos de reloj) y 'peak_rss' (memoria residente máxima del proceso, en bytes).
+    """
+    _simulated_session(session_id, interactions=0, think_time=0.0, seed=seed)
+    barrier.wait()
+    start = time.time()
+    outcome = _simulated_session(session_id, interactions, think_time, seed)
+    outcome['window'] = (start, time.time())
+    outcome['peak_rss'] = _peak_rss_bytes()
+    return outcome
+
+
+def _percentile(samples, percent):
+    if len(samples) < 2:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method='inclusive')[percent - 1]
+
+
+def load_test(session_counts, interactions=DEFAULT_LOAD_INTERACTIONS, think_time=0.0, seed=0, mode='thread'):
+    """
+    Prueba de carga: para cada número de sesiones, las ejecuta a la vez y mide sus ejecuciones.
+
+    En modo 'thread' las sesiones son hilos de un mismo proceso, como las del servidor de
+    Streamlit (cachés compartidas), y sus ejecuciones se turnan (ver _APP_TEST_LOCK): el código
+    Python de la aplicación apenas suelta el GIL, así que en el servidor también se hacen casi
+    en serie. Es la respuesta a cuántas sesiones aguanta un proceso. En modo 'process' cada
+    sesión tiene su propio proceso y las ejecuciones sí son simultáneas en varios núcleos.
+
+    Args:
+        session_counts (list): Números de sesiones simultáneas a probar, en orden.
+        interactions (int, optional): Cambios que hace cada sesión después de abrir la aplicación.
+        think_time (float, optional): Pausa media, en segundos, entre dos cambios de una sesión.
+            Con 0 las sesiones no esperan y se mide el sistema saturado.
+        seed (int, optional): Semilla de las interacciones al azar.
+        mode (str, optional): 'thread' o 'process'.
+
+    Returns:
+        list: Un diccionario por número de sesiones con las latencias (p50, p95, p99 y máxima, en
+            ms), las ejecuciones por segundo, la memoria residente máxima (MiB; en modo 'process',
+            la suma de los máximos de todos los procesos, según ru_maxrss) y la memoria por sesión
+            (en modo 'process', la de un proceso completo).
+    """
+    if mode == 'thread':
+        # Una sesión previa, fuera de la medición, carga los módulos y llena las cachés del proceso
+        _simulated_session(0, interactions=0, think_time=0.0, seed=seed)
+    rows = []
+    for sessions in session_counts:
+        if mode == 'thread':
+            run_session = functools.partial(_simulated_session, interactions=interactions, think_time=think_time,
+                                            seed=seed, serialize=True)
+            rss_before = _current_rss_bytes()
+            with _RssSampler() as sampler, concurrent.futures.ThreadPoolExecutor(max_workers=sessions) as pool:
+                start = time.perf_counter()
+                outcomes = list(pool.map(run_session, range(sessions)))
+                elapsed = time.perf_counter() - start
+            peak_rss = sampler.peak
+            rss_per_session = max(0, peak_rss - rss_before) / sessions
+        else:
+            # 'spawn' para que cada proceso empiece limpio y su memoria no incluya la del padre
+            context = multiprocessing.get_context('spawn')
+            with context.Manager() as manager, \
+                    concurrent.futures.ProcessPoolExecutor(max_workers=sessions, mp_context=context) as pool:
+                run_session = functools.partial(_process_session, barrier=manager.Barrier(sessions),
+                                                interactions=interactions, think_time=think_time, seed=seed)
+                outcomes = list(pool.map(run_session, range(sessions)))
+            # Solo cuenta la parte medida, desde que empieza la primera sesión hasta que acaba la última
+            windows = np.array([outcome['window'] for outcome in outcomes])
+            elapsed = windows[:, 1].max() - windows[:, 0].min()
+            peak_rss = sum(outcome['peak_rss'] for outcome in outcomes)
+            rss_per_session = peak_rss / sessions
+        latencies = [latency * 1e3 for outcome in outcomes for latency in outcome['latencies']]
+        rows.append({
+            'sessions': sessions,
+            'reruns': len(latencies),
+            'errors': sum(outcome['errors'] for outcome in outcomes),
+            'p50_ms': _percentile(latencies, 50),
+            'p95_ms': _percentile(latencies, 95),
+            'p99_ms': _percentile(latencies, 99),
+            'max_ms': max(latencies),
+            'reruns_per_s': len(latencies) / elapsed,
+            'peak_rss_mib': peak_rss / 2**20,
+            'rss_per_session_mib': rss_per_session / 2**20,
+        })
+    return rows
+
+
+def print_load_test(rows):
+    print(f"{'sesiones':>8}  {'ejec.':>6}  {'errores':>7}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}  "
+          f"{'ejec./s':>8}  {'RSS máx. MiB':>12}  {'MiB/sesión':>10}")
+    for row in rows:
+        print(f"{row['sessions']:>8}  {row['reruns']:>6}  {row['errors']:>7}  {row['p50_ms']:>8.1f}  "
+              f"{row['p95_ms']:>8.1f}  {row['p99_ms']:>8.1f}  {row['reruns_per_s']:>8.1f}  "
+              f"{row['peak_rss_mib']:>12.1f}  {row['rss_per_session_mib']:>10.2f}")
+
+
+BENCHMARK_GROUPS = {
+    'reflection': _bench_reflection,
+    'figure': _bench_figure,
+    'app': _bench_app,
+    'scene': _bench_scene,
+    'symmetry': _bench_symmetry,
+    'analytics': _bench_analytics,
+    'vertex_edits': _bench_vertex_edits,
+    'startup': _bench_startup,
+}
+
+
+def run_benchmarks(sizes, groups):
+    """
+    Ejecuta los grupos de benchmarks indicados.
+
+    Returns:
+        dict: Metadatos del entorno y resultados por nombre de benchmark.
+    """
+    import streamlit
+
+    results = {}
+    for group in groups:
+        print(f"Ejecutando grupo '{group}'...", file=sys.stderr)
+        BENCHMARK_GROUPS[group](sizes, results)
+    return {
+        'metadata': {
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'plotly': plotly.__version__,
+            'streamlit': streamlit.__version__,
+            'sizes': list(sizes),
+        },
+        'results': results,
+    }
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compara dos ejecuciones por la mediana de cada benchmark común.
+
+    Returns:
+        list: Filas (nombre, mediana base, mediana actual, cociente, es_regresión).
+    """
+    rows = []
+    for name, result in current['results'].items():
+        if name not in baseline['results']:
+            continue
+        base_s = baseline['results'][name]['median_s']
+        ratio = result['median_s'] / base_s if base_s > 0 else float('inf')
+        rows.append((name, base_s, result['median_s'], ratio, ratio > threshold))
+    return rows
+
+
+def print_results(results):
+    width = max(len(name) for name in results)
+    for name, result in results.items():
+        print(f"{name:<{width}}  {result['median_s'] * 1e3:12.3f} ms  (mín {result['min_s'] * 1e3:.3f} ms, {result['repeats']} rep.)")
+
+
+def print_comparison(rows, threshold):
+    if not rows:
+        print("No hay benchmarks en común para comparar.")
+        return
+    width = max(len(row[0]) for row in rows)
+    for name, base_s, current_s, ratio, regression in rows:
+        flag = '  <-- REGRESIÓN' if regression else ''
+        print(f"{name:<{width}}  {base_s * 1e3:12.3f} ms -> {current_s * 1e3:12.3f} ms  x{ratio:.2f}{flag}")
+    regressions = sum(row[4] for row in rows)
+    print(f"{regressions} de {len(rows)} benchmarks superan el umbral x{threshold:.2f}.")
+
+
+def _load(path):
+    with open(path, encoding='utf-8') as file_obj:
+        return json.load(file_obj)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de la aplicación de reflexiones.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Ejecuta los benchmarks y guarda los resultados en JSON.")
+    run_parser.add_argument('--output', type=Path, default=Path('benchmark.json'), help="Archivo JSON de salida.")
+    run_parser.add_argument('--sizes', type=int, nargs='+', help="Números de vértices a medir.")
+    run_parser.add_argument('--quick', action='store_true', help=f"Usa solo los tamaños {QUICK_SIZES}.")
+    run_parser.add_argument('--groups', nargs='+', choices=sorted(BENCHMARK_GROUPS), default=list(BENCHMARK_GROUPS),
+                            help="Grupos de benchmarks a ejecutar.")
+    run_parser.add_argument('--compare', type=Path, help="JSON de línea base con el que comparar al terminar.")
+    run_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                            help="Cociente máximo permitido (actual / base) antes de considerarlo una regresión.")
+
+    memory_parser = subparsers.add_parser('memory', help="Muestra la memoria por sesión de los vértices.")
+    memory_parser.add_argument('--sizes', type=int, nargs='+', default=[100, 10_000], help="Números de vértices a medir.")
+
+    payload_parser = subparsers.add_parser('payload', help="Muestra los bytes de la figura que se envían al navegador.")
+    payload_parser.add_argument('--sizes', type=int, nargs='+', default=[100, 10_000], help="Números de vértices a medir.")
+
+    load_parser = subparsers.add_parser('load', help="Prueba de carga con varias sesiones simultáneas.")
+    load_parser.add_argument('--sessions', type=int, nargs='+', default=list(DEFAULT_LOAD_SESSIONS),
+                             help="Números de sesiones simultáneas a probar.")
+    load_parser.add_argument('--interactions', type=int, default=DEFAULT_LOAD_INTERACTIONS,
+                             help="Cambios que hace cada sesión.")
+    load_parser.add_argument('--think-time', type=float, default=0.0,
+                             help="Pausa media entre cambios de una sesión, en segundos (0: proceso saturado).")
+    load_parser.add_argument('--seed', type=int, default=0, help="Semilla de las interacciones al azar.")
+    load_parser.add_argument('--mode', choices=('thread', 'process'), default='thread',
+                             help="Sesiones como hilos de un mismo proceso o cada una en su propio proceso.")
+    load_parser.add_argument('--output', type=Path, help="Archivo JSON donde guardar los resultados.")
+
+    compare_parser = subparsers.add_parser('compare', help="Compara dos archivos de resultados.")
+    compare_parser.add_argument('baseline', type=Path)
+    compare_parser.add_argument('current', type=Path)
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'memory':
+        for n, by_kind in session_memory_report(args.sizes).items():
+            print(f"n={n}: " + ' · '.join(f"{name} {size / 1024:,.1f} KiB" for name, size in by_kind.items()))
+        return 0
+
+    if args.command == 'payload':
+        for n, by_mode in payload_report(args.sizes).items():
+            print(f"n={n}: " + ' · '.join(f"{name} {size / 1024:,.1f} KiB" for name, size in by_mode.items()))
+        return 0
+
+    if args.command == 'load':
+        rows = load_test(args.sessions, args.interactions, args.think_time, args.seed, args.mode)
+        print_load_test(rows)
+        if args.output:
+            report = {'metadata': {'mode': args.mode, 'interactions': args.interactions,
+                                   'think_time_s': args.think_time, 'seed': args.seed,
+                                   'python': platform.python_version(), 'cpu_count': os.cpu_count()},
+                      'results': rows}
+            args.output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+            print(f"Resultados guardados en {args.output}")
+        return 0 if not any(row['errors'] for row in rows) else 1
+
+    if args.command == 'run':
+        sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+        current = run_benchmarks(sizes, args.groups)
+        args.output.write_text(json.dumps(current, indent=2), encoding='utf-8')
+        print_results(current['results'])
+        print(f"Resultados guardados en {args.output}")
+        if args.compare is None:
+            return 0
+        baseline = _load(args.compare)
+    else:
+        baseline, current = _load(args.baseline), _load(args.current)
+
+    rows = compare_results(baseline, current, args.threshold)
+    print_comparison(rows, args.threshold)
+    return 1 if any(row[4] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
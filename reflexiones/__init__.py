@@ -0,0 +1,55 @@
+"""
+Núcleo geométrico de la aplicación de reflexiones.
+
+Este paquete no depende de Streamlit: se puede usar desde la aplicación web,
+desde scripts o desde la línea de comandos (python -m reflexiones).
+
+Las funciones de figures.py importan Plotly, así que no se cargan con el paquete: se importan
+la primera vez que se usan (from reflexiones import build_figure también funciona).
+"""
+
+import importlib
+
+from .analytics import find_self_intersection, perimeter, polygon_metrics, signed_area
+from .cache import FigureCache, estimate_figure_bytes, figure_cache_key
+from .content import THEORY_MARKDOWN, explanation_markdown, vertex_label
+from .profiling import NULL_PROFILE, PROFILE_LOG_ENV, RerunProfile
+from .scene import Scene, UniformGridIndex, union_bounds
+from .simplify import simplify_indices
+from .store import VertexStore
+from .symmetry import detect_symmetries, find_symmetry, match_points, symmetry_candidates, symmetry_label
+from .transforms import (
+    REFLECTION_PRESETS,
+    apply_transform,
+    compose,
+    glide_reflection,
+    reflect_point,
+    reflect_points,
+    reflection_line,
+    reflection_preset,
+    rotation,
+    translation,
+)
+from .vertex_io import (
+    VERTEX_FILE_FORMATS,
+    load_vertices,
+    read_vertex_file,
+    vertices_to_bytes,
+    write_vertex_file,
+    write_vertices,
+)
+
+# Nombre exportado -> submódulo que lo define, para los que se importan bajo demanda
+_LAZY_EXPORTS = {
+    'build_figure': '.figures',
+    'build_scene_figure': '.figures',
+    'figure_payload_bytes': '.figures',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,180 @@
+"""Medidas de un polígono: área con signo, perímetro, sentido de recorrido y autointersecciones."""
+
+import bisect
+
+import numpy as np
+
+
+def _polygon_vertices(coords):
+    """Vértices del polígono sin repeticiones consecutivas (incluida la del cierre) y sus índices originales."""
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    if len(coords) < 2:
+        return coords, np.arange(len(coords))
+    differs = np.any(coords != np.roll(coords, -1, axis=0), axis=1)
+    if not differs.any():
+        return coords[:1], np.zeros(1, dtype=np.int64)
+    kept = np.flatnonzero(differs)
+    return coords[kept], kept
+
+
+def signed_area(coords):
+    """
+    Área con signo del polígono cerrado (fórmula del cordón de zapato).
+
+    Es positiva si los vértices se recorren en sentido antihorario y negativa si es horario.
+    """
+    return _signed_area(_polygon_vertices(coords)[0])
+
+
+def _signed_area(vertices):
+    if len(vertices) < 3:
+        return 0.0
+    # Se centran los vértices para reducir el error de redondeo con coordenadas grandes
+    x, y = (vertices - vertices.mean(axis=0)).T
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def perimeter(coords):
+    """Longitud del contorno del polígono cerrado."""
+    return _perimeter(_polygon_vertices(coords)[0])
+
+
+def _perimeter(vertices):
+    if len(vertices) < 2:
+        return 0.0
+    return float(np.hypot(*(np.roll(vertices, -1, axis=0) - vertices).T).sum())
+
+
+def polygon_metrics(coords):
+    """
+    Medidas básicas del polígono.
+
+    Returns:
+        dict: 'signed_area', 'area', 'perimeter' y 'winding' ('antihorario', 'horario' o
+            'sin área' si el polígono es degenerado).
+    """
+    vertices, _ = _polygon_vertices(coords)
+    area = _signed_area(vertices)
+    length = _perimeter(vertices)
+    if abs(area) <= 1e-12 * max(length, 1.0) ** 2:
+        winding = 'sin área'
+    else:
+        winding = 'antihorario' if area > 0 else 'horario'
+    return {'signed_area': area, 'area': abs(area), 'perimeter': length, 'winding': winding}
+
+
+def _orientation(ax, ay, bx, by, cx, cy):
+    """Signo del giro a -> b -> c: 1 antihorario, -1 horario, 0 alineados."""
+    cross = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    return (cross > 0) - (cross < 0)
+
+
+def _on_segment(ax, ay, bx, by, px, py):
+    """Si p, alineado con el segmento a-b, cae dentro de él."""
+    return min(ax, bx) <= px <= max(ax, bx) and min(ay, by) <= py <= max(ay, by)
+
+
+def find_self_intersection(coords):
+    """
+    Busca dos lados del polígono cerrado que se corten (algoritmo de barrido de Shamos–Hoey).
+
+    Una recta vertical recorre los extremos de los lados de izquierda a derecha. Los lados que
+    corta en cada momento se mantienen ordenados por altura en una lista (insertando con bisect),
+    y cada lado solo se compara con sus vecinos de arriba y de abajo al entrar y al salir: si hay
+    algún cruce, dos lados vecinos en algún momento se cortan. Son O(N log N) comparaciones en
+    lugar de las O(N²) de probar todos los pares. Los lados consecutivos comparten un vértice y
+    solo cuentan si el segundo vuelve sobre el primero.
+
+    Args:
+        coords (np.ndarray): Arreglo (N, 2) con los vértices en orden.
+
+    Returns:
+        tuple or None: Índices (i, j) de los vértices donde empiezan los dos lados que se cortan
+            (cada lado va de un vértice al siguiente no repetido), o None si no hay cruces.
+    """
+    vertices, kept = _polygon_vertices(coords)
+    n_edges = len(vertices)
+    if n_edges < 3:
+        return None
+
+    # Extremos de cada lado ordenados de izquierda a derecha (y de abajo arriba si son verticales)
+    starts = vertices
+    ends = np.roll(vertices, -1, axis=0)
+    swap = (ends[:, 0] < starts[:, 0]) | ((ends[:, 0] == starts[:, 0]) & (ends[:, 1] < starts[:, 1]))
+    left = np.where(swap[:, None], ends, starts)
+    right = np.where(swap[:, None], starts, ends)
+    dx = right[:, 0] - left[:, 0]
+    slope = np.divide(right[:, 1] - left[:, 1], dx, out=np.zeros(n_edges), where=dx != 0)
+
+    # Eventos ordenados por x; a igual x, primero las entradas (para detectar lados que se tocan)
+    event_x = np.concatenate([left[:, 0], right[:, 0]])
+    event_y = np.concatenate([left[:, 1], right[:, 1]])
+    event_kind = np.repeat([0, 1], n_edges)  # 0 = entrada, 1 = salida
+    event_edge = np.tile(np.arange(n_edges), 2)
+    order = np.lexsort((event_y, event_kind, event_x))
+
+    start_points = vertices.tolist()
+    left_x, left_y = left[:, 0].tolist(), left[:, 1].tolist()
+    right_x, right_y = right[:, 0].tolist(), right[:, 1].tolist()
+    slopes, vertical = slope.tolist(), (dx == 0).tolist()
+    # Pendiente para desempatar lados que pasan por el mismo punto (los verticales suben desde él)
+    tie_slopes = np.where(dx == 0, np.inf, slope).tolist()
+
+    def intersects(i, j):
+        ax, ay, bx, by = left_x[i], left_y[i], right_x[i], right_y[i]
+        cx, cy, ex, ey = left_x[j], left_y[j], right_x[j], right_y[j]
+        o1 = _orientation(ax, ay, bx, by, cx, cy)
+        o2 = _orientation(ax, ay, bx, by, ex, ey)
+        o3 = _orientation(cx, cy, ex, ey, ax, ay)
+        o4 = _orientation(cx, cy, ex, ey, bx, by)
+        if (j - i) % n_edges in (1, n_edges - 1):
+            # Lados consecutivos: comparten un vértice y solo se cortan si el segundo vuelve
+            # sobre el primero (alineados y en sentido contrario)
+            first, second = (i, j) if (j - i) % n_edges == 1 else (j, i)
+            (px, py), (qx, qy), (rx, ry) = start_points[first], start_points[second], start_points[(second + 1) % n_edges]
+            return (_orientation(px, py, qx, qy, rx, ry) == 0
+                    and (qx - px) * (rx - qx) + (qy - py) * (ry - qy) < 0)
+        if o1 != o2 and o3 != o4:
+            return True
+        return ((o1 == 0 and _on_segment(ax, ay, bx, by, cx, cy))
+                or (o2 == 0 and _on_segment(ax, ay, bx, by, ex, ey))
+                or (o3 == 0 and _on_segment(cx, cy, ex, ey, ax, ay))
+                or (o4 == 0 and _on_segment(cx, cy, ex, ey, bx, by)))
+
+    sweep = {'x': 0.0}
+
+    def height(edge):
+        # Altura del lado en la posición actual del barrido (los verticales, por su extremo inferior).
+        # A igual altura, el de menor pendiente queda debajo a la derecha del barrido.
+        if vertical[edge]:
+            return left_y[edge], tie_slopes[edge]
+        return left_y[edge] + slopes[edge] * (sweep['x'] - left_x[edge]), tie_slopes[edge]
+
+    def report(i, j):
+        i, j = sorted((i, j))
+        return int(kept[i]), int(kept[j])
+
+    status = []  # lados que corta el barrido, de abajo arriba
+    for x, y, kind, edge in zip(event_x[order].tolist(), event_y[order].tolist(),
+                                event_kind[order].tolist(), event_edge[order].tolist()):
+        sweep['x'] = x
+        if kind == 0:
+            position = bisect.bisect_left(status, (y, tie_slopes[edge]), key=height)
+            status.insert(position, edge)
+            for neighbour in (position - 1, position + 1):
+                if 0 <= neighbour < len(status) and intersects(edge, status[neighbour]):
+                    return report(edge, status[neighbour])
+        else:
+            # Se busca por la clave del propio lado (los verticales, por su extremo inferior, como al
+            # entrar) y solo se avanza entre los lados empatados con ella
+            key = height(edge)
+            position = bisect.bisect_left(status, key, key=height)
+            while position < len(status) and status[position] != edge and height(status[position]) == key:
+                position += 1
+            if position == len(status) or status[position] != edge:
+                # Solo por redondeo en la altura de lados casi coincidentes
+                position = status.index(edge)
+            if 0 < position < len(status) - 1 and intersects(status[position - 1], status[position + 1]):
+                return report(status[position - 1], status[position + 1])
+            del status[position]
+    return None
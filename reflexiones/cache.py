@@ -0,0 +1,104 @@
+"""Caché LRU de figuras con límite de memoria."""
+
+import collections
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+# Límites configurables por variables de entorno
+FIGURE_CACHE_MAX_ENTRIES = int(os.environ.get('REFLEXIONES_FIGURE_CACHE_ENTRIES', 128))
+FIGURE_CACHE_MAX_MB = float(os.environ.get('REFLEXIONES_FIGURE_CACHE_MB', 256))
+
+
+def figure_cache_key(coords, kind, value, full_detail):
+    """
+    Clave de caché de una figura: hash del contenido de los vértices más los parámetros de la reflexión.
+    """
+    coords = np.ascontiguousarray(coords, dtype=np.float64)
+    digest = hashlib.blake2b(coords.tobytes(), digest_size=16).hexdigest()
+    return (digest, coords.shape, kind, value, full_detail)
+
+
+def estimate_figure_bytes(figure_data):
+    """Estimación de la memoria que ocupa una figura: sus arreglos de coordenadas y etiquetas más un margen fijo."""
+    total = 16_384  # layout, formas y anotaciones
+    for trace in figure_data['figure'].data:
+        for values in (trace.x, trace.y):
+            total += getattr(values, 'nbytes', 0)
+        if trace.text is not None and not isinstance(trace.text, str):
+            total += sum(len(label) + 56 for label in trace.text)
+    return total
+
+
+class FigureCache:
+    """
+    Caché LRU de figuras con límite de entradas y de memoria.
+
+    Es segura entre hilos, por lo que una sola instancia puede compartirse entre todas las sesiones:
+    las figuras guardadas no se modifican después de construirse.
+    """
+
+    def __init__(self, max_entries=FIGURE_CACHE_MAX_ENTRIES, max_bytes=FIGURE_CACHE_MAX_MB * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = collections.OrderedDict()  # clave -> (valor, bytes)
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key, build, size_of=estimate_figure_bytes):
+        """
+        Devuelve el valor guardado para `key`, o lo construye con `build()` y lo guarda.
+
+        Args:
+            key (hashable): Clave de la entrada (ver figure_cache_key).
+            build (callable): Función sin argumentos que construye el valor si no está en caché.
+            size_of (callable, optional): Función que estima los bytes que ocupa el valor.
+
+        Returns:
+            El valor guardado o recién construido.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        # La construcción ocurre fuera del candado para no bloquear a otras sesiones
+        value = build()
+        size = size_of(value)
+        with self._lock:
+            if key not in self._entries and size <= self.max_bytes:
+                self._entries[key] = (value, size)
+                self._bytes += size
+                while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                    _, (_, evicted_size) = self._entries.popitem(last=False)
+                    self._bytes -= evicted_size
+                    self.evictions += 1
+        return value
+
+    def stats(self):
+        """Contadores de la caché: aciertos, fallos, expulsiones, entradas y memoria usada."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self._bytes,
+                'max_bytes': int(self.max_bytes),
+            }
+
+    def clear(self):
+        """Vacía la caché (los contadores se conservan)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
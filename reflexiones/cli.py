@@ -0,0 +1,184 @@
+"""
+Reflexión por lotes de archivos de figuras desde la línea de comandos.
+
+Ejemplo:
+    python -m reflexiones figuras/ "extra/**/*.csv" --kind eje_y --output reflejadas/ --workers 8
+"""
+
+import argparse
+import concurrent.futures
+import glob
+import itertools
+import os
+import sys
+import time
+from pathlib import Path
+
+from .transforms import REFLECTION_PRESETS, reflect_points
+from .vertex_io import VERTEX_FILE_FORMATS, read_vertex_file, write_vertex_file
+
+
+def _glob_root(pattern):
+    """Parte fija de un patrón glob (los componentes antes del primer comodín); la carpeta que contiene a un archivo."""
+    parts = Path(pattern).parts
+    fixed = list(itertools.takewhile(lambda part: not glob.has_magic(part), parts))
+    if len(fixed) == len(parts):
+        return Path(pattern).parent
+    return Path(*fixed) if fixed else Path('.')
+
+
+def collect_inputs(patterns):
+    """
+    Expande directorios y patrones glob en una lista ordenada de archivos de figuras.
+
+    Los directorios aportan sus archivos con extensión compatible (sin recorrer subdirectorios);
+    los patrones admiten '**' para buscar de forma recursiva. Cada archivo se acompaña de su ruta
+    relativa a la raíz de donde salió (el directorio o la parte del patrón sin comodines), para
+    reproducir la misma estructura de carpetas en la salida.
+
+    Args:
+        patterns (list): Rutas de archivos o directorios, o patrones glob.
+
+    Returns:
+        list: Pares (ruta, ruta relativa a su raíz) sin repetir, en orden.
+    """
+    found = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            root = Path(pattern)
+            candidates = root.iterdir()
+        else:
+            root = _glob_root(pattern)
+            candidates = (Path(match) for match in glob.glob(pattern, recursive=True))
+        for path in candidates:
+            if path.is_file() and path.suffix.lower().lstrip('.') in VERTEX_FILE_FORMATS:
+                found.setdefault(path, path.relative_to(root))
+    return sorted(found.items())
+
+
+def output_paths(inputs, output_dir, file_format=None):
+    """
+    Ruta de salida de cada archivo: la misma ruta relativa bajo `output_dir`, con el sufijo
+    '_reflejada' y la extensión del formato de salida.
+
+    Args:
+        inputs (list): Pares (ruta, ruta relativa) devueltos por `collect_inputs`.
+        output_dir (Path): Directorio de salida.
+        file_format (str, optional): Formato de salida; por defecto, el de cada archivo.
+
+    Returns:
+        list: Rutas de salida, en el mismo orden que `inputs`.
+
+    Raises:
+        ValueError: Si dos archivos de entrada acabarían escribiendo en el mismo archivo (por
+            ejemplo, fig.csv y fig.npy con el mismo formato de salida).
+    """
+    outputs = {}
+    for path, relative in inputs:
+        extension = file_format or path.suffix.lower().lstrip('.')
+        target = output_dir / relative.parent / f"{relative.stem}_reflejada.{extension}"
+        if target in outputs:
+            raise ValueError(f"{outputs[target]} y {path} se escribirían en el mismo archivo {target}")
+        outputs[target] = path
+    return list(outputs)
+
+
+def _reflect_file(task):
+    """
+    Refleja un archivo y escribe el resultado. Se ejecuta en los procesos del pool.
+
+    Cualquier error se devuelve como texto en lugar de propagarse, para que un archivo dañado
+    no detenga el resto del lote.
+    """
+    input_path, output_path, kind, value = task
+    try:
+        coords = read_vertex_file(input_path)
+        write_vertex_file(output_path, reflect_points(coords, kind, value))
+    except (OSError, ValueError) as error:
+        return input_path, 0, str(error)
+    except Exception as error:
+        return input_path, 0, f"{type(error).__name__}: {error}"
+    return input_path, len(coords), None
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='python -m reflexiones',
+        description="Refleja por lotes archivos de vértices (CSV, NPY o Parquet).",
+    )
+    parser.add_argument('inputs', nargs='+', help="Archivos, directorios o patrones glob con las figuras.")
+    parser.add_argument('--kind', required=True, choices=sorted(REFLECTION_PRESETS), help="Tipo de reflexión.")
+    parser.add_argument('--value', type=float, default=0.0, help="Valor de k (y = k) o h (x = h).")
+    parser.add_argument('--line', type=float, nargs=3, metavar=('A', 'B', 'C'),
+                        help="Coeficientes de la recta ax + by + c = 0 (para --kind linea_general).")
+    parser.add_argument('--output', required=True, type=Path, help="Directorio donde se escriben los resultados.")
+    parser.add_argument('--format', choices=sorted(VERTEX_FILE_FORMATS),
+                        help="Formato de salida. Por defecto, el mismo que el de cada archivo de entrada.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Número de procesos.")
+    parser.add_argument('--chunksize', type=int, help="Archivos enviados a cada proceso por tanda.")
+    args = parser.parse_args(argv)
+    if args.kind == 'linea_general' and args.line is None:
+        parser.error("--kind linea_general requiere --line A B C")
+    if args.line is not None and args.line[0] == 0 and args.line[1] == 0:
+        parser.error("los coeficientes A y B no pueden ser ambos cero")
+    return args
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+
+    Returns:
+        int: 0 si todos los archivos se procesaron, 1 si alguno falló o no había archivos.
+    """
+    args = _parse_args(argv)
+    value = tuple(args.line) if args.kind == 'linea_general' else args.value
+
+    inputs = collect_inputs(args.inputs)
+    if not inputs:
+        print("No se encontraron archivos de figuras.", file=sys.stderr)
+        return 1
+
+    try:
+        outputs = output_paths(inputs, args.output, args.format)
+    except ValueError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    for directory in sorted({output.parent for output in outputs}):
+        directory.mkdir(parents=True, exist_ok=True)
+    tasks = [(path, output, args.kind, value) for (path, _), output in zip(inputs, outputs)]
+
+    workers = max(1, min(args.workers, len(tasks)))
+    # Tandas de varios archivos por proceso para repartir el coste de comunicación entre procesos
+    chunksize = args.chunksize or max(1, len(tasks) // (workers * 4))
+
+    start = time.perf_counter()
+    total_vertices = 0
+    failures = 0
+    if workers == 1:
+        results = map(_reflect_file, tasks)
+        executor = None
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(_reflect_file, tasks, chunksize=chunksize)
+    try:
+        # Cada proceso escribe su resultado en cuanto termina; aquí solo se van sumando los totales
+        for input_path, n_vertices, error in results:
+            if error is not None:
+                failures += 1
+                print(f"Error en {input_path}: {error}", file=sys.stderr)
+            total_vertices += n_vertices
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    elapsed = time.perf_counter() - start
+
+    processed = len(tasks) - failures
+    print(f"Archivos: {processed} procesados, {failures} con error · Vértices: {total_vertices} · "
+          f"Tiempo: {elapsed:.2f} s · {processed / elapsed:.1f} archivos/s · "
+          f"{total_vertices / elapsed:,.0f} vértices/s · Procesos: {workers}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,162 @@
+"""
+Textos de la aplicación: nombres de los vértices, explicación de cada reflexión y página de teoría.
+
+Son cadenas que no dependen de la sesión. Al estar en un módulo importado se preparan una sola vez
+por proceso, mientras que lo que se define en app.py se vuelve a crear en cada ejecución del script.
+"""
+
+import functools
+import string
+
+
+def vertex_label(i):
+    """Devuelve la etiqueta del vértice i: una letra mientras alcance el alfabeto, luego su número."""
+    return string.ascii_uppercase[i] if i < len(string.ascii_uppercase) else str(i + 1)
+
+
+@functools.lru_cache(maxsize=256)
+def explanation_markdown(kind, value=0):
+    """
+    Devuelve el texto Markdown que explica el tipo de reflexión seleccionado.
+
+    El resultado se memoriza para todo el proceso: el texto solo se construye una vez por combinación (kind, value).
+
+    Args:
+        kind (str): Tipo de reflexión (clave de REFLECTION_PRESETS).
+        value (float or tuple, optional): Valor k, h o coeficientes (a, b, c) de la línea de reflexión.
+
+    Returns:
+        str: Explicación en formato Markdown.
+    """
+    if kind == 'eje_x':
+        return """
+        Al **reflejar un punto (x, y) sobre el Eje X**, la coordenada $x$ permanece igual, mientras que la coordenada $y$ cambia de signo.
+        La fórmula de transformación es: $(x, y) \\rightarrow (x, -y)$.
+        Imagina que el Eje X es un espejo; el punto reflejado estará a la misma distancia del eje, pero en el lado opuesto.
+        """
+    elif kind == 'eje_y':
+        return """
+        Al **reflejar un punto (x, y) sobre el Eje Y**, la coordenada $y$ permanece igual, mientras que la coordenada $x$ cambia de signo.
+        La fórmula de transformación es: $(x, y) \\rightarrow (-x, y)$.
+        Piensa en el Eje Y como un espejo; el punto reflejado estará a la misma distancia del eje, pero al lado contrario.
+        """
+    elif kind == 'origen':
+        return """
+        Al **reflejar un punto (x, y) sobre el Origen (0,0)**, ambas coordenadas, $x$ e $y$, cambian de signo.
+        La fórmula de transformación es: $(x, y) \\rightarrow (-x, -y)$.
+        Es como realizar una reflexión sobre el Eje X y luego otra sobre el Eje Y (o viceversa).
+        """
+    elif kind == 'y_igual_x':
+        return """
+        Al **reflejar un punto (x, y) sobre la línea $y = x$**, las coordenadas $x$ e $y$ simplemente se intercambian.
+        La fórmula de transformación es: $(x, y) \\rightarrow (y, x)$.
+        Esta línea verde punteada en el gráfico es la línea $y=x$, sirviendo como el eje de reflexión.
+        """
+    elif kind == 'y_igual_menos_x':
+        return """
+        Al **reflejar un punto (x, y) sobre la línea $y = -x$**, las coordenadas $x$ e $y$ se intercambian y ambas cambian de signo.
+        La fórmula de transformación es: $(x, y) \\rightarrow (-y, -x)$.
+        La línea verde punteada en el gráfico es la línea $y=-x$, actuando como el eje de reflexión.
+        """
+    elif kind == 'linea_horizontal': # y = k
+        return f"""
+        Al **reflejar un punto (x, y) sobre una línea horizontal $y = k$** (donde $k$ es un valor constante), la coordenada $x$ permanece igual, y la nueva coordenada $y$ se calcula como $2k - y$.
+        La fórmula de transformación es: $(x, y) \\rightarrow (x, 2k - y)$.
+        En este caso, la línea de reflexión es $y = {value}$. El punto reflejado estará a la misma distancia vertical de esta línea que el punto original.
+        """
+    elif kind == 'linea_vertical': # x = h
+        return f"""
+        Al **reflejar un punto (x, y) sobre una línea vertical $x = h$** (donde $h$ es un valor constante), la coordenada $y$ permanece igual, y la nueva coordenada $x$ se calcula como $2h - x$.
+        La fórmula de transformación es: $(x, y) \\rightarrow (2h - x, y)$.
+        En este caso, la línea de reflexión es $x = {value}$. El punto reflejado estará a la misma distancia horizontal de esta línea que el punto original.
+        """
+    elif kind == 'linea_general': # ax + by + c = 0
+        line_a, line_b, line_c = value
+        return f"""
+        Al **reflejar un punto (x, y) sobre una recta cualquiera $ax + by + c = 0$**, el punto se desplaza perpendicularmente a la recta
+        el doble de su distancia a ella. Si $d = \\frac{{ax + by + c}}{{a^2 + b^2}}$, la fórmula de transformación es: $(x, y) \\rightarrow (x - 2ad, y - 2bd)$.
+        Las reflexiones sobre los ejes, sobre $y = \\pm x$ y sobre $y = k$ o $x = h$ son casos particulares: por ejemplo, el Eje X es la recta $0x + 1y + 0 = 0$.
+        La reflexión sobre el Origen no lo es: se refleja respecto de un punto y equivale a un giro de 180°.
+        En este caso, la línea de reflexión es ${line_a}x + {line_b}y + {line_c} = 0$.
+        """
+    else:
+        return """
+        Selecciona un tipo de reflexión del menú desplegable para ver su explicación y cómo transforma los puntos.
+        """
+
+
+# Página de teoría en un único documento Markdown, que se envía al navegador en un solo elemento
+THEORY_MARKDOWN = r"""
+---
+¡Hola, futuros genios de las matemáticas! Hoy vamos a explorar un concepto fascinante en geometría: la **reflexión**.
+
+## ¿Qué es una Reflexión?
+
+Imagina que tienes un espejo. Cuando te miras en él, ves una imagen de ti mismo que es exactamente igual, pero invertida. En matemáticas, la reflexión funciona de manera muy similar.
+Una **reflexión** (o simetría axial) es una **transformación geométrica** que "voltea" una figura o un punto sobre una línea, llamada **eje de reflexión**. Es como si doblaras el papel por el eje y la figura original coincidiera exactamente con su imagen reflejada.
+
+**Características clave de una reflexión:**
+* **Forma y tamaño:** La figura reflejada tiene la misma forma y el mismo tamaño que la figura original. No se estira ni se encoge.
+* **Orientación:** La orientación de la figura se invierte. Si la figura original se leía de izquierda a derecha, la reflejada se leerá de derecha a izquierda.
+* **Distancia:** Cada punto de la figura original está a la misma distancia del eje de reflexión que su punto correspondiente en la figura reflejada.
+
+## Tipos Comunes de Reflexiones en el Plano Cartesiano
+
+En el plano cartesiano (donde usamos coordenadas $x$ e $y$), hay varios ejes de reflexión que son muy comunes:
+
+### 1. Reflexión sobre el Eje X
+
+Cuando reflejamos un punto $(x, y)$ sobre el **Eje X**, la coordenada $x$ se mantiene igual, y la coordenada $y$ cambia de signo.
+* **Fórmula:** $(x, y) \rightarrow (x, -y)$
+* **Ejemplo:** Si el punto original es $(2, 3)$, su reflexión sobre el Eje X será $(2, -3)$.
+
+### 2. Reflexión sobre el Eje Y
+
+Cuando reflejamos un punto $(x, y)$ sobre el **Eje Y**, la coordenada $y$ se mantiene igual, y la coordenada $x$ cambia de signo.
+* **Fórmula:** $(x, y) \rightarrow (-x, y)$
+* **Ejemplo:** Si el punto original es $(2, 3)$, su reflexión sobre el Eje Y será $(-2, 3)$.
+
+### 3. Reflexión sobre el Origen
+
+Cuando reflejamos un punto $(x, y)$ sobre el **Origen (0,0)**, ambas coordenadas (x e y) cambian de signo.
+* **Fórmula:** $(x, y) \rightarrow (-x, -y)$
+* **Ejemplo:** Si el punto original es $(2, 3)$, su reflexión sobre el Origen será $(-2, -3)$.
+
+### 4. Reflexión sobre la línea $y = x$
+
+Cuando reflejamos un punto $(x, y)$ sobre la **línea $y = x$**, las coordenadas $x$ e $y$ simplemente se intercambian.
+* **Fórmula:** $(x, y) \rightarrow (y, x)$
+* **Ejemplo:** Si el punto original es $(2, 3)$, su reflexión sobre la línea $y=x$ será $(3, 2)$.
+
+### 5. Reflexión sobre la línea $y = -x$
+
+Cuando reflejamos un punto $(x, y)$ sobre la **línea $y = -x$**, las coordenadas $x$ e $y$ se intercambian y ambas cambian de signo.
+* **Fórmula:** $(x, y) \rightarrow (-y, -x)$
+* **Ejemplo:** Si el punto original es $(2, 3)$, su reflexión sobre la línea $y=-x$ será $(-3, -2)$.
+
+### 6. Reflexión sobre una Línea Horizontal ($y = k$)
+
+Cuando reflejamos un punto $(x, y)$ sobre una **línea horizontal $y = k$** (donde $k$ es un número), la coordenada $x$ permanece igual. La nueva coordenada $y$ se calcula como el doble de $k$ menos la $y$ original.
+* **Fórmula:** $(x, y) \rightarrow (x, 2k - y)$.
+* **Ejemplo:** Si el punto original es $(2, 3)$ y la línea de reflexión es $y = 5$ (es decir, $k=5$), la reflexión será $(2, 2*5 - 3) = (2, 10 - 3) = (2, 7)$.
+
+### 7. Reflexión sobre una Línea Vertical ($x = h$)
+
+Cuando reflejamos un punto $(x, y)$ sobre una **línea vertical $x = h$** (donde $h$ es un número), la coordenada $y$ permanece igual. La nueva coordenada $x$ se calcula como el doble de $h$ menos la $x$ original.
+* **Fórmula:** $(x, y) \rightarrow (2h - x, y)$.
+* **Ejemplo:** Si el punto original es $(2, 3)$ y la línea de reflexión es $x = 5$ (es decir, $h=5$), la reflexión será $(2*5 - 2, 3) = (10 - 2, 3) = (8, 3)$.
+
+### 8. Reflexión sobre una recta cualquiera ($ax + by + c = 0$)
+
+Las reflexiones anteriores sobre una recta (los ejes, $y = x$, $y = -x$, $y = k$ y $x = h$) son casos particulares de la reflexión sobre una recta general $ax + by + c = 0$. Cada punto se mueve perpendicularmente a la recta, el doble de su distancia a ella. La reflexión sobre el Origen no es uno de esos casos: se hace respecto de un punto, equivale a un giro de 180° y, a diferencia de las demás, no invierte el sentido de recorrido de la figura.
+* **Fórmula:** si $d = \frac{ax + by + c}{a^2 + b^2}$, entonces $(x, y) \rightarrow (x - 2ad, y - 2bd)$.
+* **Ejemplo:** Para la recta $y = x$ (es decir, $x - y = 0$, con $a=1$, $b=-1$, $c=0$) y el punto $(2, 3)$: $d = \frac{2 - 3}{2} = -\frac{1}{2}$, y la reflexión es $(2 + 1, 3 - 1) = (3, 2)$.
+* **Composición:** Las transformaciones se pueden encadenar. Por ejemplo, reflejar sobre el Eje X y luego sobre el Eje Y equivale a reflejar sobre el Origen. Una reflexión seguida de una traslación a lo largo del mismo eje se llama **reflexión con deslizamiento**.
+
+---
+¡Esperamos que esta teoría te ayude a comprender mejor las reflexiones! Ahora, puedes volver a la aplicación interactiva para poner en práctica lo aprendido.
+
+---
+
+Contenido diseñado para estudiantes de bachillerato/educación media.
+"""
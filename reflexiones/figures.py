@@ -0,0 +1,298 @@
+"""Construcción de la figura de Plotly con la figura original y la reflejada."""
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io
+
+from .content import vertex_label
+from .profiling import NULL_PROFILE
+from .scene import union_bounds
+from .simplify import simplify_indices
+from .transforms import reflect_points
+
+# Nivel de detalle para figuras grandes
+# A partir de este número de vértices la figura se simplifica (salvo en modo "Detalle completo")
+LOD_VERTEX_THRESHOLD = 1_000
+
+# Con más vértices que este umbral se dibuja con go.Scattergl (WebGL) en lugar de SVG
+WEBGL_VERTEX_THRESHOLD = 1_000
+
+# Número máximo de etiquetas "A (x, y)" por figura; por encima se muestra una muestra uniforme
+MAX_VERTEX_LABELS = 50
+
+# Error máximo permitido en la simplificación, en píxeles de pantalla
+LOD_TOLERANCE_PX = 0.5
+
+# Ancho aproximado del gráfico en píxeles, usado para convertir la tolerancia a unidades del plano
+PLOT_WIDTH_PX = 800
+
+# Plantilla 'plotly_white' reducida a lo que usa un gráfico cartesiano de dispersión.
+# La completa (mapas, 3D, escalas de color de todos los tipos de traza) añade ~7 KB a cada figura enviada.
+_WHITE = plotly.io.templates['plotly_white']
+PLOT_TEMPLATE = go.layout.Template(
+    data={trace_type: _WHITE.data[trace_type] for trace_type in ('scatter', 'scattergl')},
+    layout={key: _WHITE.layout[key] for key in ('annotationdefaults', 'font', 'hoverlabel', 'paper_bgcolor',
+                                                'plot_bgcolor', 'shapedefaults', 'title', 'xaxis', 'yaxis')},
+)
+
+
+def _wire_coordinates(values):
+    """
+    Coordenadas tal como se envían al navegador: en float32 (la mitad de bytes) solo si todas se
+    representan exactas en float32, como las enteras o las de pocos decimales binarios; si no, en
+    float64, para que el gráfico muestre lo mismo que las etiquetas.
+    """
+    compact = values.astype(np.float32)
+    return compact if np.array_equal(compact, values, equal_nan=True) else values
+
+
+def build_figure(original_points, kind, value=0, full_detail=False, profile=NULL_PROFILE):
+    """
+    Construye la figura de Plotly con la figura original, la reflejada y el eje de reflexión.
+
+    No usa Streamlit, de modo que su resultado se puede guardar en caché y compartir entre sesiones.
+
+    Args:
+        original_points (np.ndarray): Arreglo (N, 2) con los vértices originales (N >= 1).
+        kind (str): Tipo de reflexión (clave de REFLECTION_PRESETS).
+        value (float or tuple, optional): Valor k, h o coeficientes (a, b, c) de la línea de reflexión.
+        full_detail (bool, optional): Si es True, no se simplifica la figura ni se omiten etiquetas.
+        profile (RerunProfile, optional): Perfil donde se registran las fases 'reflexion',
+            'nivel_de_detalle' y 'construccion_figura'.
+
+    Returns:
+        dict: 'figure' (go.Figure), 'shown_vertices', 'total_vertices' y 'shown_labels'.
+    """
+    with profile.span('reflexion'):
+        reflected_points = reflect_points(original_points, kind, value)
+
+    with profile.span('nivel_de_detalle'):
+        # Si la figura debe ser cerrada, duplicamos el primer punto al final
+        plot_orig = original_points
+        plot_reflected = reflected_points
+        if len(original_points) > 1 and not np.array_equal(original_points[0], original_points[-1]):
+            plot_orig = np.vstack([original_points, original_points[:1]])
+            plot_reflected = np.vstack([reflected_points, reflected_points[:1]])
+
+        # Rango de los datos calculado con una sola reducción sobre ambos conjuntos
+        all_points = np.vstack([original_points, reflected_points])
+        x_min_data, y_min_data = all_points.min(axis=0).tolist()
+        x_max_data, y_max_data = all_points.max(axis=0).tolist()
+
+        padding = 1.5
+        x_range = [x_min_data - padding, x_max_data + padding]
+        y_range = [y_min_data - padding, y_max_data + padding]
+
+        # Nivel de detalle: las figuras grandes se simplifican con Douglas–Peucker usando una
+        # tolerancia equivalente a una fracción de píxel en la vista actual, y solo se rotula una muestra de vértices.
+        # La reflexión es una isometría, así que los mismos índices simplifican también la figura reflejada.
+        kept = np.arange(len(plot_orig))
+        if not full_detail and len(plot_orig) > LOD_VERTEX_THRESHOLD:
+            units_per_pixel = max(x_range[1] - x_range[0], y_range[1] - y_range[0]) / PLOT_WIDTH_PX
+            kept = simplify_indices(plot_orig, LOD_TOLERANCE_PX * units_per_pixel)
+        labeled = kept[kept < len(original_points)]
+        if not full_detail and len(labeled) > MAX_VERTEX_LABELS:
+            labeled = labeled[::-(-len(labeled) // MAX_VERTEX_LABELS)]
+
+        labels_orig = [f'{vertex_label(i)} ({x}, {y})'
+                       for i, (x, y) in zip(labeled.tolist(), original_points[labeled].tolist())]
+        labels_reflected = [f'{vertex_label(i)}\' ({x}, {y})'
+                            for i, (x, y) in zip(labeled.tolist(), reflected_points[labeled].tolist())]
+
+    with profile.span('construccion_figura'):
+        # Por encima del umbral se usa WebGL, que dibuja miles de puntos sin bloquear el navegador
+        scatter = go.Scattergl if len(kept) > WEBGL_VERTEX_THRESHOLD else go.Scatter
+
+        fig = go.Figure()
+
+        # Si se rotulan todos los vértices, las etiquetas van en las propias trazas de la figura;
+        # si solo una muestra, en trazas de solo texto con esos vértices, en lugar de enviar una
+        # cadena (casi siempre vacía) por cada punto
+        all_labeled = len(labeled) == len(kept[kept < len(original_points)])
+        if all_labeled:
+            text_orig = np.full(len(plot_orig), '', dtype=object)
+            text_reflected = np.full(len(plot_orig), '', dtype=object)
+            text_orig[labeled] = labels_orig
+            text_reflected[labeled] = labels_reflected
+            labeled_traces = dict(mode='lines+markers+text'), dict(mode='lines+markers+text')
+            labeled_traces[0].update(text=text_orig[kept].tolist(), textposition="top right")
+            labeled_traces[1].update(text=text_reflected[kept].tolist(), textposition="bottom left")
+        else:
+            labeled_traces = dict(mode='lines+markers'), dict(mode='lines+markers')
+
+        fig.add_trace(scatter(
+            x=_wire_coordinates(plot_orig[kept, 0]),
+            y=_wire_coordinates(plot_orig[kept, 1]),
+            name='Figura Original',
+            line=dict(color='blue', width=2),
+            marker=dict(size=8, color='blue'),
+            **labeled_traces[0],
+        ))
+
+        fig.add_trace(scatter(
+            x=_wire_coordinates(plot_reflected[kept, 0]),
+            y=_wire_coordinates(plot_reflected[kept, 1]),
+            name='Figura Reflejada',
+            line=dict(color='red', width=2, dash='dash'),
+            marker=dict(size=8, color='red'),
+            **labeled_traces[1],
+        ))
+
+        if not all_labeled:
+            for points, labels, position in ((original_points, labels_orig, "top right"),
+                                             (reflected_points, labels_reflected, "bottom left")):
+                fig.add_trace(go.Scatter(
+                    x=points[labeled, 0], y=points[labeled, 1],
+                    mode='text', text=labels, textposition=position,
+                    showlegend=False, hoverinfo='skip',
+                ))
+
+        _add_reflection_guide(fig, kind, value, x_range, y_range)
+        _apply_plot_layout(fig, x_range, y_range, 'Figuras Original y Reflejada con Vértices')
+
+    return {
+        'figure': fig,
+        'shown_vertices': len(kept),
+        'total_vertices': len(plot_orig),
+        'shown_labels': len(labeled),
+    }
+
+
+def _scene_polylines(scene, indices):
+    """
+    Coordenadas de las figuras `indices` de la escena como una sola polilínea: cada figura se
+    cierra repitiendo su primer vértice y va seguida de un NaN, que Plotly dibuja como un corte.
+    """
+    starts = scene.offsets[indices]
+    lengths = scene.offsets[indices + 1] - starts
+    out_lengths = lengths + 2
+    segment = np.repeat(np.arange(len(indices)), out_lengths)
+    local = np.arange(out_lengths.sum()) - np.repeat(np.cumsum(out_lengths) - out_lengths, out_lengths)
+    segment_lengths = lengths[segment]
+    xy = scene.coords[starts[segment] + np.where(local < segment_lengths, local, 0)]
+    xy[local == segment_lengths + 1] = np.nan
+    return xy
+
+
+def build_scene_figure(scene, reflected, kind, value=0, viewport=None, profile=NULL_PROFILE):
+    """
+    Construye la figura de Plotly de una escena con muchas figuras y sus reflejadas.
+
+    Solo se envían al navegador las figuras cuya caja envolvente se solapa con la ventana
+    visible, consultando el índice espacial de cada escena. Todas las figuras originales van en
+    una única traza (y las reflejadas en otra), separadas por NaN.
+
+    Args:
+        scene (Scene): Escena original.
+        reflected (Scene): Escena reflejada (scene.reflect(kind, value)).
+        kind (str): Tipo de reflexión, para dibujar el eje.
+        value (float or tuple, optional): Valor k, h o coeficientes (a, b, c) de la línea de reflexión.
+        viewport (tuple, optional): (x_min, y_min, x_max, y_max) visible. Por defecto, las dos escenas completas.
+        profile (RerunProfile, optional): Perfil donde se registran las fases 'consulta_visibles'
+            y 'construccion_figura'.
+
+    Returns:
+        dict: 'figure' (go.Figure), 'shown_figures', 'total_figures' y 'shown_vertices'.
+    """
+    if viewport is None:
+        viewport = union_bounds(scene.bounds, reflected.bounds)
+    x_range = [viewport[0], viewport[2]]
+    y_range = [viewport[1], viewport[3]]
+
+    with profile.span('consulta_visibles'):
+        visible_orig = scene.visible(viewport)
+        visible_reflected = reflected.visible(viewport)
+
+    with profile.span('construccion_figura'):
+        orig_xy = _scene_polylines(scene, visible_orig)
+        reflected_xy = _scene_polylines(reflected, visible_reflected)
+        shown_vertices = int(np.count_nonzero(~np.isnan(orig_xy[:, 0])) + np.count_nonzero(~np.isnan(reflected_xy[:, 0])))
+        scatter = go.Scattergl if shown_vertices > WEBGL_VERTEX_THRESHOLD else go.Scatter
+
+        fig = go.Figure()
+        fig.add_trace(scatter(x=orig_xy[:, 0], y=orig_xy[:, 1], mode='lines', name='Figuras Originales',
+                              line=dict(color='blue', width=1)))
+        fig.add_trace(scatter(x=reflected_xy[:, 0], y=reflected_xy[:, 1], mode='lines', name='Figuras Reflejadas',
+                              line=dict(color='red', width=1, dash='dash')))
+        _add_reflection_guide(fig, kind, value, x_range, y_range)
+        _apply_plot_layout(fig, x_range, y_range, 'Escena: Figuras Originales y Reflejadas')
+
+    return {
+        'figure': fig,
+        'shown_figures': len(visible_orig) + len(visible_reflected),
+        'total_figures': 2 * len(scene),
+        'shown_vertices': shown_vertices,
+    }
+
+
+def _add_reflection_guide(fig, kind, value, x_range, y_range):
+    """Dibuja en la figura el eje o la recta de reflexión, con su rótulo, dentro de los rangos dados."""
+    if kind == 'eje_x':
+        fig.add_shape(type="line", x0=x_range[0], y0=0, x1=x_range[1], y1=0,
+                      line=dict(color="green", width=2, dash="dot"), name="Eje X")
+        fig.add_annotation(x=x_range[1] * 0.9, y=0.5, text="Eje X", showarrow=False, font=dict(color="green"))
+    elif kind == 'eje_y':
+        fig.add_shape(type="line", x0=0, y0=y_range[0], x1=0, y1=y_range[1],
+                      line=dict(color="green", width=2, dash="dot"), name="Eje Y")
+        fig.add_annotation(x=0.5, y=y_range[1] * 0.9, text="Eje Y", showarrow=False, font=dict(color="green"))
+    elif kind == 'y_igual_x':
+        # Una recta se dibuja con sus dos extremos, como forma, en lugar de una traza de 100 puntos
+        low, high = min(x_range[0], y_range[0]), max(x_range[1], y_range[1])
+        fig.add_shape(type="line", x0=low, y0=low, x1=high, y1=high,
+                      line=dict(color="green", width=2, dash="dot"), name="y = x")
+        fig.add_annotation(x=high, y=high, text="y = x", showarrow=False, font=dict(color="green"))
+    elif kind == 'y_igual_menos_x':
+        low, high = min(x_range[0], y_range[0]), max(x_range[1], y_range[1])
+        fig.add_shape(type="line", x0=low, y0=-low, x1=high, y1=-high,
+                      line=dict(color="green", width=2, dash="dot"), name="y = -x")
+        fig.add_annotation(x=low, y=-low, text="y = -x", showarrow=False, font=dict(color="green"))
+    elif kind == 'linea_horizontal':
+        fig.add_shape(type="line", x0=x_range[0], y0=value, x1=x_range[1], y1=value,
+                      line=dict(color="green", width=2, dash="dot"), name=f"y = {value}")
+        fig.add_annotation(x=x_range[1] * 0.9, y=value + 0.5, text=f"y = {value}", showarrow=False, font=dict(color="green"))
+    elif kind == 'linea_vertical':
+        fig.add_shape(type="line", x0=value, y0=y_range[0], x1=value, y1=y_range[1],
+                      line=dict(color="green", width=2, dash="dot"), name=f"x = {value}")
+        fig.add_annotation(x=value + 0.5, y=y_range[1] * 0.9, text=f"x = {value}", showarrow=False, font=dict(color="green"))
+    elif kind == 'linea_general':
+        line_a, line_b, line_c = value
+        line_name = f"{line_a}x + {line_b}y + {line_c} = 0"
+        if line_b != 0:
+            x0, x1 = x_range
+            y0, y1 = -(line_a * x0 + line_c) / line_b, -(line_a * x1 + line_c) / line_b
+        else:
+            x0 = x1 = -line_c / line_a
+            y0, y1 = y_range
+        fig.add_shape(type="line", x0=x0, y0=y0, x1=x1, y1=y1,
+                      line=dict(color="green", width=2, dash="dot"), name=line_name)
+        fig.add_annotation(x=x1, y=y1, text=line_name, showarrow=False, font=dict(color="green"))
+
+
+def _apply_plot_layout(fig, x_range, y_range, title):
+    """Aplica el diseño común de los gráficos: título, ejes con cuadrícula y rangos fijos."""
+    fig.update_layout(
+        title_text=title,
+        title_x=0.5,
+        xaxis_title='Eje X',
+        yaxis_title='Eje Y',
+        hovermode='closest',
+        showlegend=True,
+        xaxis=dict(
+            zeroline=True, zerolinecolor='lightgray', zerolinewidth=1,
+            gridcolor='lightgray', gridwidth=1,
+            range=x_range
+        ),
+        yaxis=dict(
+            zeroline=True, zerolinecolor='lightgray', zerolinewidth=1,
+            gridcolor='lightgray', gridwidth=1,
+            range=y_range
+        ),
+        template=PLOT_TEMPLATE,
+        width=800,
+        height=600
+    )
+
+
+def figure_payload_bytes(fig):
+    """Bytes del JSON que se envía al navegador para dibujar la figura (la misma serialización que usa st.plotly_chart)."""
+    return len(plotly.io.to_json(fig, validate=False).encode('utf-8'))
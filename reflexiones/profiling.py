@@ -0,0 +1,75 @@
+"""Medición por fases de cada ejecución de la aplicación."""
+
+import contextlib
+import json
+import threading
+import time
+
+# Variable de entorno con la ruta del archivo JSON Lines donde se guarda cada ejecución
+PROFILE_LOG_ENV = 'REFLEXIONES_PROFILE_LOG'
+
+_NULL_SPAN = contextlib.nullcontext()
+_log_lock = threading.Lock()
+
+
+class RerunProfile:
+    """
+    Tiempos de las fases de una ejecución (rerun) de la aplicación, más métricas asociadas.
+
+    Cuando está desactivado, span() devuelve siempre el mismo contexto vacío y record() no hace
+    nada, de modo que el coste de dejar la instrumentación en el código es prácticamente nulo.
+    """
+
+    def __init__(self, enabled=True, scope='app'):
+        self.enabled = enabled
+        self.scope = scope  # 'app' para una ejecución completa, o el nombre del fragmento que se volvió a ejecutar
+        self.closed = False
+        self.spans = []  # (nombre, duración en segundos), en orden de finalización
+        self.metrics = {}
+        self._start = time.perf_counter()
+
+    def span(self, name):
+        """Contexto que mide el tiempo de la fase `name`."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append((name, time.perf_counter() - start))
+
+    def record(self, **metrics):
+        """Guarda métricas de la ejecución, por ejemplo el número de vértices o los bytes enviados."""
+        if self.enabled:
+            self.metrics.update(metrics)
+
+    def total_seconds(self):
+        """Tiempo transcurrido desde que se creó el perfil."""
+        return time.perf_counter() - self._start
+
+    def to_record(self, **extra):
+        """Representación serializable de la ejecución (tiempos en milisegundos)."""
+        return {
+            'timestamp': time.time(),
+            'scope': self.scope,
+            'total_ms': self.total_seconds() * 1e3,
+            'spans': [{'name': name, 'ms': seconds * 1e3} for name, seconds in self.spans],
+            **self.metrics,
+            **extra,
+        }
+
+    def write_jsonl(self, path, **extra):
+        """Añade la ejecución como una línea JSON al archivo indicado (seguro entre sesiones)."""
+        if not self.enabled:
+            return
+        line = json.dumps(self.to_record(**extra), ensure_ascii=False)
+        with _log_lock, open(path, 'a', encoding='utf-8') as log_file:
+            log_file.write(line + '\n')
+
+
+# Perfil desactivado compartido, para código que no quiere medir nada
+NULL_PROFILE = RerunProfile(enabled=False)
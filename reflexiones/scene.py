@@ -0,0 +1,171 @@
+"""Escenas con muchas figuras: vértices en un único arreglo, cajas envolventes e índice espacial."""
+
+import numpy as np
+
+from .transforms import apply_transform, reflection_preset
+
+# Una figura que ocupa más celdas que estas no se reparte por la rejilla: se comprueba siempre
+MAX_CELLS_PER_FIGURE = 64
+
+
+def _figure_bboxes(coords, offsets):
+    """Cajas envolventes (F, 4) [x_min, y_min, x_max, y_max] de cada figura, en una sola pasada."""
+    starts = offsets[:-1]
+    mins = np.minimum.reduceat(coords, starts, axis=0)
+    maxs = np.maximum.reduceat(coords, starts, axis=0)
+    return np.hstack([mins, maxs])
+
+
+def _gather_segments(starts, lengths):
+    """Concatena los rangos [start, start + length) sin bucles de Python."""
+    total = int(lengths.sum())
+    segment_starts = np.cumsum(lengths) - lengths
+    return np.repeat(starts - segment_starts, lengths) + np.arange(total)
+
+
+class UniformGridIndex:
+    """
+    Índice espacial de cajas envolventes sobre una rejilla uniforme.
+
+    La rejilla tiene del orden de una celda por figura. Cada caja se registra en las celdas que
+    cubre, guardadas en formato CSR (figuras ordenadas por celda más el inicio de cada celda), de
+    modo que una consulta solo revisa las figuras de las celdas que toca la ventana y después
+    descarta con una comparación vectorizada las que no se solapan de verdad.
+    """
+
+    def __init__(self, bboxes, bounds):
+        self.bboxes = bboxes
+        self.bounds = bounds
+        x_min, y_min, x_max, y_max = bounds
+        cells_per_side = max(1, int(np.sqrt(len(bboxes))))
+        self.shape = (cells_per_side, cells_per_side)
+        self.cell_size = (max(x_max - x_min, 1e-12) / cells_per_side, max(y_max - y_min, 1e-12) / cells_per_side)
+
+        cx0, cy0 = self._cells(bboxes[:, 0], bboxes[:, 1])
+        cx1, cy1 = self._cells(bboxes[:, 2], bboxes[:, 3])
+        widths = cx1 - cx0 + 1
+        counts = widths * (cy1 - cy0 + 1)
+
+        # Las figuras muy grandes llenarían muchas celdas; se guardan aparte y se comprueban siempre
+        oversized = counts > MAX_CELLS_PER_FIGURE
+        self.oversized = np.flatnonzero(oversized)
+        figures = np.flatnonzero(~oversized)
+        counts = counts[figures]
+
+        figure_of_entry = np.repeat(figures, counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        entry_widths = widths[figure_of_entry]
+        cells = ((cy0[figure_of_entry] + local // entry_widths) * cells_per_side
+                 + cx0[figure_of_entry] + local % entry_widths)
+
+        order = np.argsort(cells, kind='stable')
+        self.cell_figures = figure_of_entry[order]
+        self.cell_starts = np.searchsorted(cells[order], np.arange(cells_per_side ** 2 + 1))
+
+    def _cells(self, x, y):
+        nx, ny = self.shape
+        cx = np.clip(((x - self.bounds[0]) / self.cell_size[0]).astype(np.int64), 0, nx - 1)
+        cy = np.clip(((y - self.bounds[1]) / self.cell_size[1]).astype(np.int64), 0, ny - 1)
+        return cx, cy
+
+    def query(self, viewport):
+        """
+        Figuras cuya caja envolvente se solapa con la ventana.
+
+        Args:
+            viewport (tuple): (x_min, y_min, x_max, y_max) de la zona visible.
+
+        Returns:
+            np.ndarray: Índices de las figuras visibles, en orden creciente.
+        """
+        x_min, y_min, x_max, y_max = viewport
+        if x_max < self.bounds[0] or x_min > self.bounds[2] or y_max < self.bounds[1] or y_min > self.bounds[3]:
+            return np.empty(0, dtype=np.int64)
+
+        (cx0, cx1), (cy0, cy1) = (np.sort(axis) for axis in self._cells(np.array([x_min, x_max]), np.array([y_min, y_max])))
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) * 2 > self.shape[0] * self.shape[1]:
+            # La ventana cubre casi toda la escena: es más barato comprobar todas las cajas
+            candidates = np.arange(len(self.bboxes))
+        else:
+            rows = np.arange(cy0, cy1 + 1)[:, None] * self.shape[0]
+            cells = (rows + np.arange(cx0, cx1 + 1)[None, :]).ravel()
+            starts = self.cell_starts[cells]
+            entries = _gather_segments(starts, self.cell_starts[cells + 1] - starts)
+            candidates = np.unique(np.concatenate([self.cell_figures[entries], self.oversized]))
+
+        boxes = self.bboxes[candidates]
+        overlaps = (boxes[:, 0] <= x_max) & (boxes[:, 2] >= x_min) & (boxes[:, 1] <= y_max) & (boxes[:, 3] >= y_min)
+        return candidates[overlaps]
+
+
+class Scene:
+    """
+    Conjunto de figuras (polígonos) guardadas una tras otra en un único arreglo (M, 2) de float64.
+
+    `offsets` marca dónde empieza cada figura (formato CSR): la figura i son las filas
+    offsets[i]:offsets[i + 1]. Las cajas envolventes de todas las figuras se calculan una vez al
+    crear la escena, los límites de la escena se obtienen reduciendo esas cajas y el índice
+    espacial se construye la primera vez que se consulta.
+    """
+
+    def __init__(self, coords, offsets, names=None):
+        self.coords = np.ascontiguousarray(coords, dtype=np.float64).reshape(-1, 2)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        if len(self.offsets) < 2:
+            raise ValueError("La escena debe tener al menos una figura.")
+        if np.any(np.diff(self.offsets) < 1) or self.offsets[0] != 0 or self.offsets[-1] != len(self.coords):
+            raise ValueError("Cada figura de la escena debe tener al menos un vértice.")
+        self.names = list(names) if names is not None else [f"Figura {i + 1}" for i in range(len(self.offsets) - 1)]
+        self.bboxes = _figure_bboxes(self.coords, self.offsets)
+        self.bounds = tuple(np.concatenate([self.bboxes[:, :2].min(axis=0), self.bboxes[:, 2:].max(axis=0)]).tolist())
+        self._index = None
+
+    @classmethod
+    def from_figures(cls, figures, names=None):
+        """
+        Crea una escena a partir de una lista de arreglos (N_i, 2).
+
+        Raises:
+            ValueError: Si no hay figuras o alguna no tiene vértices.
+        """
+        figures = [np.asarray(figure, dtype=np.float64).reshape(-1, 2) for figure in figures]
+        if not figures:
+            raise ValueError("La escena debe tener al menos una figura.")
+        offsets = np.concatenate([[0], np.cumsum([len(figure) for figure in figures])])
+        return cls(np.concatenate(figures), offsets, names)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def vertex_count(self):
+        return len(self.coords)
+
+    def figure(self, i):
+        """Vista (N_i, 2) de los vértices de la figura i."""
+        return self.coords[self.offsets[i]:self.offsets[i + 1]]
+
+    @property
+    def index(self):
+        """Índice espacial de las cajas envolventes (UniformGridIndex)."""
+        if self._index is None:
+            self._index = UniformGridIndex(self.bboxes, self.bounds)
+        return self._index
+
+    def visible(self, viewport):
+        """Índices de las figuras que se solapan con la ventana (x_min, y_min, x_max, y_max)."""
+        return self.index.query(viewport)
+
+    def transform(self, matrix):
+        """Aplica una matriz homogénea 3x3 a todas las figuras en una sola operación y devuelve la nueva escena."""
+        return Scene(apply_transform(self.coords, matrix), self.offsets, self.names)
+
+    def reflect(self, kind, value=0):
+        """Refleja todas las figuras de la escena (ver reflect_points)."""
+        return self.transform(reflection_preset(kind, value))
+
+
+def union_bounds(*bounds):
+    """Caja (x_min, y_min, x_max, y_max) que contiene todas las cajas dadas."""
+    boxes = np.array(bounds, dtype=np.float64)
+    return tuple(np.concatenate([boxes[:, :2].min(axis=0), boxes[:, 2:].max(axis=0)]).tolist())
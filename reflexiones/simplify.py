@@ -0,0 +1,48 @@
+"""Simplificación de polilíneas para dibujar figuras grandes."""
+
+import numpy as np
+
+
+def simplify_indices(coords, tolerance):
+    """
+    Simplifica una polilínea con el algoritmo de Douglas–Peucker.
+
+    El error está acotado: ningún vértice descartado queda a más de `tolerance` del tramo simplificado
+    que lo sustituye (distancia al segmento, no a la recta que lo contiene).
+    Las distancias de cada tramo se calculan de forma vectorizada con NumPy.
+
+    Args:
+        coords (np.ndarray): Arreglo (N, 2) con los vértices de la polilínea.
+        tolerance (float): Distancia máxima permitida, en unidades del plano.
+
+    Returns:
+        np.ndarray: Índices ordenados de los vértices que se conservan (siempre incluye el primero y el último).
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    n = len(coords)
+    if n < 3 or tolerance <= 0:
+        return np.arange(n)
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        relative = coords[start + 1:end] - coords[start]
+        direction = coords[end] - coords[start]
+        squared_length = direction @ direction
+        # Distancia al segmento, no a la recta: la proyección se recorta a [0, 1] para que los
+        # vértices alineados que se salen del tramo (picos de ida y vuelta) cuenten su distancia
+        # al extremo. Con un tramo cerrado (inicio y fin coinciden) es la distancia al punto.
+        t = np.clip(relative @ direction / squared_length, 0.0, 1.0) if squared_length else np.zeros(len(relative))
+        offsets = relative - t[:, None] * direction
+        distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            index = start + 1 + farthest
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+    return np.flatnonzero(keep)
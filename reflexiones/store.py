@@ -0,0 +1,109 @@
+"""Almacén compacto de vértices respaldado por un único arreglo float64."""
+
+import numpy as np
+
+# Capacidad mínima del búfer, en vértices
+MIN_CAPACITY = 16
+
+
+class VertexStore:
+    """
+    Conjunto ordenado de vértices guardado en un búfer contiguo (capacidad, 2) de float64.
+
+    Ocupa 16 bytes por vértice (más la capacidad libre), frente a los cientos de bytes de una
+    lista de diccionarios. Añadir al final es O(1) amortizado: el búfer duplica su capacidad
+    cuando se llena. Quitar el último vértice es O(1); quitar uno intermedio desplaza los
+    siguientes con una sola copia de memoria dentro del mismo búfer, sin reservar memoria nueva,
+    porque el orden de los vértices define la figura. El búfer se reduce a la mitad cuando
+    queda ocupado menos de un cuarto.
+
+    Los consumidores leen `coords`, una vista (N, 2) sin copias del búfer.
+    """
+
+    def __init__(self, coords=None):
+        coords = np.empty((0, 2)) if coords is None else np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        self._buffer = np.empty((max(MIN_CAPACITY, len(coords)), 2), dtype=np.float64)
+        self._size = len(coords)
+        self._buffer[:self._size] = coords
+
+    @property
+    def coords(self):
+        """Vista (N, 2) de los vértices. Escribir en ella modifica el almacén."""
+        return self._buffer[:self._size]
+
+    @property
+    def capacity(self):
+        """Número de vértices que caben sin volver a reservar memoria."""
+        return len(self._buffer)
+
+    @property
+    def nbytes(self):
+        """Bytes que ocupa el búfer (incluida la capacidad libre)."""
+        return self._buffer.nbytes
+
+    def __len__(self):
+        return self._size
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Protocolo de NumPy: np.asarray(store) devuelve la vista `coords`; np.array(store) o
+        copy=True, una copia independiente del almacén.
+
+        Raises:
+            ValueError: Si copy=False y el cambio a `dtype` obliga a copiar.
+        """
+        coords = self.coords
+        if dtype is None or np.dtype(dtype) == coords.dtype:
+            return coords.copy() if copy else coords
+        if copy is False:
+            raise ValueError("no se puede convertir el tipo de los vértices sin copiarlos")
+        return coords.astype(dtype)
+
+    def _resize(self, capacity):
+        buffer = np.empty((max(MIN_CAPACITY, capacity), 2), dtype=np.float64)
+        buffer[:self._size] = self._buffer[:self._size]
+        self._buffer = buffer
+
+    def append(self, x, y):
+        """Añade un vértice al final (O(1) amortizado)."""
+        if self._size == len(self._buffer):
+            self._resize(2 * len(self._buffer))
+        self._buffer[self._size] = (x, y)
+        self._size += 1
+
+    def extend(self, coords):
+        """Añade varios vértices al final con una sola copia."""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        needed = self._size + len(coords)
+        if needed > len(self._buffer):
+            self._resize(max(needed, 2 * len(self._buffer)))
+        self._buffer[self._size:needed] = coords
+        self._size = needed
+
+    def remove(self, index):
+        """
+        Elimina el vértice `index` conservando el orden de los demás.
+
+        Raises:
+            IndexError: Si el índice está fuera de rango.
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("índice de vértice fuera de rango")
+        # Copia solapada dentro del mismo búfer (memmove); para el último vértice no copia nada
+        self._buffer[index:self._size - 1] = self._buffer[index + 1:self._size]
+        self._size -= 1
+        if len(self._buffer) > MIN_CAPACITY and self._size < len(self._buffer) // 4:
+            self._resize(len(self._buffer) // 2)
+
+    def replace(self, coords):
+        """Sustituye todos los vértices; reutiliza el búfer si tiene capacidad suficiente."""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        if len(coords) > len(self._buffer) or len(coords) < len(self._buffer) // 4:
+            self._buffer = np.empty((max(MIN_CAPACITY, len(coords)), 2), dtype=np.float64)
+        self._buffer[:len(coords)] = coords
+        self._size = len(coords)
+
+    def __repr__(self):
+        return f"VertexStore(n={self._size}, capacity={len(self._buffer)})"
@@ -0,0 +1,236 @@
+"""Detección de simetrías: ¿la figura coincide consigo misma tras una reflexión?"""
+
+import numpy as np
+
+from .transforms import reflection_preset
+
+# Tolerancia por defecto, relativa al tamaño de la figura
+DEFAULT_RELATIVE_TOLERANCE = 1e-9
+
+# Lado de las celdas de la rejilla de búsqueda, en múltiplos de la tolerancia
+CELL_SIZE_TOLERANCES = 4
+
+
+def default_tolerance(coords):
+    """Tolerancia absoluta para comparar vértices: DEFAULT_RELATIVE_TOLERANCE por la extensión de la figura."""
+    extent = float(np.ptp(coords, axis=0).max()) if len(coords) else 0.0
+    return DEFAULT_RELATIVE_TOLERANCE * max(1.0, extent)
+
+
+def distinct_vertices(coords):
+    """Vértices de la figura sin el último si repite el primero (polígono cerrado a mano)."""
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    if len(coords) > 1 and np.array_equal(coords[0], coords[-1]):
+        return coords[:-1]
+    return coords
+
+
+def _axis_neighbours(unique, values):
+    """
+    Posición en `unique` (ordenado) de values - 1, values y values + 1, y si están presentes.
+
+    Solo hace una búsqueda binaria: las celdas vecinas ocupadas, si existen, son las contiguas
+    en `unique`.
+    """
+    last = len(unique) - 1
+    own = np.searchsorted(unique, values)
+    own_present = unique[np.minimum(own, last)] == values
+    below = np.maximum(own - 1, 0)
+    above = np.minimum(own + own_present, last)
+    return {
+        -1: (below, (own > 0) & (unique[below] == values - 1)),
+        0: (np.minimum(own, last), own_present),
+        1: (above, unique[above] == values + 1),
+    }
+
+
+def match_points(points, queries, tolerance):
+    """
+    Para cada punto de `queries`, busca un punto de `points` a distancia menor o igual que `tolerance`
+    (en cada coordenada).
+
+    Los puntos se reparten en una rejilla de celdas de lado CELL_SIZE_TOLERANCES * tolerance,
+    identificadas por un entero y ordenadas; cada consulta busca con búsqueda binaria en su celda
+    y, solo si está a menos de `tolerance` de un borde, en la celda vecina de ese lado.
+    Los puntos repetidos se guardan una sola vez, así que muchos vértices en el mismo lugar no
+    alargan la búsqueda en su celda. El coste total es O((N + M) log N), sin comparar todos los pares.
+
+    Args:
+        points (np.ndarray): Arreglo (N, 2) de puntos de referencia.
+        queries (np.ndarray): Arreglo (M, 2) de puntos a buscar.
+        tolerance (float): Distancia máxima por coordenada para considerar que dos puntos coinciden.
+
+    Returns:
+        np.ndarray: Arreglo (M,) con el índice en `points` del punto encontrado (el primero, si está
+            repetido), o -1 si no hay ninguno.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    queries = np.asarray(queries, dtype=np.float64).reshape(-1, 2)
+    mapping = np.full(len(queries), -1, dtype=np.int64)
+    if len(points) == 0 or len(queries) == 0:
+        return mapping
+    # Cada posición repetida se busca una vez; `first` guarda el primer índice de cada una
+    points, first = np.unique(points, axis=0, return_index=True)
+
+    origin = points.min(axis=0)
+    cell_size = CELL_SIZE_TOLERANCES * tolerance
+    cells = np.floor((points - origin) / cell_size).astype(np.int64)
+    # Las consultas lejanas se recortan justo fuera de la rejilla para no desbordar los enteros
+    scaled = np.clip((queries - origin) / cell_size, -2, cells.max() + 2)
+    query_cells = np.floor(scaled).astype(np.int64)
+    # Lado de la celda por el que la consulta está a menos de una tolerancia del borde (-1, 0 o 1)
+    offset = (scaled - query_cells) * cell_size
+    near = np.where(offset < tolerance, -1, np.where(cell_size - offset <= tolerance, 1, 0))
+
+    # Las celdas ocupadas se numeran por su posición en los valores únicos de cada eje,
+    # de modo que la clave combinada nunca pasa de N * N
+    unique_x, unique_y = np.unique(cells[:, 0]), np.unique(cells[:, 1])
+    keys = np.searchsorted(unique_x, cells[:, 0]) * len(unique_y) + np.searchsorted(unique_y, cells[:, 1])
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    # Primero la propia celda, donde cae casi toda coincidencia; después las vecinas, solo para
+    # las consultas que están cerca del borde correspondiente
+    columns_x = _axis_neighbours(unique_x, query_cells[:, 0])
+    columns_y = _axis_neighbours(unique_y, query_cells[:, 1])
+    neighbours = [(0, 0)] + [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+    for dx, dy in neighbours:
+        ix, present_x = columns_x[dx]
+        iy, present_y = columns_y[dy]
+        reachable = (mapping < 0) & present_x & present_y
+        if dx:
+            reachable &= near[:, 0] == dx
+        if dy:
+            reachable &= near[:, 1] == dy
+        pending = np.flatnonzero(reachable)
+        query_keys = ix[pending] * len(unique_y) + iy[pending]
+        lo = np.searchsorted(sorted_keys, query_keys, side='left')
+        hi = np.searchsorted(sorted_keys, query_keys, side='right')
+
+        # Casi siempre hay un único punto por celda; si hay más, se prueban por turnos
+        for depth in range(int((hi - lo).max(initial=0))):
+            live = (lo + depth < hi) & (mapping[pending] < 0)
+            candidates = order[lo[live] + depth]
+            close = np.all(np.abs(points[candidates] - queries[pending[live]]) <= tolerance, axis=1)
+            mapping[pending[live][close]] = candidates[close]
+    return np.where(mapping >= 0, first[mapping], -1)
+
+
+def _format_number(number):
+    # Los residuos de redondeo (por ejemplo 1e-17 en lugar de 0) se muestran como 0
+    return f"{0.0 if abs(number) < 1e-12 else number:.6g}"
+
+
+def symmetry_label(kind, value=0):
+    """Nombre legible de un eje o centro de simetría."""
+    names = {'eje_x': "Eje X", 'eje_y': "Eje Y", 'origen': "Origen", 'y_igual_x': "y = x", 'y_igual_menos_x': "y = -x"}
+    if kind in names:
+        return names[kind]
+    if kind == 'linea_horizontal':
+        return f"y = {_format_number(value)}"
+    if kind == 'linea_vertical':
+        return f"x = {_format_number(value)}"
+    terms = [f"{_format_number(coefficient)}{variable}" for coefficient, variable in zip(value, ('x', 'y', ''))]
+    return " + ".join(terms).replace("+ -", "- ") + " = 0"
+
+
+def symmetry_candidates(coords):
+    """
+    Ejes candidatos para buscar simetrías.
+
+    Incluye los siete tipos de reflexión de la aplicación (y = k y x = h pasando por el centroide
+    de los vértices) y varias rectas por el centroide: con pendiente 1 y -1, en la dirección de los
+    dos ejes principales de los vértices, hacia el primer vértice y hacia el punto medio del primer
+    lado. Todo eje de simetría del conjunto de vértices pasa por su centroide y, si los dos momentos
+    principales son distintos, es uno de sus ejes principales; si son iguales (polígonos regulares),
+    las dos últimas rectas cubren los ejes que pasan por un vértice o por un lado.
+    Los candidatos repetidos (la misma matriz) se descartan.
+
+    Returns:
+        list: Pares (kind, value).
+    """
+    coords = distinct_vertices(coords)
+    center_x, center_y = coords.mean(axis=0).tolist()
+    presets = [
+        ('eje_x', 0), ('eje_y', 0), ('origen', 0), ('y_igual_x', 0), ('y_igual_menos_x', 0),
+        ('linea_horizontal', center_y), ('linea_vertical', center_x),
+    ]
+
+    directions = [(1.0, 1.0), (1.0, -1.0)]
+    if len(coords) > 1:
+        _, eigenvectors = np.linalg.eigh(np.cov(coords, rowvar=False))
+        directions.extend(map(tuple, eigenvectors.T.tolist()))
+        directions.append(tuple((coords[0] - (center_x, center_y)).tolist()))
+        directions.append(tuple(((coords[0] + coords[1]) / 2 - (center_x, center_y)).tolist()))
+
+    for dx, dy in directions:
+        if dx != 0 or dy != 0:
+            # Recta por el centroide con dirección (dx, dy): su normal es (dy, -dx)
+            line_a, line_b = dy, -dx
+            presets.append(('linea_general', (line_a, line_b, -(line_a * center_x + line_b * center_y))))
+
+    candidates, matrices = [], []
+    for kind, value in presets:
+        matrix = reflection_preset(kind, value)
+        if not any(np.allclose(matrix, other) for other in matrices):
+            candidates.append((kind, value))
+            matrices.append(matrix)
+    return candidates
+
+
+def detect_symmetries(coords, candidates=None, tolerance=None):
+    """
+    Comprueba en una sola pasada si la figura es invariante bajo cada reflexión candidata.
+
+    Todos los candidatos se aplican a la vez (una operación matricial sobre un arreglo (K, N, 2))
+    y todas las imágenes se buscan en un mismo índice de los vértices originales.
+
+    Args:
+        coords (np.ndarray): Arreglo (N, 2) con los vértices de la figura.
+        candidates (list, optional): Pares (kind, value). Por defecto, symmetry_candidates(coords).
+        tolerance (float, optional): Distancia máxima para que dos vértices coincidan. Por defecto,
+            default_tolerance(coords).
+
+    Returns:
+        list: Un diccionario por candidato con 'kind', 'value', 'label', 'mapping' (índice del
+            vértice sobre el que cae cada vértice, o -1), 'matched' (vértices que caen sobre otro),
+            'invariant' (el conjunto de vértices coincide consigo mismo) y 'polygon_invariant'
+            (además se conserva el orden de los lados, es decir, la figura es la misma).
+    """
+    coords = distinct_vertices(coords)
+    if candidates is None:
+        candidates = symmetry_candidates(coords)
+    if tolerance is None:
+        tolerance = default_tolerance(coords)
+    n_vertices = len(coords)
+
+    matrices = np.stack([reflection_preset(kind, value) for kind, value in candidates])
+    images = coords @ matrices[:, :2, :2].transpose(0, 2, 1) + matrices[:, None, :2, 2]
+    mappings = match_points(coords, images.reshape(-1, 2), tolerance).reshape(len(candidates), n_vertices)
+
+    positions = np.arange(n_vertices)
+    results = []
+    for (kind, value), matrix, mapping in zip(candidates, matrices, mappings):
+        matched = int(np.count_nonzero(mapping >= 0))
+        invariant = matched == n_vertices
+        polygon_invariant = False
+        if invariant and n_vertices:
+            # Una reflexión invierte el sentido de recorrido (i -> c - i); la simetría central lo conserva (i -> i + c)
+            reverses = np.linalg.det(matrix[:2, :2]) < 0
+            shifts = (mapping + positions) % n_vertices if reverses else (mapping - positions) % n_vertices
+            polygon_invariant = bool(np.all(shifts == shifts[0]))
+        results.append({
+            'kind': kind,
+            'value': value,
+            'label': symmetry_label(kind, value),
+            'mapping': mapping,
+            'matched': matched,
+            'invariant': invariant,
+            'polygon_invariant': polygon_invariant,
+        })
+    return results
+
+
+def find_symmetry(coords, kind, value=0, tolerance=None):
+    """Comprueba una sola reflexión (ver detect_symmetries)."""
+    return detect_symmetries(coords, [(kind, value)], tolerance)[0]
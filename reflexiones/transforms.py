@@ -0,0 +1,180 @@
+"""Reflexiones y demás transformaciones afines del plano, vectorizadas con NumPy."""
+
+import numpy as np
+
+
+# --- Función para la reflexión de puntos ---
+def reflect_point(x, y, reflection_type, custom_value=0):
+    """
+    Refleja un punto (x, y) según el tipo de reflexión especificada.
+
+    Args:
+        x (float): Coordenada x del punto original.
+        y (float): Coordenada y del punto original.
+        reflection_type (str): Tipo de reflexión ('eje_x', 'eje_y', 'origen', 'y_igual_x', 'y_igual_menos_x', 'linea_horizontal', 'linea_vertical').
+        custom_value (float, optional): Valor para reflexiones sobre líneas personalizadas (k para y=k, h para x=h).
+
+    Returns:
+        tuple: Coordenadas (x_reflejado, y_reflejado) del punto reflejado.
+    """
+    if reflection_type == 'eje_x':
+        return x, -y
+    elif reflection_type == 'eje_y':
+        return -x, y
+    elif reflection_type == 'origen':
+        return -x, -y
+    elif reflection_type == 'y_igual_x':
+        return y, x
+    elif reflection_type == 'y_igual_menos_x':
+        return -y, -x
+    elif reflection_type == 'linea_horizontal':  # y = k
+        return x, 2 * custom_value - y
+    elif reflection_type == 'linea_vertical':  # x = h
+        return 2 * custom_value - x, y
+    else:
+        return x, y  # No reflection
+
+
+# --- Transformaciones afines en coordenadas homogéneas ---
+# Toda transformación del plano se representa como una matriz 3x3 que actúa sobre (x, y, 1).
+# Así una cadena de pasos se puede fusionar en una única matriz antes de tocar los vértices.
+
+def translation(dx, dy):
+    """Matriz de traslación por el vector (dx, dy)."""
+    return np.array([[1.0, 0.0, dx],
+                     [0.0, 1.0, dy],
+                     [0.0, 0.0, 1.0]])
+
+
+def rotation(angle_degrees, center=(0.0, 0.0)):
+    """
+    Matriz de rotación en sentido antihorario.
+
+    Args:
+        angle_degrees (float): Ángulo de giro en grados.
+        center (tuple, optional): Centro de rotación (x, y). Por defecto el origen.
+
+    Returns:
+        np.ndarray: Matriz homogénea 3x3.
+    """
+    theta = np.deg2rad(angle_degrees)
+    c, s = np.cos(theta), np.sin(theta)
+    cx, cy = center
+    turn = np.array([[c, -s, 0.0],
+                     [s, c, 0.0],
+                     [0.0, 0.0, 1.0]])
+    return translation(cx, cy) @ turn @ translation(-cx, -cy)
+
+
+def reflection_line(a, b, c):
+    """
+    Matriz de reflexión sobre la recta ax + by + c = 0.
+
+    Args:
+        a (float): Coeficiente de x.
+        b (float): Coeficiente de y.
+        c (float): Término independiente.
+
+    Returns:
+        np.ndarray: Matriz homogénea 3x3.
+
+    Raises:
+        ValueError: Si a y b son ambos cero (no definen una recta).
+    """
+    norm2 = a * a + b * b
+    if norm2 == 0:
+        raise ValueError("Los coeficientes a y b no pueden ser ambos cero.")
+    return np.array([[1 - 2 * a * a / norm2, -2 * a * b / norm2, -2 * a * c / norm2],
+                     [-2 * a * b / norm2, 1 - 2 * b * b / norm2, -2 * b * c / norm2],
+                     [0.0, 0.0, 1.0]])
+
+
+def glide_reflection(a, b, c, distance):
+    """
+    Matriz de una reflexión con deslizamiento: refleja sobre ax + by + c = 0 y
+    luego traslada la figura una distancia dada a lo largo de esa misma recta.
+
+    Args:
+        a (float): Coeficiente de x.
+        b (float): Coeficiente de y.
+        c (float): Término independiente.
+        distance (float): Distancia del deslizamiento en la dirección (b, -a) de la recta.
+
+    Returns:
+        np.ndarray: Matriz homogénea 3x3.
+    """
+    reflection = reflection_line(a, b, c)
+    norm = np.hypot(a, b)
+    return translation(distance * b / norm, -distance * a / norm) @ reflection
+
+
+def compose(*matrices):
+    """
+    Fusiona una secuencia de transformaciones en una sola matriz.
+
+    Las matrices se aplican en el orden en que se pasan: compose(A, B) primero aplica A y después B.
+
+    Returns:
+        np.ndarray: Matriz homogénea 3x3 equivalente a toda la cadena.
+    """
+    fused = np.eye(3)
+    for matrix in matrices:
+        fused = np.asarray(matrix, dtype=np.float64) @ fused
+    return fused
+
+
+def apply_transform(coords, matrix):
+    """
+    Aplica una matriz homogénea 3x3 a un arreglo (N, 2) de vértices en una sola pasada.
+
+    Args:
+        coords (np.ndarray): Arreglo (N, 2) con las coordenadas (x, y).
+        matrix (np.ndarray): Matriz homogénea 3x3.
+
+    Returns:
+        np.ndarray: Arreglo (N, 2) de tipo float64 con los puntos transformados.
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    matrix = np.asarray(matrix, dtype=np.float64)
+    return coords @ matrix[:2, :2].T + matrix[:2, 2]
+
+
+# Los siete tipos de reflexión originales como presets del mismo sistema.
+# Cada preset recibe el valor personalizado (k o h) y devuelve su matriz.
+REFLECTION_PRESETS = {
+    'eje_x': lambda value: reflection_line(0.0, 1.0, 0.0),
+    'eje_y': lambda value: reflection_line(1.0, 0.0, 0.0),
+    # Reflexión sobre el origen = reflexión sobre el Eje X seguida de otra sobre el Eje Y
+    'origen': lambda value: compose(reflection_line(0.0, 1.0, 0.0), reflection_line(1.0, 0.0, 0.0)),
+    'y_igual_x': lambda value: reflection_line(1.0, -1.0, 0.0),
+    'y_igual_menos_x': lambda value: reflection_line(1.0, 1.0, 0.0),
+    'linea_horizontal': lambda value: reflection_line(0.0, 1.0, -value),  # y = k
+    'linea_vertical': lambda value: reflection_line(1.0, 0.0, -value),  # x = h
+    'linea_general': lambda value: reflection_line(*value),  # ax + by + c = 0, value = (a, b, c)
+}
+
+
+def reflection_preset(kind, value=0):
+    """Devuelve la matriz homogénea del preset de reflexión indicado (identidad si no existe)."""
+    if kind not in REFLECTION_PRESETS:
+        return np.eye(3)  # No reflection
+    return REFLECTION_PRESETS[kind](value)
+
+
+def reflect_points(coords, kind, value=0):
+    """
+    Refleja un conjunto de puntos de una sola vez mediante una multiplicación matricial afín.
+
+    Da los mismos resultados que llamar a reflect_point para cada vértice, pero trabaja
+    sobre el arreglo completo sin bucles de Python.
+
+    Args:
+        coords (np.ndarray): Arreglo (N, 2) con las coordenadas (x, y) de los puntos.
+        kind (str): Tipo de reflexión (claves de REFLECTION_PRESETS, las mismas de reflect_point más 'linea_general').
+        value (float or tuple, optional): Valor para reflexiones sobre líneas personalizadas (k para y=k, h para x=h,
+            o los coeficientes (a, b, c) para ax + by + c = 0).
+
+    Returns:
+        np.ndarray: Arreglo (N, 2) de tipo float64 con los puntos reflejados.
+    """
+    return apply_transform(coords, reflection_preset(kind, value))
@@ -0,0 +1,187 @@
+"""
+Lectura y escritura masiva de vértices en CSV, NPY y Parquet.
+
+pandas y pyarrow tardan cientos de milisegundos en importarse, así que solo se cargan al leer CSV
+o al leer o escribir Parquet: NPY y la escritura de CSV solo necesitan NumPy.
+"""
+
+import io
+
+import numpy as np
+
+# Formatos admitidos -> tipo MIME para la descarga
+VERTEX_FILE_FORMATS = {
+    'csv': 'text/csv',
+    'npy': 'application/octet-stream',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+# Filas leídas por bloque al importar archivos grandes
+IMPORT_CHUNK_ROWS = 100_000
+
+# Filas formateadas por bloque al exportar CSV
+EXPORT_CHUNK_ROWS = 65_536
+
+
+def _coordinate_columns(names):
+    """Elige las columnas de coordenadas: 'x' e 'y' si existen, si no las dos primeras."""
+    lowered = [str(name).strip().lower() for name in names]
+    if 'x' in lowered and 'y' in lowered:
+        return [names[lowered.index('x')], names[lowered.index('y')]]
+    if len(names) < 2:
+        raise ValueError("se necesitan al menos dos columnas (x, y).")
+    return list(names[:2])
+
+
+def _is_numeric_row(cells):
+    """Si todas las celdas se leen como números (las vacías cuentan como números que faltan)."""
+    try:
+        [float(cell) for cell in cells]
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _read_csv_vertices(file_obj, chunk_rows):
+    import pandas as pd
+
+    try:
+        # La primera fila es un encabezado si alguna de sus dos primeras celdas no es un número
+        first_row = pd.read_csv(file_obj, header=None, nrows=1, dtype=str).iloc[0].tolist()
+        file_obj.seek(0)
+        if len(first_row) < 2:
+            raise ValueError("se necesitan al menos dos columnas (x, y).")
+        if _is_numeric_row(first_row[:2]):
+            # Sin encabezado: las dos primeras columnas son x e y
+            columns = [0, 1]
+            reader = pd.read_csv(file_obj, header=None, usecols=columns, dtype=np.float64, float_precision="round_trip", chunksize=chunk_rows)
+        else:
+            columns = _coordinate_columns(list(pd.read_csv(file_obj, nrows=0).columns))
+            file_obj.seek(0)
+            reader = pd.read_csv(file_obj, usecols=columns, dtype=np.float64, float_precision="round_trip", chunksize=chunk_rows)
+        return [chunk[columns].to_numpy() for chunk in reader]
+    except pd.errors.ParserError as error:
+        raise ValueError(str(error)) from error
+
+
+def _read_parquet_vertices(file_obj, chunk_rows):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    try:
+        parquet_file = pq.ParquetFile(file_obj)
+        columns = _coordinate_columns(parquet_file.schema_arrow.names)
+        return [
+            np.column_stack([batch.column(0).to_numpy(zero_copy_only=False), batch.column(1).to_numpy(zero_copy_only=False)]).astype(np.float64)
+            for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns)
+        ]
+    except pa.ArrowException as error:
+        raise ValueError(str(error)) from error
+
+
+def load_vertices(file_obj, filename, chunk_rows=IMPORT_CHUNK_ROWS):
+    """
+    Lee un conjunto de vértices desde un archivo CSV, NPY o Parquet.
+
+    Los archivos CSV y Parquet se leen por bloques de chunk_rows filas, nunca fila a fila. Las
+    coordenadas son las columnas 'x' e 'y' si existen y, si no, las dos primeras; un CSV sin
+    encabezado (primera fila numérica) usa también sus dos primeras columnas.
+
+    Args:
+        file_obj (file-like): Archivo binario abierto (por ejemplo, el de st.file_uploader).
+        filename (str): Nombre del archivo; su extensión determina el formato.
+        chunk_rows (int, optional): Número de filas por bloque.
+
+    Returns:
+        np.ndarray: Arreglo (N, 2) de tipo float64 con los vértices.
+
+    Raises:
+        ValueError: Si el formato no es compatible o los datos no son coordenadas válidas.
+    """
+    extension = filename.rsplit('.', 1)[-1].lower()
+    try:
+        if extension == 'csv':
+            chunks = _read_csv_vertices(file_obj, chunk_rows)
+        elif extension == 'parquet':
+            chunks = _read_parquet_vertices(file_obj, chunk_rows)
+        elif extension == 'npy':
+            array = np.load(file_obj, allow_pickle=False)
+            if array.ndim != 2 or array.shape[1] < 2:
+                raise ValueError("el arreglo debe tener forma (N, 2).")
+            chunks = [array[:, :2].astype(np.float64)]
+        else:
+            raise ValueError(f"formato '{extension}' no compatible.")
+    except (TypeError, KeyError, EOFError) as error:
+        # EOFError: np.load con un archivo .npy vacío o cortado
+        raise ValueError(str(error) or "el archivo está vacío o incompleto.") from error
+
+    coords = np.concatenate(chunks) if chunks else np.empty((0, 2))
+    if len(coords) == 0:
+        raise ValueError("el archivo no contiene vértices.")
+    if not np.isfinite(coords).all():
+        raise ValueError("hay coordenadas vacías o no numéricas.")
+    return coords
+
+
+def _write_csv_vertices(file_obj, coords, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Escribe los vértices como CSV 'x,y' con 17 cifras significativas (se recuperan exactos al leerlos).
+
+    Cada bloque de filas se formatea con una única operación '%' sobre una plantilla repetida,
+    en lugar de formatear fila a fila como np.savetxt: es unas dos veces más rápido.
+    """
+    file_obj.write(b'x,y\n')
+    for start in range(0, len(coords), chunk_rows):
+        block = coords[start:start + chunk_rows]
+        file_obj.write((('%.17g,%.17g\n' * len(block)) % tuple(block.ravel().tolist())).encode('ascii'))
+
+
+def write_vertices(file_obj, coords, file_format):
+    """
+    Escribe los vértices directamente en un archivo binario abierto, sin copias intermedias.
+
+    Args:
+        file_obj (file-like): Archivo binario abierto para escritura.
+        coords (np.ndarray): Arreglo (N, 2) con los vértices.
+        file_format (str): 'csv', 'npy' o 'parquet'.
+
+    Raises:
+        ValueError: Si el formato no es compatible.
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    if file_format == 'csv':
+        _write_csv_vertices(file_obj, coords)
+    elif file_format == 'npy':
+        np.save(file_obj, coords)
+    elif file_format == 'parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        pq.write_table(pa.table({'x': coords[:, 0], 'y': coords[:, 1]}), file_obj)
+    else:
+        raise ValueError(f"Formato '{file_format}' no compatible.")
+
+
+def vertices_to_bytes(coords, file_format):
+    """
+    Serializa los vértices en el formato indicado ('csv', 'npy' o 'parquet').
+
+    Returns:
+        bytes: Contenido del archivo listo para descargar.
+    """
+    buffer = io.BytesIO()
+    write_vertices(buffer, coords, file_format)
+    return buffer.getvalue()
+
+
+def read_vertex_file(path, chunk_rows=IMPORT_CHUNK_ROWS):
+    """Lee los vértices de un archivo en disco (ver load_vertices)."""
+    with open(path, 'rb') as file_obj:
+        return load_vertices(file_obj, str(path), chunk_rows)
+
+
+def write_vertex_file(path, coords, file_format=None):
+    """Escribe los vértices en un archivo en disco; por defecto el formato sale de la extensión."""
+    file_format = file_format or str(path).rsplit('.', 1)[-1].lower()
+    with open(path, 'wb') as file_obj:
+        write_vertices(file_obj, coords, file_format)
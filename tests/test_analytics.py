@@ -0,0 +1,134 @@
+import itertools
+import sys
+
+import numpy as np
+import pytest
+
+from reflexiones import find_self_intersection, polygon_metrics
+
+
+def _orientation(a, b, c):
+    cross = (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+    return (cross > 0) - (cross < 0)
+
+
+def _on_segment(a, b, p):
+    return min(a[0], b[0]) <= p[0] <= max(a[0], b[0]) and min(a[1], b[1]) <= p[1] <= max(a[1], b[1])
+
+
+def _segments_touch(a, b, c, d):
+    o1, o2, o3, o4 = _orientation(a, b, c), _orientation(a, b, d), _orientation(c, d, a), _orientation(c, d, b)
+    if o1 != o2 and o3 != o4:
+        return True
+    return ((o1 == 0 and _on_segment(a, b, c)) or (o2 == 0 and _on_segment(a, b, d))
+            or (o3 == 0 and _on_segment(c, d, a)) or (o4 == 0 and _on_segment(c, d, b)))
+
+
+def brute_force_crossings(coords):
+    """Pares de lados que se cortan, probando todos (índices de los vértices originales)."""
+    points = [tuple(p) for p in coords.tolist()]
+    kept = [i for i in range(len(points)) if points[i] != points[(i + 1) % len(points)]]
+    n = len(kept)
+    if n < 3:
+        return set()
+    edges = [(points[kept[k]], points[kept[(k + 1) % n]]) for k in range(n)]
+    crossings = set()
+    for i, j in itertools.combinations(range(n), 2):
+        if j - i == 1 or (i == 0 and j == n - 1):
+            first, second = (i, j) if j - i == 1 else (j, i)
+            p, q, r = edges[first][0], edges[second][0], edges[second][1]
+            if _orientation(p, q, r) == 0 and (q[0] - p[0]) * (r[0] - q[0]) + (q[1] - p[1]) * (r[1] - q[1]) < 0:
+                crossings.add((kept[i], kept[j]))
+        elif _segments_touch(*edges[i], *edges[j]):
+            crossings.add((kept[i], kept[j]))
+    return crossings
+
+
+def comb(teeth, angle=0.0):
+    """Polígono simple con forma de peine: dientes horizontales unidos por lados verticales."""
+    points = []
+    for i in range(teeth):
+        y = 2 * i
+        points += [(0, y), (10, y), (10, y + 1), (1, y + 1)]
+    points += [(1, 2 * teeth), (-1, 2 * teeth), (-1, 0)]
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    return np.array(points, dtype=np.float64) @ rotation.T
+
+
+def _check_against_brute_force(coords):
+    expected = brute_force_crossings(coords)
+    found = find_self_intersection(coords)
+    if expected:
+        assert found in expected
+    else:
+        assert found is None
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_matches_brute_force_on_random_polygons(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(50):
+        n = int(rng.integers(3, 12))
+        # Rejilla pequeña para provocar vértices repetidos, lados alineados y lados verticales
+        _check_against_brute_force(rng.integers(0, 5, size=(n, 2)).astype(np.float64))
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_matches_brute_force_on_rectilinear_polygons(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(50):
+        n = int(rng.integers(2, 8))
+        # Camino con pasos horizontales y verticales alternados, cerrado con un paso en cada eje
+        steps = rng.integers(-3, 4, size=n)
+        points = [(0, 0)]
+        for k, step in enumerate(steps):
+            x, y = points[-1]
+            points.append((x + step, y) if k % 2 == 0 else (x, y + step))
+        points.append((points[-1][0], 0))
+        _check_against_brute_force(np.array(points, dtype=np.float64))
+
+
+@pytest.mark.parametrize('angle', [0.0, 0.01, np.pi / 2])
+def test_comb_is_simple(angle):
+    assert find_self_intersection(comb(50, angle)) is None
+
+
+def test_comb_with_crossing_tooth():
+    coords = comb(50)
+    # El diente 20 se alarga hacia abajo hasta cortar al diente 19
+    coords[4 * 20 + 2, 1] -= 2.5
+    coords[4 * 20 + 1, 1] -= 2.5
+    _check_against_brute_force(coords)
+    assert find_self_intersection(coords) is not None
+
+
+def _count_list_index_calls(function, *args):
+    """Ejecuta function(*args) y cuenta las llamadas a list.index (el recorrido lineal del barrido)."""
+    calls = 0
+
+    def profiler(frame, event, arg):
+        nonlocal calls
+        if event == 'c_call' and getattr(arg, '__name__', None) == 'index' and isinstance(getattr(arg, '__self__', None), list):
+            calls += 1
+
+    sys.setprofile(profiler)
+    try:
+        result = function(*args)
+    finally:
+        sys.setprofile(None)
+    return result, calls
+
+
+def test_rectilinear_polygon_never_scans_the_sweep_status():
+    # Con lados verticales, sacar un lado del barrido debe ser una búsqueda binaria: el recorrido
+    # lineal con list.index (O(N) por lado, O(N²) en total) solo queda para empates por redondeo
+    result, calls = _count_list_index_calls(find_self_intersection, comb(2_000))
+    assert result is None
+    assert calls == 0
+
+
+def test_polygon_metrics_square():
+    metrics = polygon_metrics(np.array([[0, 0], [2, 0], [2, 2], [0, 2]], dtype=np.float64))
+    assert metrics['area'] == pytest.approx(4.0)
+    assert metrics['perimeter'] == pytest.approx(8.0)
+    assert metrics['winding'] == 'antihorario'
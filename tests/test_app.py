@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+AppTest = pytest.importorskip('streamlit.testing.v1').AppTest
+
+APP_PATH = Path(__file__).resolve().parent.parent / 'app.py'
+
+
+def _grid_key(app_test):
+    return f"vertex_grid_{app_test.session_state['vertex_grid_version']}"
+
+
+def _edit_grid(app_test, edits):
+    """Simula un cambio en el editor de la tabla inyectando su estado, como haría el navegador."""
+    state = {'edited_rows': {}, 'added_rows': [], 'deleted_rows': []}
+    state.update(edits)
+    app_test.session_state[_grid_key(app_test)] = state
+    app_test.run()
+    assert not app_test.exception, app_test.exception
+
+
+@pytest.fixture
+def app_test():
+    app_test = AppTest.from_file(str(APP_PATH), default_timeout=120)
+    app_test.run()
+    assert not app_test.exception, app_test.exception
+    return app_test
+
+
+def test_toggling_the_grid_keeps_edits(app_test):
+    app_test.toggle(key='vertex_grid_mode').set_value(True).run()
+    _edit_grid(app_test, {'edited_rows': {0: {'x': 9.0}}})
+    np.testing.assert_array_equal(app_test.session_state['points'].coords, [[9, 1], [3, 1], [2, 3]])
+
+    app_test.toggle(key='vertex_grid_mode').set_value(False).run()
+    app_test.number_input(key='y_1').set_value(7.0).run()
+    np.testing.assert_array_equal(app_test.session_state['points'].coords, [[9, 1], [3, 7], [2, 3]])
+
+    app_test.toggle(key='vertex_grid_mode').set_value(True).run()
+    app_test.run()
+    assert not app_test.exception, app_test.exception
+    np.testing.assert_array_equal(app_test.session_state['points'].coords, [[9, 1], [3, 7], [2, 3]])
+
+
+def test_deleting_rows_below_the_grid_threshold_keeps_them(app_test):
+    # 22 vértices: por encima del umbral de la tabla (20); al borrar dos se vuelve a los campos x, y
+    coords = np.column_stack([np.arange(22.0), np.zeros(22)])
+    app_test.session_state['points'].replace(coords)
+    app_test.session_state['vertex_grid_version'] += 1
+    app_test.run()
+    _edit_grid(app_test, {'deleted_rows': [0, 1]})
+    np.testing.assert_array_equal(app_test.session_state['points'].coords, coords[2:])
+
+    app_test.run()
+    assert not app_test.exception, app_test.exception
+    assert 'vertex_grid_base' not in app_test.session_state
+    np.testing.assert_array_equal(app_test.session_state['points'].coords, coords[2:])
@@ -0,0 +1,91 @@
+import threading
+
+import numpy as np
+
+from reflexiones.cache import FigureCache, figure_cache_key
+
+
+def _builder(value, calls):
+    def build():
+        calls.append(value)
+        return value
+    return build
+
+
+def test_hit_returns_stored_value_without_building():
+    cache, calls = FigureCache(), []
+    assert cache.get_or_build('a', _builder(1, calls), size_of=lambda _: 10) == 1
+    assert cache.get_or_build('a', _builder(2, calls), size_of=lambda _: 10) == 1
+    assert calls == [1]
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 0.5)
+
+
+def test_entry_cap_evicts_least_recently_used():
+    cache, calls = FigureCache(max_entries=2), []
+    for key in ('a', 'b'):
+        cache.get_or_build(key, _builder(key, calls), size_of=lambda _: 1)
+    cache.get_or_build('a', _builder('a', calls), size_of=lambda _: 1)  # 'a' pasa a ser la más reciente
+    cache.get_or_build('c', _builder('c', calls), size_of=lambda _: 1)  # expulsa 'b'
+    assert cache.stats()['evictions'] == 1
+    cache.get_or_build('a', _builder('a', calls), size_of=lambda _: 1)
+    cache.get_or_build('b', _builder('b', calls), size_of=lambda _: 1)
+    assert calls == ['a', 'b', 'c', 'b']
+    assert cache.stats()['entries'] == 2
+
+
+def test_byte_cap_evicts_until_it_fits():
+    cache = FigureCache(max_entries=100, max_bytes=100)
+    for key in range(4):
+        cache.get_or_build(key, lambda: key, size_of=lambda _: 40)
+    stats = cache.stats()
+    assert stats['entries'] == 2 and stats['bytes'] == 80 and stats['evictions'] == 2
+    assert stats['max_bytes'] == 100
+
+
+def test_oversized_value_is_returned_but_not_stored():
+    cache, calls = FigureCache(max_bytes=100), []
+    cache.get_or_build('small', _builder('small', calls), size_of=lambda _: 50)
+    assert cache.get_or_build('big', _builder('big', calls), size_of=lambda _: 101) == 'big'
+    assert cache.get_or_build('big', _builder('big', calls), size_of=lambda _: 101) == 'big'
+    assert calls == ['small', 'big', 'big']
+    stats = cache.stats()
+    assert stats['entries'] == 1 and stats['bytes'] == 50 and stats['evictions'] == 0
+
+
+def test_clear_keeps_counters():
+    cache = FigureCache()
+    cache.get_or_build('a', lambda: 1, size_of=lambda _: 10)
+    cache.clear()
+    stats = cache.stats()
+    assert (stats['entries'], stats['bytes'], stats['misses']) == (0, 0, 1)
+    assert cache.stats()['hit_rate'] == 0.0
+
+
+def test_concurrent_lookups_keep_consistent_totals():
+    cache = FigureCache(max_entries=8, max_bytes=1_000)
+
+    def worker(seed):
+        rng = np.random.default_rng(seed)
+        for key in rng.integers(0, 20, 500).tolist():
+            assert cache.get_or_build(key, lambda: key * 2, size_of=lambda _: 50) == key * 2
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 2_000
+    assert stats['entries'] <= 8 and stats['bytes'] == 50 * stats['entries']
+
+
+def test_key_depends_on_content_and_parameters():
+    coords = np.array([[0.0, 1.0], [2.0, 3.0]])
+    key = figure_cache_key(coords, 'eje_x', 0, False)
+    assert key == figure_cache_key(coords.copy(), 'eje_x', 0, False)
+    assert key != figure_cache_key(coords[::-1], 'eje_x', 0, False)
+    assert key != figure_cache_key(coords, 'eje_y', 0, False)
+    assert key != figure_cache_key(coords, 'eje_x', 0, True)
+    # Misma memoria con otra forma
+    assert figure_cache_key(coords.reshape(1, 4), 'eje_x', 0, False) != key
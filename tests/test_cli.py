@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from reflexiones.cli import collect_inputs, main, output_paths
+from reflexiones.vertex_io import read_vertex_file, write_vertex_file
+
+SQUARE = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 2.0]])
+
+
+def test_same_name_in_subfolders_keeps_relative_paths(tmp_path):
+    for folder in ('a', 'b'):
+        (tmp_path / 'in' / folder).mkdir(parents=True)
+        write_vertex_file(tmp_path / 'in' / folder / 'fig.csv', SQUARE)
+    out = tmp_path / 'out'
+    assert main([str(tmp_path / 'in' / '**' / '*'), '--kind', 'eje_y', '--output', str(out)]) == 0
+    for folder in ('a', 'b'):
+        reflected = read_vertex_file(out / folder / 'fig_reflejada.csv')
+        np.testing.assert_array_equal(reflected, SQUARE * [-1, 1])
+
+
+def test_colliding_outputs_fail_before_writing(tmp_path, capsys):
+    write_vertex_file(tmp_path / 'fig.csv', SQUARE)
+    write_vertex_file(tmp_path / 'fig.npy', SQUARE)
+    out = tmp_path / 'out'
+    assert main([str(tmp_path), '--kind', 'eje_y', '--format', 'csv', '--output', str(out)]) == 1
+    assert 'mismo archivo' in capsys.readouterr().err
+    assert not out.exists()
+
+
+def test_output_paths_keep_format_without_override(tmp_path):
+    inputs = collect_inputs([str(tmp_path)])
+    assert inputs == []
+    write_vertex_file(tmp_path / 'fig.csv', SQUARE)
+    write_vertex_file(tmp_path / 'fig.npy', SQUARE)
+    outputs = output_paths(collect_inputs([str(tmp_path)]), tmp_path / 'out')
+    assert sorted(path.name for path in outputs) == ['fig_reflejada.csv', 'fig_reflejada.npy']
+
+
+def test_empty_file_is_reported_without_stopping_the_batch(tmp_path, capsys):
+    (tmp_path / 'vacia.npy').write_bytes(b'')
+    write_vertex_file(tmp_path / 'buena.csv', SQUARE)
+    out = tmp_path / 'out'
+    assert main([str(tmp_path), '--kind', 'origen', '--output', str(out), '--workers', '1']) == 1
+    captured = capsys.readouterr()
+    assert 'vacia.npy' in captured.err + captured.out
+    np.testing.assert_array_equal(read_vertex_file(out / 'buena_reflejada.csv'), -SQUARE)
+
+
+@pytest.mark.parametrize('content', [b'', b'\x93NUMPY\x01\x00'])
+def test_empty_or_truncated_npy_raises_value_error(tmp_path, content):
+    path = tmp_path / 'rota.npy'
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        read_vertex_file(path)
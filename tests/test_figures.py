@@ -0,0 +1,24 @@
+import numpy as np
+
+from reflexiones.figures import WEBGL_VERTEX_THRESHOLD, build_figure
+
+
+def _circle(n, radius=1.0, center=(0.0, 0.0)):
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return np.column_stack([np.cos(angles), np.sin(angles)]) * radius + center
+
+
+def test_webgl_keeps_double_precision():
+    coords = _circle(5 * WEBGL_VERTEX_THRESHOLD, radius=1.0, center=(1e6 + 0.1, 0.0))
+    figure = build_figure(coords, 'eje_y', full_detail=True)['figure']
+    original = figure.data[0]
+    assert type(original).__name__ == 'Scattergl'
+    np.testing.assert_array_equal(original.x, coords[:, 0].tolist() + [coords[0, 0]])
+
+
+def test_exact_coordinates_are_sent_as_float32():
+    coords = np.round(_circle(5 * WEBGL_VERTEX_THRESHOLD, radius=500.0))
+    figure = build_figure(coords, 'eje_x', full_detail=True)['figure']
+    for trace in figure.data[:2]:
+        assert trace.x.dtype == np.float32 and trace.y.dtype == np.float32
+    np.testing.assert_array_equal(figure.data[1].y[:-1], -coords[:, 1])
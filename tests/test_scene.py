@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from reflexiones.scene import Scene, UniformGridIndex
+
+
+def brute_force_visible(bboxes, viewport):
+    x_min, y_min, x_max, y_max = viewport
+    return np.flatnonzero((bboxes[:, 0] <= x_max) & (bboxes[:, 2] >= x_min)
+                          & (bboxes[:, 1] <= y_max) & (bboxes[:, 3] >= y_min))
+
+
+def random_boxes(rng, count, extent=100.0, max_size=5.0):
+    corners = rng.random((count, 2)) * extent
+    sizes = rng.random((count, 2)) * max_size
+    return np.hstack([corners, corners + sizes])
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_queries_match_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    bboxes = random_boxes(rng, int(rng.integers(1, 400)))
+    # Algunas cajas enormes (se guardan aparte) y algunas degeneradas (un punto)
+    bboxes[:3, 2:] += 80.0
+    bboxes[3:6, 2:] = bboxes[3:6, :2]
+    bounds = (*bboxes[:, :2].min(axis=0), *bboxes[:, 2:].max(axis=0))
+    index = UniformGridIndex(bboxes, bounds)
+    for _ in range(50):
+        x0, y0 = rng.random(2) * 120 - 10
+        width, height = rng.random(2) * rng.choice([1.0, 10.0, 150.0])
+        viewport = (x0, y0, x0 + width, y0 + height)
+        np.testing.assert_array_equal(index.query(viewport), brute_force_visible(bboxes, viewport))
+
+
+def test_oversized_figures_are_kept_apart():
+    rng = np.random.default_rng(0)
+    bboxes = random_boxes(rng, 100)
+    bboxes[0] = (0.0, 0.0, 100.0, 100.0)
+    index = UniformGridIndex(bboxes, (0.0, 0.0, 105.0, 105.0))
+    assert 0 in index.oversized
+    viewport = (50.0, 50.0, 50.5, 50.5)
+    np.testing.assert_array_equal(index.query(viewport), brute_force_visible(bboxes, viewport))
+
+
+def test_scene_visible_uses_figure_bounding_boxes():
+    square = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+    scene = Scene.from_figures([square, square + 10, square + [20, 0]])
+    np.testing.assert_array_equal(scene.visible((0.5, 0.5, 20.5, 0.5)), [0, 2])
+    np.testing.assert_array_equal(scene.visible((-5.0, -5.0, -1.0, -1.0)), [])
+    np.testing.assert_array_equal(scene.reflect('eje_y').figure(1), square * [-1, 1] + [-10, 10])
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from reflexiones.simplify import simplify_indices
+
+
+def segment_distance(point, start, end):
+    """Distancia de un punto a un segmento, calculada vértice a vértice."""
+    direction = end - start
+    squared_length = float(direction @ direction)
+    t = 0.0 if squared_length == 0 else min(1.0, max(0.0, float((point - start) @ direction) / squared_length))
+    return float(np.hypot(*(point - start - t * direction)))
+
+
+def max_error(coords, kept):
+    """Mayor distancia de un vértice descartado al tramo simplificado que lo sustituye."""
+    error = 0.0
+    for start, end in zip(kept[:-1], kept[1:]):
+        for i in range(start + 1, end):
+            error = max(error, segment_distance(coords[i], coords[start], coords[end]))
+    return error
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_error_bound_on_random_walks(seed):
+    rng = np.random.default_rng(seed)
+    coords = np.cumsum(rng.normal(size=(300, 2)), axis=0)
+    # Algunos tramos alineados con idas y vueltas
+    coords[100:120] = coords[100] + np.outer(rng.uniform(-5, 5, 20), [1.0, 0.5])
+    tolerance = float(rng.uniform(0.1, 3.0))
+    kept = simplify_indices(coords, tolerance)
+    assert kept[0] == 0 and kept[-1] == len(coords) - 1
+    assert np.all(np.diff(kept) > 0)
+    assert max_error(coords, kept) <= tolerance
+
+
+def test_collinear_spike_is_kept():
+    assert simplify_indices([[0, 0], [30, 0], [20, 0]], 0.1).tolist() == [0, 1, 2]
+
+
+def test_collinear_points_inside_the_segment_are_dropped():
+    assert simplify_indices([[0, 0], [1, 0], [2, 0], [3, 0]], 0.1).tolist() == [0, 3]
+
+
+def test_closed_polyline():
+    square = np.array([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]], dtype=float)
+    # Inicio y fin coinciden: el primer tramo mide la distancia a ese punto
+    assert simplify_indices(square, 0.1).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_zero_tolerance_keeps_everything():
+    coords = np.random.default_rng(0).normal(size=(10, 2))
+    assert simplify_indices(coords, 0).tolist() == list(range(10))
@@ -0,0 +1,64 @@
+import random
+
+import numpy as np
+import pytest
+
+from reflexiones.store import MIN_CAPACITY, VertexStore
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_operations_match_a_list(seed):
+    rng = random.Random(seed)
+    store, expected = VertexStore(), []
+    for _ in range(500):
+        operation = rng.random()
+        if operation < 0.5:
+            point = (rng.uniform(-9, 9), rng.uniform(-9, 9))
+            store.append(*point)
+            expected.append(point)
+        elif operation < 0.6:
+            points = [(rng.random(), rng.random()) for _ in range(rng.randrange(40))]
+            store.extend(points)
+            expected.extend(points)
+        elif operation < 0.95 and expected:
+            index = rng.randrange(-len(expected), len(expected))
+            store.remove(index)
+            del expected[index]
+        else:
+            expected = [(rng.random(), rng.random()) for _ in range(rng.randrange(100))]
+            store.replace(expected)
+        assert len(store) == len(expected)
+        np.testing.assert_array_equal(store.coords, np.array(expected).reshape(-1, 2))
+        assert MIN_CAPACITY <= store.capacity
+        assert len(store) <= store.capacity
+
+
+def test_capacity_grows_and_shrinks():
+    store = VertexStore()
+    for i in range(1000):
+        store.append(i, i)
+    assert store.capacity == 1024
+    while len(store) > 10:
+        store.remove(-1)
+    assert store.capacity < 64
+
+
+def test_remove_out_of_range():
+    store = VertexStore([[0, 0]])
+    with pytest.raises(IndexError):
+        store.remove(1)
+
+
+def test_array_protocol_copies_when_asked():
+    store = VertexStore([[1.0, 2.0], [3.0, 4.0]])
+    view = np.asarray(store)
+    assert np.shares_memory(view, store.coords)
+
+    for copied in (np.array(store), np.array(store, copy=True), store.__array__(copy=True)):
+        assert not np.shares_memory(copied, store.coords)
+        copied[0, 0] = 99.0
+    assert store.coords[0, 0] == 1.0
+
+    assert np.asarray(store, dtype=np.float32).dtype == np.float32
+    with pytest.raises(ValueError):
+        np.array(store, dtype=np.float32, copy=False)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from reflexiones.symmetry import detect_symmetries, find_symmetry, match_points
+
+
+def brute_force_matches(points, queries, tolerance):
+    """Para cada consulta, los índices de los puntos a distancia <= tolerance en cada coordenada."""
+    close = np.all(np.abs(points[None, :, :] - queries[:, None, :]) <= tolerance, axis=2)
+    return [set(np.flatnonzero(row).tolist()) for row in close]
+
+
+def _check_against_brute_force(points, queries, tolerance):
+    mapping = match_points(points, queries, tolerance)
+    for index, expected in zip(mapping.tolist(), brute_force_matches(points, queries, tolerance)):
+        if expected:
+            assert index in expected
+        else:
+            assert index == -1
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_random_points_match_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    tolerance = 0.05
+    # Coordenadas en múltiplos de la tolerancia para caer a menudo en bordes de celda
+    points = rng.integers(0, 40, size=(200, 2)) * tolerance
+    queries = np.vstack([points + rng.choice([-1, 0, 1], size=points.shape) * tolerance * rng.random((200, 1)),
+                         rng.random((100, 2)) * 2])
+    _check_against_brute_force(points, queries, tolerance)
+
+
+def test_duplicate_points_map_to_the_first():
+    points = np.array([[0.0, 0.0]] * 5 + [[1.0, 1.0]] + [[0.0, 0.0]] * 5 + [[1.0, 1.0]])
+    queries = np.array([[0.0, 1e-12], [1.0, 1.0], [0.5, 0.5]])
+    np.testing.assert_array_equal(match_points(points, queries, 1e-9), [0, 5, -1])
+    _check_against_brute_force(points, queries, 1e-9)
+
+
+def test_many_coincident_vertices_are_fast():
+    angles = np.linspace(0, 2 * np.pi, 20_000, endpoint=False)
+    circle = np.column_stack([np.cos(angles), np.sin(angles)])
+    coords = np.vstack([circle, np.repeat(circle[:1], 10_000, axis=0)])
+    result = find_symmetry(coords, 'eje_x')
+    assert result['invariant']
+
+
+def test_empty_inputs():
+    assert match_points(np.empty((0, 2)), np.zeros((3, 2)), 1e-9).tolist() == [-1, -1, -1]
+    assert match_points(np.zeros((3, 2)), np.empty((0, 2)), 1e-9).tolist() == []
+
+
+def test_square_symmetries():
+    square = np.array([[1.0, 1.0], [-1.0, 1.0], [-1.0, -1.0], [1.0, -1.0]])
+    by_kind = {result['kind']: result for result in detect_symmetries(square, [
+        ('eje_x', 0), ('eje_y', 0), ('origen', 0), ('y_igual_x', 0), ('linea_horizontal', 0.5)])}
+    assert all(by_kind[kind]['polygon_invariant'] for kind in ('eje_x', 'eje_y', 'origen', 'y_igual_x'))
+    assert not by_kind['linea_horizontal']['invariant']
+    np.testing.assert_array_equal(by_kind['eje_x']['mapping'], [3, 2, 1, 0])
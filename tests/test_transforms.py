@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from reflexiones.transforms import (
+    REFLECTION_PRESETS,
+    apply_transform,
+    compose,
+    glide_reflection,
+    reflect_point,
+    reflect_points,
+    reflection_preset,
+    rotation,
+    translation,
+)
+
+POINT_KINDS = ['eje_x', 'eje_y', 'origen', 'y_igual_x', 'y_igual_menos_x', 'linea_horizontal', 'linea_vertical']
+
+
+@pytest.mark.parametrize('kind', POINT_KINDS + ['sin_reflexion'])
+@pytest.mark.parametrize('value', [0.0, 2.5, -1e6 + 0.1])
+def test_reflect_points_matches_reflect_point(kind, value):
+    coords = np.random.default_rng(1).normal(size=(500, 2)) * [1.0, 1e3]
+    expected = np.array([reflect_point(x, y, kind, value) for x, y in coords.tolist()])
+    np.testing.assert_array_equal(reflect_points(coords, kind, value), expected)
+
+
+def test_point_kinds_are_presets():
+    assert set(POINT_KINDS) <= set(REFLECTION_PRESETS)
+
+
+@pytest.mark.parametrize('line', [(1.0, 1.0, 0.0), (1.0, -2.0, 3.0), (0.0, 4.0, -2.0)])
+def test_general_line_is_an_involution_that_fixes_the_line(line):
+    a, b, c = line
+    coords = np.random.default_rng(2).normal(size=(200, 2)) * 10
+    reflected = reflect_points(coords, 'linea_general', line)
+    np.testing.assert_allclose(reflect_points(reflected, 'linea_general', line), coords, atol=1e-12)
+    # El punto medio de cada vértice y su imagen está sobre la recta
+    middle = (coords + reflected) / 2
+    np.testing.assert_allclose(a * middle[:, 0] + b * middle[:, 1] + c, 0, atol=1e-12)
+
+
+def test_compose_applies_matrices_in_order():
+    point = np.array([[1.0, 0.0]])
+    # Primero trasladar y después girar 90°: (1, 0) -> (3, 0) -> (0, 3)
+    np.testing.assert_allclose(apply_transform(point, compose(translation(2, 0), rotation(90))), [[0, 3]], atol=1e-12)
+    # En el orden contrario: (1, 0) -> (0, 1) -> (2, 1)
+    np.testing.assert_allclose(apply_transform(point, compose(rotation(90), translation(2, 0))), [[2, 1]], atol=1e-12)
+    np.testing.assert_array_equal(compose(), np.eye(3))
+
+
+def test_reflections_over_both_axes_compose_to_the_origin():
+    np.testing.assert_allclose(compose(reflection_preset('eje_x'), reflection_preset('eje_y')),
+                               reflection_preset('origen'), atol=1e-12)
+
+
+def test_rotation_about_a_center():
+    center = (2.0, -1.0)
+    coords = np.array([[3.0, -1.0], [2.0, 0.0], [2.0, -1.0]])
+    np.testing.assert_allclose(apply_transform(coords, rotation(90, center)), [[2, 0], [1, -1], [2, -1]], atol=1e-12)
+    # Cuatro giros de 90° devuelven la figura a su sitio
+    np.testing.assert_allclose(np.linalg.matrix_power(rotation(90, center), 4), np.eye(3), atol=1e-12)
+
+
+@pytest.mark.parametrize('line, distance', [((1.0, -1.0, 0.0), 2.0), ((0.0, 2.0, -4.0), -1.5), ((3.0, 4.0, 5.0), 0.7)])
+def test_glide_reflection_twice_is_a_translation_along_the_line(line, distance):
+    a, b, _ = line
+    glide = glide_reflection(*line, distance)
+    norm = np.hypot(a, b)
+    expected = translation(2 * distance * b / norm, -2 * distance * a / norm)
+    np.testing.assert_allclose(glide @ glide, expected, atol=1e-12)
+    # Los puntos de la recta se deslizan por ella sin salirse
+    coords = np.random.default_rng(4).normal(size=(50, 2))
+    on_line = coords - np.outer((coords @ [a, b] + line[2]) / norm ** 2, [a, b])
+    moved = apply_transform(on_line, glide)
+    np.testing.assert_allclose(moved @ [a, b] + line[2], 0, atol=1e-12)
@@ -0,0 +1,36 @@
+import io
+
+import numpy as np
+import pytest
+
+from reflexiones.vertex_io import load_vertices, vertices_to_bytes
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'npy', 'parquet'])
+def test_round_trip_is_exact(file_format):
+    coords = np.random.default_rng(3).normal(size=(70_000, 2)) * 1e3
+    coords[0] = (-0.0, 1e300)
+    coords[1] = (1e6 + 0.1, 5e-324)
+    data = vertices_to_bytes(coords, file_format)
+    np.testing.assert_array_equal(load_vertices(io.BytesIO(data), f"v.{file_format}"), coords)
+
+
+def test_csv_layout():
+    assert vertices_to_bytes(np.array([[1.0, 2.5], [-3.0, 0.1]]), 'csv') == b'x,y\n1,2.5\n-3,0.10000000000000001\n'
+
+
+@pytest.mark.parametrize('content, expected', [
+    (b'x,y\n1,2\n3,4\n', [[1, 2], [3, 4]]),
+    (b'px,py\n1,2\n3,4\n', [[1, 2], [3, 4]]),
+    (b'id,Y,X\n0,2,1\n', [[1, 2]]),
+    (b'1,2,9\n3,4,9\n', [[1, 2], [3, 4]]),
+    (b'-1e3,0.5\n', [[-1000, 0.5]]),
+])
+def test_csv_columns(content, expected):
+    np.testing.assert_array_equal(load_vertices(io.BytesIO(content), 'v.csv'), expected)
+
+
+@pytest.mark.parametrize('content', [b'', b'1\n2\n', b'name,v\nfoo,1\n', b'x,y\n1,\n'])
+def test_invalid_csv_raises_value_error(content):
+    with pytest.raises(ValueError):
+        load_vertices(io.BytesIO(content), 'v.csv')